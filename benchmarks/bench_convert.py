@@ -0,0 +1,115 @@
+"""!
+@file bench_convert.py
+
+@brief Benchmark the per-page cost of creating a new Markdown converter for every page against reusing the converters
+of a `ConverterPool`.
+
+Usage:
+
+```bash
+python benchmarks/bench_convert.py [-n PAGES] [-c CONFIG_FILE]
+```
+
+The benchmark is executed for the default `toc` extension and for the extension set listed in the `[Markdown]` table of
+the configuration file (`tests/config/pymind/pymind.toml` by default).
+"""
+
+import optparse
+import timeit
+import tomllib
+from pathlib import Path
+
+import markdown
+
+from pymind.utility.convert import ConverterPool
+
+##======================================================================================================================
+# CONSTANTS
+
+ROOT = Path(__file__).absolute().parent.parent
+EXAMPLE_DIR = ROOT / Path("tests/example")
+CONFIG_FILE = ROOT / Path("tests/config/pymind/pymind.toml")
+
+
+##======================================================================================================================
+#
+def loadPages(count: int) -> list[str]:
+    """!
+    @brief Create a list of `count` pages from the example project.
+
+    @param count Number of pages to create
+
+    @return List of Markdown sources
+    """
+    sources = [f.read_text() for f in sorted(EXAMPLE_DIR.rglob("*.md"))]
+    return [sources[i % len(sources)] for i in range(count)]
+
+
+##======================================================================================================================
+#
+def loadExtensions(config_file: Path) -> list[str]:
+    """!
+    @brief Read the Markdown extensions from a PyMind configuration file.
+
+    @param config_file Path to the configuration file
+
+    @return Sorted list of extensions
+    """
+    with open(config_file, "rb") as f:
+        conf = tomllib.load(f)
+
+    return sorted(set(conf.get("Markdown", {}).get("extensions", []) + ["toc"]))
+
+
+##======================================================================================================================
+#
+def bench(pages: list[str], extensions: list[str], repeat: int = 5) -> tuple:
+    """!
+    @brief Time the conversion of `pages` with and without a converter pool.
+
+    @param pages List of Markdown sources
+    @param extensions List of Markdown extensions
+    @param repeat Number of times each measurement is repeated
+
+    @return Tuple of the best per-page time in seconds (new converter, pooled converter)
+    """
+
+    def fresh():
+        for p in pages:
+            markdown.markdown(p, extensions=extensions)
+
+    def pooled():
+        pool = ConverterPool(extensions)
+        for p in pages:
+            pool.convert(p)
+
+    t_fresh = min(timeit.repeat(fresh, number=1, repeat=repeat)) / len(pages)
+    t_pooled = min(timeit.repeat(pooled, number=1, repeat=repeat)) / len(pages)
+
+    return t_fresh, t_pooled
+
+
+##======================================================================================================================
+#
+def main():
+    parser = optparse.OptionParser()
+    parser.add_option("-n", "--pages", dest="pages", type="int", default=500)
+    parser.add_option("-c", "--config", dest="config", default=str(CONFIG_FILE))
+    options, args = parser.parse_args()
+
+    pages = loadPages(options.pages)
+
+    for extensions in (["toc"], loadExtensions(Path(options.config))):
+        t_fresh, t_pooled = bench(pages, extensions)
+        print(f"{', '.join(extensions)}:")
+        print(f"    markdown.markdown : {t_fresh * 1e6:8.1f} us/page")
+        print(f"    ConverterPool     : {t_pooled * 1e6:8.1f} us/page")
+        print(f"    Saved             : {(t_fresh - t_pooled) * 1e6:8.1f} us/page")
+
+    return
+
+
+########################################################################################################################
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -1,6 +1,6 @@
 import logging
 import optparse
-from logging import CRITICAL, DEBUG, WARNING
+from logging import CRITICAL, DEBUG, INFO, WARNING
 from pathlib import Path
 
 import warnings
@@ -10,6 +10,8 @@ import pymind
 
 logger = logging.getLogger("PYMIND")
 
+COMMANDS = ("watch", "daemon", "status", "stats", "stop", "render")  #!< Positional commands
+
 ########################################################################################################################
 
 
@@ -21,7 +23,7 @@ def parse_options(args=None, values=None):
     """
 
     # Program description and use
-    usage = """%prog [options] [INPUTDIR]"""
+    usage = """%prog [options] [watch | daemon | status | stats | stop | render NOTE]"""
     desc = (
         "A Python implementation of a text-based second brain that just works. "
         "https://Python-Markdown.github.io/"
@@ -69,6 +71,29 @@ def parse_options(args=None, values=None):
         help="Run the script engine",
         metavar="ENGINE",
     )
+    parser.add_option(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type="int",
+        default=None,
+        help="Number of processes used to convert files, 0 uses every CPU.",
+        metavar="JOBS",
+    )
+    parser.add_option(
+        "--isolate",
+        action="store_true",
+        dest="isolate",
+        default=None,
+        help="Run each engine plugin in an isolated subprocess.",
+    )
+    parser.add_option(
+        "--poll",
+        action="store_true",
+        dest="poll",
+        default=False,
+        help="In watch mode, poll the files instead of using inotify.",
+    )
     parser.add_option(
         "-c",
         "--config",
@@ -108,6 +133,10 @@ def parse_options(args=None, values=None):
     # Parse the input arguments
     (options, args) = parser.parse_args(args, values)
 
+    # Reject unknown commands rather than building
+    if args and args[0] not in COMMANDS:
+        parser.error(f"unknown command `{args[0]}`, expected one of {', '.join(COMMANDS)}")
+
     # Save the options
     opts = {
         "input": options.input,
@@ -115,7 +144,13 @@ def parse_options(args=None, values=None):
         "dry_run": options.dry_run,
         "force": options.force,
         "engine": options.engine,
+        "isolate": options.isolate,
+        "jobs": options.jobs,
         "config": options.configfile,
+        "watch": "watch" in args,
+        "poll": options.poll,
+        "command": args[0] if args else None,
+        "note": args[1] if len(args) > 1 else None,
     }
 
     return opts, options.verbose
@@ -139,6 +174,10 @@ def run():
     console_handler = logging.StreamHandler()
     logger.addHandler(console_handler)
 
+    # Report the number of files changed by each build, unless quiet
+    if logging_level <= CRITICAL:
+        logging.getLogger("PYMIND.report").setLevel(min(logging_level, INFO))
+
     if logging_level <= WARNING:
         # Ensure deprecation warnings get displayed
         warnings.filterwarnings("default")
@@ -146,11 +185,88 @@ def run():
         warn_logger = logging.getLogger("py.warnings")
         warn_logger.addHandler(console_handler)
 
+    # Forward the command to the daemon
+    if forward(options):
+        return
+
     # Run `PyMind`
     pymind.pymind(**options)
     return
 
 
+##======================================================================================================================
+#
+def forward(options: dict) -> bool:
+    """!
+    @brief Execute the daemon commands, and forward builds to the daemon when it is running.
+
+    @param options Parsed command line options
+
+    @return True if the command was handled
+    """
+    import json
+    import sys
+
+    from pymind import daemon
+
+    command = options["command"]
+
+    # The daemon requires Unix sockets
+    if command in ("daemon", "status", "stats", "stop", "render") and not daemon.SUPPORTED:
+        logger.critical("The PyMind daemon is not available on this platform (no Unix sockets).")
+        sys.exit(1)
+
+    # A note must be provided to be rendered
+    if command == "render" and not options.get("note"):
+        logger.critical("Usage: pymind [options] render NOTE")
+        sys.exit(2)
+
+    # Start the daemon
+    if command == "daemon":
+        daemon.Daemon().serve()
+        return True
+
+    # Query the daemon
+    if command in ("status", "stats", "stop"):
+        if not daemon.isRunning():
+            logger.critical("The PyMind daemon is not running.")
+            sys.exit(1)
+        result = daemon.request(command)
+        if result is not None:
+            print(json.dumps(result, indent=4))
+        return True
+
+    # Builds are forwarded to the daemon when it is running
+    running = daemon.isRunning()
+    if command == "render" and not running:
+        logger.critical("The PyMind daemon is not running.")
+        sys.exit(1)
+    elif command not in (None, "render") or not running:
+        return False
+
+    # Send absolute paths since the daemon may run from another directory
+    args = {
+        k: v
+        for k, v in options.items()
+        if v is not None and k not in ("watch", "poll", "command", "note")
+    }
+    for k in ("input", "output", "config"):
+        if args.get(k):
+            args[k] = str(Path(args[k]).absolute())
+
+    if command == "render":
+        args["file"] = str(Path(options["note"]).absolute())
+        print(daemon.request("render", **args))
+    else:
+        result = daemon.request("build", **args)
+        logging.getLogger("PYMIND.report").info(
+            f"Built {len(result['built'])} file(s) in {result['duration']:.3f}s, "
+            f"{result['changed']} output file(s) changed."
+        )
+
+    return True
+
+
 ########################################################################################################################
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,26 +1,27 @@
 import logging
 import os
 import platform
-import re
 import sys
 from pathlib import Path
 from typing import Any
 
-import markdown
-
-from pymind.utility.cache import (
-    deleteCacheVar,
-    loadCacheJSON,
-    pickleVar,
-    unPickleVar,
-    writeCacheJSON,
-)
-from pymind.utility.misc import addOrAppend
-from pymind.utility.search import findFiles
-from pymind.utility.tags import getTags
-from pymind.utility.modfile import multipleStrReplace
+from pymind.utility.analyze import analyzeFiles
+from pymind.utility.cache import fileDigest, deleteCacheVar, unPickleVar
+from pymind.utility.context import SharedContext
+from pymind.utility.convert import ConverterPool, convertFiles
+from pymind.utility.dependency import DependencyGraph
+from pymind.utility.fragments import FragmentCache
+from pymind.utility.links import LINK_EXTENSION
+from pymind.utility.modfile import writeChanged
+from pymind.utility.overlay import Overlay
+from pymind.utility.search import findFiles, indexFiles
+from pymind.utility.store import BuildStore
+from pymind.utility.sync import syncTree
+from pymind.utility.tags import collectTags
+from pymind.utility.template import Template
 
 logger = logging.getLogger("PYMIND")
+report = logging.getLogger("PYMIND.report")  #!< Summary of the builds
 
 ########################################################################################################################
 # PYMIND CLASS
@@ -86,17 +87,46 @@ class PyMind:
         """
 
         # Member variables
+        self.analysis: dict = {}  #!< Dictionary of source file to its analysis record
+        self.chrome = (
+            "inline"  #!< How the navigation bar and footer are added to the pages
+        )
+        self.converter: ConverterPool = None  #!< Pool of Markdown converters
         self.css: Path = None  #!< CSS file location
         self.dry_run = False  #!< Do everything except output files
         self.engine = True  #!< Path to engine directory
+        self.exclude: list = (
+            []
+        )  #!< Patterns of the files and directories to skip in the input directory
         self.extensions: list = ["toc"]  #!< Markdown extensions list
         self.files_found = []  #!< List of files found
         self.footer: Path = None  #!< Footer file location
+        self.fragments: FragmentCache = None  #!< Cache of the converted HTML
+        self.orphans: set = (
+            set()
+        )  #!< Keys of the fragments no longer used by their page
         self.force_build = False  #!< Flag to rebuild entire project
+        self.graph: DependencyGraph = None  #!< Dependency graph of the pages
+        self.header_tags = False  #!< Only search the header block of the files for tags
         self.input = None  #!< Input directory
+        self.isolate = False  #!< Execute the engine plugins in isolated subprocesses
+        self.jobs = 1  #!< Number of processes used to convert files (0 selects the number of CPUs)
         self.output = None  #!< Output directory
+        self.pages: dict = {}  #!< Dictionary of output file to converted HTML content
+        self.rewrap: dict = {}  #!< Dictionary of output file to its re-wrapped HTML
         self.project_name: str = ""  #!< Name of the project
         self.refs: dict = {}  #!< Dictionary of file references
+        self.slots: dict = {}  #!< Template slot values provided by the engine
+        self.stat_threads = (
+            0  #!< Number of threads retrieving the stat data of the files
+        )
+        self.stems: dict = {}  #!< Dictionary of file name to the files with that name
+        self.store: BuildStore = None  #!< Persistent build state of the project
+        self.tags: dict = {}  #!< Dictionary of tags found
+        self.overlay: Overlay = None  #!< Copy-on-write view of the input
+        self.sync_mode = "overlay"  #!< How the working directory mirrors the input
+        self.transforms: list = []  #!< Per-page HTML transforms provided by the engine
+        self.changed = 0  #!< Number of output files written or deleted by the last run
         self.build_files = (
             []
         )  #!< List of files that have been updated and need to be built (path to original files)
@@ -127,6 +157,10 @@ class PyMind:
         self.dry_run = kwargs.get("dry_run", self.dry_run)
 
         self.engine = kwargs.get("engine", self.engine)
+        if kwargs.get("isolate") is not None:
+            self.isolate = kwargs.get("isolate")
+        if kwargs.get("jobs") is not None:
+            self.jobs = kwargs.get("jobs")
 
         # Configure the HTML template
         tmplt_path = self.CONFIG_DIR / Path("template.html")
@@ -136,6 +170,10 @@ class PyMind:
                 self.template = f.read()
         else:
             self.template = self.TEMPLATE
+        self.page_template = Template(self.template)  #!< Compiled HTML template
+
+        # Create the Markdown converters, internal links are pointed to the HTML pages during the conversion
+        self.converter = ConverterPool([*self.extensions, LINK_EXTENSION])
 
         # Create input and output Path variables
         self.input = Path(self.input).absolute()
@@ -160,9 +198,9 @@ class PyMind:
         # Delete cached variables
         cache_dir = PyMind.CACHE_PATH / Path("variables")
 
-        # Remove the cached variable
+        # Remove the changes left by a plugin that failed
         try:
-            deleteCacheVar(cache_dir, self.project_name)
+            deleteCacheVar(cache_dir, f"{self.project_name}-delta")
 
         except Exception as e:
             logger.error(e)
@@ -190,6 +228,95 @@ class PyMind:
         self.__createBrain()
         return
 
+    ##==================================================================================================================
+    #
+    def render(self, file: Path) -> str:
+        """!
+        @brief Render a note to HTML without writing it to the output directory.
+
+        The note is rendered with the template slot values and HTML transforms of the last build, the project is
+        therefore built first if it has not been yet.
+
+        @param file Path to the Markdown note
+
+        @return HTML page
+        """
+        # Build the project to retrieve the slot values
+        if self.overlay is None:
+            self.run()
+
+        # Read the note as modified by the engine during the last build
+        file = Path(file).absolute()
+        try:
+            file_content = self.overlay.read(file)
+        except ValueError:
+            file_content = file.read_text()
+
+        # Convert the note
+        content = self.converter.convert(file_content)
+
+        return self.__renderPage(
+            file.stem, content, self.__loadTransforms(), {"title": file.stem}
+        )
+
+    ##==================================================================================================================
+    #
+    def watch(self, polling: bool = False, count: int = None):
+        """!
+        @brief Build the project, then rebuild it whenever a Markdown file of the `input` directory changes.
+
+        The same instance is reused for every build, so the converters and plugins are only loaded once and each
+        rebuild is incremental. A build that fails is reported and the files keep being watched.
+
+        @param polling Compare the stat data of the files instead of using inotify
+        @param count Number of rebuilds before returning, None watches until interrupted
+        """
+        import time
+
+        from pymind.utility.watch import Watcher
+
+        # If an input directory was not provided
+        if self.input == None:
+            logger.critical("AN INPUT DIRECTORY WAS NEVER PROVIDED!!!\nABORTING!!!")
+            return
+
+        watcher = Watcher(self.input, polling=polling, exclude=self.exclude)
+        logger.info(f"Watching {self.input} for changes.")
+
+        try:
+            # Only the first build may be forced
+            self.run()
+            self.force_build = False
+
+            while count is None or count > 0:
+                changes = watcher.wait()
+                logger.debug(f"WATCH: {len(changes)} change(s) detected")
+
+                ## Rebuild the affected pages
+                start = time.perf_counter()
+                try:
+                    self.run()
+                except Exception as e:
+                    logger.error(f"Failed to rebuild the project: {e}")
+                    continue
+                finally:
+                    if count is not None:
+                        count -= 1
+
+                elapsed = time.perf_counter() - start
+                report.info(
+                    f"Rebuilt {len(self.build_files)} file(s) in {elapsed:.3f}s, "
+                    f"{self.changed} output file(s) changed."
+                )
+
+        except KeyboardInterrupt:
+            pass
+
+        finally:
+            watcher.close()
+
+        return
+
     ##==================================================================================================================
     #
     def getCachePaths(self, path: str) -> Path:
@@ -198,9 +325,10 @@ class PyMind:
 
         This method creates the cache file paths, and ensures that the path to the cache directory exists.
 
-        @param path String that specifies the desired path to be returned. [base, database]
+        @param path String that specifies the desired path to be returned. [base, database, fragments, var]
 
-        @return Returns a path to either the cached directory, cached file database, or cached variable
+        @return Returns a path to either the cached directory, build state database, HTML fragments of the project, or
+        cached variable
         """
         # Variables
         dir = None
@@ -212,7 +340,9 @@ class PyMind:
         if path == "base":
             dir = PyMind.CACHE_PATH
         elif path == "database":
-            dir = PyMind.CACHE_PATH / Path(f"{self.project_name}_cache.json")
+            dir = PyMind.CACHE_PATH / Path(f"{self.project_name}.db")
+        elif path == "fragments":
+            dir = PyMind.CACHE_PATH / Path("fragments") / Path(self.project_name)
         elif path == "var":
             dir = PyMind.CACHE_PATH / Path("variables")
         else:
@@ -241,11 +371,26 @@ class PyMind:
                 if conf.get("IO"):
                     self.input = Path(conf.get("IO").get("input")).absolute()
                     self.output = Path(conf.get("IO").get("output")).absolute()
+                    self.sync_mode = conf.get("IO").get("sync", self.sync_mode)
+                    self.exclude = conf.get("IO").get("exclude", self.exclude)
 
                 if conf.get("HTML"):
                     self.css = conf.get("HTML").get("css")
                     self.footer = conf.get("HTML").get("footer")
                     self.css = conf.get("HTML").get("css")
+                    self.chrome = conf.get("HTML").get("chrome", self.chrome)
+
+                if conf.get("Engine"):
+                    self.isolate = conf.get("Engine").get("isolate", self.isolate)
+
+                if conf.get("Performance"):
+                    self.jobs = conf.get("Performance").get("jobs", self.jobs)
+                    self.header_tags = conf.get("Performance").get(
+                        "header_tags", self.header_tags
+                    )
+                    self.stat_threads = conf.get("Performance").get(
+                        "stat_threads", self.stat_threads
+                    )
 
                 if conf.get("Markdown"):
                     self.extensions = sorted(
@@ -263,6 +408,11 @@ class PyMind:
             )
             logger.error(f"Error: {e}")
 
+        # Check the chrome mode
+        if self.chrome != "inline" and self.chrome not in Template.INCLUDES:
+            logger.warning(f"Unknown chrome mode `{self.chrome}`, using `inline`.")
+            self.chrome = "inline"
+
         return
 
     ##==================================================================================================================
@@ -271,6 +421,8 @@ class PyMind:
         """!
         @brief Entry function to start creating the PyMind second brain.
         """
+        self.changed = 0
+
         # Pre-Process
         self.__preProcess()
 
@@ -280,6 +432,14 @@ class PyMind:
         # Post-Process
         self.__postProcess()
 
+        # Persist the build state once the build succeeded
+        self.graph.save(self.store)
+        if not self.dry_run:
+            self.store.commit()
+            self.__collectFragments()
+
+        report.info(f"{self.changed} output file(s) changed.")
+
         return
 
     ##==================================================================================================================
@@ -297,20 +457,17 @@ class PyMind:
             self.working_files,
         ) = self.__getFilesList()  #!< List of files to be built
 
-        # Create a copy of the input directory into a temporary directory
-        self.__copyBuildFiles()
-
-        # Get the list of tags from the files
-        self.tags = getTags(self.files_found)  #!< Dictionary of tags found
-
-        # Convert file references to links
-        self.__refToLink(self.working_files)
+        # Set up the working directory
+        self.__setupWorkingTree()
 
         # Cache variables
         self.__cacheVar()
 
-        # Run pre-processing engine
-        self.__runEngine("PRE")
+        # Run pre-processing engine, unless only the site chrome changed
+        if self.build_files:
+            self.__runEngine("PRE")
+        else:
+            logger.info("Only the site chrome changed, re-wrapping the pages.")
 
         # Reload cached variables
         self.__deCacheVar()
@@ -323,35 +480,63 @@ class PyMind:
         """!
         @brief Run the PyMind post-processor.
         """
+        import filecmp
         import shutil
 
+        # The engine provides the slot values of the re-wrapped pages as well
+        self.var["build_files"] = [
+            *self.working_files,
+            *(self.work_d / Path(f).with_suffix(".md").name for f in self.rewrap),
+        ]
+
         # Run post-processing engine
         self.__runEngine("POST")
 
-        # Copy the CSS file if it exists
+        # Reload cached variables
+        self.__deCacheVar()
+
+        # Write the pages
+        self.__writePages()
+
+        # Copy the CSS file if it exists and changed
         logger.debug(f"Copying configuration file to {self.output}")
-        if self.css:
-            shutil.copyfile(
-                self.config_file.parent / Path(self.css), self.output / Path(self.css)
-            )
+        if self.css and not self.dry_run:
+            css_in = self.config_file.parent / Path(self.css)
+            css_out = self.output / Path(self.css)
+            if not css_out.exists() or not filecmp.cmp(css_in, css_out, shallow=False):
+                shutil.copyfile(css_in, css_out)
+                self.changed += 1
 
         return
 
     ##==================================================================================================================
     #
-    def __copyBuildFiles(self):
+    def __setupWorkingTree(self):
         """!
-        @brief Copy `input` directory into `cache` directory
-        """
-        import shutil
+        @brief Set up the working directory in which PyMind and the plugins modify the sources
+
+        By default the working directory is an overlay of the `input` directory: reads fall through to the `input`
+        directory and only the modified files are stored in the `cache` directory, which is emptied on every run.
 
+        Otherwise the `cache` directory is synchronized with the `input` directory. Only the files that are new or whose
+        size or modification time changed are copied, and files deleted from the `input` directory are removed. Files
+        modified in the working directory during the previous run no longer match the `input` directory and are
+        therefore copied again.
+        """
         cache_dir = self.getCachePaths("base")
         out_d = cache_dir / Path(self.project_name)
 
-        logger.debug(f"Coping {self.input} to {out_d}")
-        shutil.copytree(
-            self.input, out_d, copy_function=shutil.copy2, dirs_exist_ok=True
-        )
+        # Discard the modifications of the previous run
+        if self.sync_mode == "overlay":
+            logger.debug(f"Creating overlay of {self.input} in {out_d}")
+            self.overlay = Overlay(self.input, out_d, self.exclude)
+            self.overlay.clear()
+            return
+
+        # Create a working copy of the input directory
+        logger.debug(f"Synchronizing {self.input} to {out_d}")
+        syncTree(self.input, out_d, self.files_found, self.sync_mode, self.exclude)
+        self.overlay = Overlay(out_d, out_d, self.exclude)
 
         return
 
@@ -363,31 +548,69 @@ class PyMind:
         """
         # Create database of files
         logger.debug("Searching for files.")
-        self.files_found = findFiles(self.input)
+        self.files_found = findFiles(self.input, self.exclude, self.stat_threads)
+
+        # Open the build state store, the changes of a build that failed are discarded
+        db_p = self.getCachePaths("database")
+        if self.store is None or self.store.path != db_p:
+            self.store = BuildStore(db_p)
+        self.store.rollback()
+        self.orphans = set()
+
+        # Open the cache of the converted HTML of the project
+        frag_p = self.getCachePaths("fragments")
+        if self.fragments is None or self.fragments.path != frag_p:
+            self.fragments = FragmentCache(
+                frag_p, self.converter.extensions, self.converter.extension_configs
+            )
+
+        # Load the dependency graph of the previous run
+        self.graph = DependencyGraph.load(self.store)
+
+        # Get data from the previous run
+        prev_data = self.store.items("files")
 
         # If `force_build` not active
         build_files = []
-        if self.force_build or loadCacheJSON(self.getCachePaths("database")) == None:
+        if self.force_build or not prev_data:
             ## Use the found files as the build list
             logger.debug("Executing a force build.")
             build_files = [str(f) for f in self.files_found.keys()]
+            for f, mod in self.files_found.items():
+                mod["digest"] = fileDigest(f)
+            self.graph.force = True
         else:
             ## Otherwise compare the database of files with cached database (if one exists)
             logger.debug("Filtering found files to only the update files.")
-            build_files = self.__getBuildFiles()
+            build_files = self.__getBuildFiles(prev_data)
 
-        # If `index.md` is not in the list, then add it
+        # Remove the pages of the deleted files
+        self.__pruneOutputs(prev_data)
+
+        # Add the pages affected by the modified files
+        build_files = self.__getStaleFiles(build_files)
+
+        # Re-wrap the other pages if the site chrome changed
+        self.rewrap = self.__getRewrapFiles(build_files)
+
+        # If `index.md` is not in the list, then add it, unless only the site chrome changed
         index_p = self.input / Path("index.md")
-        if not index_p in build_files:
+        if (build_files or not self.rewrap) and not index_p in build_files:
             build_files.append(index_p)
+            self.rewrap.pop(self.__outputFile(index_p), None)
+
+        # The plugins record the dependencies of the rebuilt pages again
+        self.graph.forget(Path(f).stem for f in build_files)
 
         # Update the files in the working directory
-        working_files = [
-            Path(str(f).replace(str(self.input), str(self.work_d))) for f in build_files
-        ]
+        working_files = [self.__workingFile(f) for f in build_files]
 
-        # Update the cached database
-        writeCacheJSON(self.getCachePaths("database"), self.files_found)
+        # Update the files that were added, modified, or removed
+        for f, mod in self.files_found.items():
+            if prev_data.get(f) != mod:
+                self.store.put("files", f, mod)
+        for f in prev_data.keys() - self.files_found.keys():
+            self.store.delete("files", f)
 
         return (build_files, working_files)
 
@@ -410,9 +633,19 @@ class PyMind:
 
     ##==================================================================================================================
     #
-    def __getBuildFiles(self) -> list[Path]:
+    def __getBuildFiles(self, prev_data: dict) -> list[Path]:
         """!
         @brief Create a list of files that have been modified or added
+
+        The content of a file is only hashed when its modification time or size differ from the previous run, and the
+        file is only rebuilt when its digest changed. Touching a file, e.g. when checking out a repository, therefore
+        does not trigger a rebuild while restoring older content does.
+
+        A new file with the same digest as a deleted file has been moved or renamed. The page of a file moved to another
+        directory keeps its name and is therefore left as is, while a renamed file is rebuilt under its new name.
+
+        @param prev_data Database of files of the previous run
+
         @return List of files that need to be re-generated.
         """
         logger.debug("Filtering the found files to only the modified files.")
@@ -420,64 +653,458 @@ class PyMind:
         # List of files to process
         p_files = []
 
-        # Get data from the previous run
-        prev_data = loadCacheJSON(self.getCachePaths("database"))
+        # Index the deleted files by digest
+        deleted = {}
+        for f, prev in prev_data.items():
+            if f not in self.files_found and isinstance(prev, dict):
+                deleted.setdefault(prev.get("digest"), []).append(f)
 
         # For each file that has been found in the input directory
         for f, mod in self.files_found.items():
-            ## Check if the file is new
-            if not prev_data.get(f, False):
-                p_files.append(Path(f))
+            prev = prev_data.get(f)
+
+            ## Reuse the digest of the previous run if the stat data is unchanged
+            if (
+                isinstance(prev, dict)
+                and prev.get("digest")
+                and mod["mtime"] == prev["mtime"]
+                and mod["size"] == prev["size"]
+            ):
+                mod["digest"] = prev["digest"]
                 continue
 
-            ## Check if the file has been updated
-            if mod > prev_data.get(f):
+            ## Check if the file has been moved or renamed
+            mod["digest"] = fileDigest(f)
+            if prev is None and deleted.get(mod["digest"]):
+                old = deleted[mod["digest"]].pop(0)
+                logger.debug(f"{old} has been moved to {f}.")
+                self.graph.move(old, f)
+                if Path(old).stem == Path(f).stem:
+                    continue
+
+            ## Check if the content of the file is new or has been updated
+            if not isinstance(prev, dict) or mod["digest"] != prev.get("digest"):
                 p_files.append(Path(f))
                 continue
 
         return p_files
 
+    ##==================================================================================================================
+    #
+    def __pruneOutputs(self, prev_data: dict):
+        """!
+        @brief Delete the pages of the files that no longer exist.
+
+        A page is kept if another file with the same name still exists, e.g. if the file has been moved to another
+        directory. The pages linking to a deleted file and the pages listing its tags are rebuilt through the dependency
+        graph.
+
+        @param prev_data Database of files of the previous run
+        """
+        pages = {Path(f).stem for f in self.files_found}
+        for f in prev_data:
+            ## Skip the files that still exist
+            page = Path(f).stem
+            if f in self.files_found or page in pages:
+                continue
+
+            ## Delete the page
+            logger.debug(f"{f} has been deleted, removing its page.")
+            self.graph.forget([page])
+            output_file = self.store.get(
+                "outputs", page, str(self.output / Path(page).with_suffix(".html"))
+            )
+            self.store.delete("outputs", page)
+            key = self.store.get("fragments", page)
+            if key:
+                self.orphans.add(key)
+                self.store.delete("fragments", page)
+            if not self.dry_run and Path(output_file).exists():
+                Path(output_file).unlink()
+                self.changed += 1
+
+        return
+
+    ##==================================================================================================================
+    #
+    def __getStaleFiles(self, build_files: list) -> list:
+        """!
+        @brief Extend the list of modified files with the files whose page depends on a modification.
+
+        The links and tags of the modified files are updated in the dependency graph, which marks the references and
+        tags that changed. The pages that depended on a changed node during the previous run are then rebuilt as well.
+
+        @param build_files List of the files whose content changed
+
+        @return List of files that need to be re-generated
+        """
+        logger.debug("Searching for the pages affected by the modified files.")
+
+        # Mark the files that were added, removed, or modified
+        modified = {str(f) for f in build_files}
+        self.graph.setFiles(self.files_found, modified)
+
+        # Analyze the modified files, the records of the other files are reused
+        self.analysis = analyzeFiles(
+            self.files_found, self.store, self.header_tags, self.jobs
+        )
+
+        # Update the links
+        self.graph.setLinks({f: r["links"] for f, r in self.analysis.items()})
+        self.refs = self.graph.refs()
+
+        # Update the tags
+        self.tags = collectTags(self.analysis)
+
+        # Index the files by name for the plugins
+        self.stems = indexFiles(self.files_found, self.input)
+        self.graph.setTags(self.tags)
+
+        # Add the stale pages
+        stale = self.graph.stale()
+        build_files = list(build_files)
+        for f in self.files_found:
+            if Path(f).stem in stale and f not in modified:
+                logger.debug(f"Rebuilding {f} due to a dependency change.")
+                build_files.append(Path(f))
+
+        return build_files
+
+    ##==================================================================================================================
+    #
+    def __getRewrapFiles(self, build_files: list) -> dict:
+        """!
+        @brief Load the stored page bodies that are re-wrapped with the site chrome.
+
+        The site chrome is the part of the pages that does not depend on their source: the HTML template, the CSS file,
+        the footer, the `nav` notes, and the post-processing plugins. When its fingerprint changed since the previous
+        run, every page written by a previous run that is not rebuilt, including the pages generated by the engine,
+        reuses its HTML stored in the fragment cache. The HTML is loaded right away, the pages whose fragment is missing
+        are rebuilt instead: their source is added to `build_files`, or for the pages generated by the engine, they are
+        marked as stale and `index.md` is added so that the pre-processing engine creates them again.
+
+        @param build_files List of files that need to be re-generated
+
+        @return Dictionary of output file to the HTML of the page
+        """
+        # Check if the site chrome changed
+        digest = self.__chromeDigest()
+        if self.store.get("chrome", "digest") == digest:
+            return {}
+
+        logger.debug("The site chrome changed, re-wrapping the pages.")
+        self.store.put("chrome", "digest", digest)
+
+        # Pages of the source files, and pages written by the previous runs
+        sources = {Path(f).stem: Path(f) for f in self.files_found}
+        outputs = self.store.items("outputs")
+        pages = outputs.keys() | sources.keys()
+
+        # Re-use the fragments of the pages that are not rebuilt
+        rebuilt = {Path(f).stem for f in build_files}
+        missing = set()
+        rewrap = {}
+        for page in pages - rebuilt:
+            key = self.store.get("fragments", page)
+            html = self.fragments.get(key) if key else None
+            if html is not None and page in outputs:
+                rewrap[self.output / Path(outputs[page]).name] = html
+            elif page in sources:
+                missing.add(sources[page])
+            else:
+                self.graph.forget([page])
+                missing.add(self.input / Path("index.md"))
+
+        for f in sorted(missing - {Path(f) for f in build_files}):
+            logger.debug(f"Rebuilding {f}, its page cannot be re-wrapped.")
+            build_files.append(f)
+
+        return rewrap
+
+    ##==================================================================================================================
+    #
+    def __chromeDigest(self) -> str:
+        """!
+        @brief Compute the fingerprint of the inputs shared by every page.
+
+        @return BLAKE2 hex digest of the site chrome
+        """
+        import hashlib
+        import json
+
+        from pymind.__meta__ import __version__
+
+        # Footer read by the post-processing engine
+        footer_p = PyMind.CACHE_PATH / Path("footer.md")
+        footer = footer_p.read_text() if footer_p.is_file() else None
+
+        # Post-processing plugins
+        plugins = []
+        post_d = Path(PyMind.CORE_ENGINE_PATH).absolute() / Path("post")
+        if self.engine and post_d.is_dir():
+            plugins = [(p.name, fileDigest(p)) for p in self.__listPlugins(post_d)]
+
+        chrome = {
+            "version": __version__,
+            "template": self.template,
+            "css": str(self.css),
+            "chrome": self.chrome,
+            "plugins": plugins,
+        }
+
+        # Shared navigation bar and footer are only written to their own file
+        if self.chrome == "inline":
+            chrome["footer"] = [str(self.footer), footer]
+            chrome["nav"] = sorted(Path(f).stem for f in self.tags.get("nav", []))
+
+        h = hashlib.blake2b(digest_size=16)
+        h.update(json.dumps(chrome, sort_keys=True).encode())
+        return h.hexdigest()
+
     ##==================================================================================================================
     #
     def __convertFiles(self):
         """!
         @brief Convert the list of files to HTML
+
+        The converted HTML is kept in `pages` until the post-processing engine has provided the template slot values.
+        Files whose pre-processed source has already been converted with the same configuration reuse the cached HTML
+        instead of being converted again. The HTML of the pages in `rewrap` was loaded with the list of files.
         """
         logger.debug("Converting the build files.")
 
         # Do not convert the files if `dry_run` is True
+        self.pages = {}
         if self.dry_run:
             return
 
         # Ensure the output directory exists
         self.output.mkdir(parents=True, exist_ok=True)
 
+        # Reuse the HTML of the sources that have already been converted
+        keys = {}
+        files = []
+        for f in self.working_files:
+            bf = self.overlay.path(f)
+            key = self.fragments.key(self.overlay.read(f))
+            self.__useFragment(Path(bf).stem, key)
+
+            content = self.fragments.get(key)
+            if content is None:
+                keys[bf] = key
+                files.append(bf)
+            else:
+                self.pages[self.__outputFile(bf)] = content
+
+        logger.debug(f"Reusing {len(self.pages)} cached page(s).")
+
         # Convert each markdown file
-        for bf in self.working_files:
-            ## Create the output file path
-            output_file = self.output / Path(bf).stem
-            output_file = output_file.with_suffix(".html")
+        failed = []
+        for bf, content, error in convertFiles(files, self.converter, self.jobs):
+            ## If the file could not be converted
+            if error:
+                logger.error(f"Failed to convert {bf}:\n{error}")
+                failed.append(str(bf))
+                continue
+
+            ## Store the content until the page is written
+            self.pages[self.__outputFile(bf)] = content
+            self.fragments.put(keys[bf], content)
 
-            ## Open the file to be converted
-            with open(bf, "r") as f:
-                ### Read the text from the markdown file
-                md = f.read()
+        # Re-wrap the stored HTML of the pages affected only by the site chrome, unless generated again by the engine
+        for output_file, html in self.rewrap.items():
+            self.pages.setdefault(output_file, html)
 
-            ## Convert the markdown to HTML
-            content = markdown.markdown(md, extensions=self.extensions)
+        # Report the files that failed to convert
+        if failed:
+            raise RuntimeError(f"Failed to convert {len(failed)} file(s): {failed}")
 
-            ## Inject content into html file
-            html = self.template.replace("%content%", content)
+        return
 
-            if self.css:
-                html = html.replace("%css%", str(self.css))
+    ##==================================================================================================================
+    #
+    def __outputFile(self, file: Path) -> Path:
+        """!
+        @brief Return the path of the page of a file.
 
-            ## Write the HTML to file
-            with open(output_file, "w") as f:
-                f.write(html)
+        @param file Path to the Markdown file
 
+        @return Path to the HTML file in the `output` directory
+        """
+        return (self.output / Path(file).stem).with_suffix(".html")
+
+    ##==================================================================================================================
+    #
+    def __workingFile(self, file: Path) -> Path:
+        """!
+        @brief Return the path of a file in the working directory.
+
+        @param file Path to the file in the `input` directory
+
+        @return Path to the file in the working directory
+        """
+        return Path(str(file).replace(str(self.input), str(self.work_d)))
+
+    ##==================================================================================================================
+    #
+    def __useFragment(self, page: str, key: str):
+        """!
+        @brief Record the fragment of a page.
+
+        The fragment used by the page during the previous run may be shared with other pages whose source is identical,
+        it is therefore only removed by `__collectFragments` once no page refers to it.
+
+        @param page Name of the page
+        @param key Key of the fragment
+        """
+        prev = self.store.get("fragments", page)
+        if prev != key:
+            if prev:
+                self.orphans.add(prev)
+            self.store.put("fragments", page, key)
         return
 
+    ##==================================================================================================================
+    #
+    def __collectFragments(self):
+        """!
+        @brief Remove the fragments replaced during the run that no page of the project refers to anymore.
+        """
+        referenced = set(self.store.items("fragments").values())
+        for key in self.orphans - referenced:
+            logger.debug(f"Removing the unused fragment {key}.")
+            self.fragments.delete(key)
+
+        self.orphans = set()
+        return
+
+    ##==================================================================================================================
+    #
+    def __writePages(self):
+        """!
+        @brief Render the converted pages with the HTML template and write them to disk.
+
+        Every slot value is known before a page is rendered, so each page is rendered in a single pass and written
+        once. Slot values provided by the engine are either a string used for every page, or a dictionary of page name
+        to string. The HTML transforms registered by the engine (as "module:function") are then applied in memory, in
+        registration order, before the page is written.
+
+        Unless the chrome mode is `inline`, the navigation bar and footer are written once and included by the pages.
+        Pages whose HTML is identical to the existing file are not written, `changed` counts the files written.
+        """
+        logger.debug("Writing the converted files.")
+
+        # Load the HTML transforms
+        transforms = self.__loadTransforms()
+
+        # Write the shared chrome
+        chrome = self.__writeChrome(transforms)
+
+        written = 0
+        for output_file, content in self.pages.items():
+            ## Render the page
+            html = self.__renderPage(output_file.stem, content, transforms, chrome)
+
+            ## Write the HTML to file if it changed
+            written += writeChanged(output_file, html)
+            self.store.put("outputs", output_file.stem, str(output_file))
+
+        logger.debug(f"{written} of {len(self.pages)} page(s) changed.")
+        self.changed += written
+
+        return
+
+    ##==================================================================================================================
+    #
+    def __writeChrome(self, transforms: list) -> dict:
+        """!
+        @brief Write the chrome slots shared by every page to their own file.
+
+        Each chrome slot with a single value for every page is rendered as `_<slot>.html` in the `output` directory,
+        with the HTML transforms applied as for a page named `_<slot>`. The pages include the file with the markup of
+        the chrome mode, i.e. a script fetching it (`js`) or a server-side include directive (`ssi`). The files are
+        removed when the chrome mode is `inline`.
+
+        @param transforms List of transform functions
+
+        @return Dictionary of slot name to the markup including it
+        """
+        if self.dry_run:
+            return {}
+
+        values = {}
+        for slot in Template.CHROME_SLOTS:
+            page = f"_{slot}"
+            output_file = self.output / Path(page).with_suffix(".html")
+
+            ## Remove the file written by a previous run if the slot is no longer shared
+            html = self.slots.get(slot)
+            if self.chrome == "inline" or not isinstance(html, str):
+                if output_file.exists():
+                    output_file.unlink()
+                    self.changed += 1
+                continue
+
+            ## Write the slot value if it changed
+            for t in transforms:
+                html = t(page, html)
+            self.changed += writeChanged(output_file, html)
+
+            ## Include the file in the pages
+            file = f"{page}.html"
+            values[slot] = Template.INCLUDES[self.chrome].replace("%file%", file)
+
+        return values
+
+    ##==================================================================================================================
+    #
+    def __loadTransforms(self) -> list:
+        """!
+        @brief Import the HTML transforms registered by the engine.
+
+        @return List of transform functions in registration order
+        """
+        import importlib
+
+        transforms = []
+        for t in self.transforms:
+            module, func = t.split(":")
+            transforms.append(getattr(importlib.import_module(module), func))
+
+        return transforms
+
+    ##==================================================================================================================
+    #
+    def __renderPage(
+        self, page: str, content: str, transforms: list, values: dict = None
+    ) -> str:
+        """!
+        @brief Render the HTML template of a page and apply the HTML transforms.
+
+        @param page Name of the page
+        @param content HTML content of the page
+        @param transforms List of transform functions
+        @param values Slot values taking precedence over the values provided by the engine
+
+        @return HTML page
+        """
+        # Collect the slot values of the page
+        slots = {}
+        for k, v in self.slots.items():
+            slots[k] = v.get(page) if isinstance(v, dict) else v
+
+        slots["content"] = content
+        if self.css:
+            slots["css"] = str(self.css)
+        slots.update(values or {})
+
+        # Render the page and apply the transforms
+        html = self.page_template.render(slots)
+        for t in transforms:
+            html = t(page, html)
+
+        return html
+
     ##==================================================================================================================
     #
     def __runEngine(self, process_type: str):
@@ -510,7 +1137,10 @@ class PyMind:
 
         # For each file in the engine directories
         logger.debug(f"Beginning {process_type}-engine...")
-        self.__executeSubprocess(path)
+        if self.isolate:
+            self.__executeSubprocess(path)
+        else:
+            self.__executePlugins(path)
 
         return
 
@@ -520,6 +1150,10 @@ class PyMind:
         """!
         @brief Executes a subprocess from PyMind.
 
+        The build context is copied into shared memory once, and each plugin only receives a handle to it. The values a
+        plugin changed are written back to the cache directory, applied to the build context, and published again
+        before the next plugin is executed.
+
         @param Path to scripts directory
 
         @return True if successful execution, False otherwise
@@ -527,15 +1161,19 @@ class PyMind:
         import subprocess
 
         # Convert cache variable directory path to a string
-        cache_p = str(self.getCachePaths("var"))
+        cache_d = self.getCachePaths("var")
+        delta_name = f"{self.project_name}-delta"
+
+        # Share the build context
+        context = SharedContext()
+        context.publish(self.var)
 
         # Execute subprocesses
-        for file in script_d.iterdir():
-            ## Ensure the item is a python script
-            if file.is_file() and file.suffix == ".py":
+        try:
+            for file in self.__listPlugins(script_d):
                 logger.debug(f"Executing {file}")
 
-                ### Execute the process
+                ## Execute the process
                 process = subprocess.run(
                     [
                         sys.executable,
@@ -547,79 +1185,82 @@ class PyMind:
                         "-n",
                         self.project_name,
                         "-v",
-                        cache_p,
+                        str(cache_d),
+                        "-c",
+                        context.handle(),
                     ]
                 )
 
-                ### Check if the process succeeded
+                ## Check if the process succeeded
                 process.check_returncode()
 
+                ## Apply the changes of the plugin
+                delta = unPickleVar(cache_d, delta_name)
+                deleteCacheVar(cache_d, delta_name)
+                logger.debug(f"{file} changed {sorted(delta)}")
+                context.update(self.var, delta)
+
                 logger.debug(f"{file} executed successfully.")
+        finally:
+            context.close()
+
         return
 
     ##==================================================================================================================
     #
-    def __setWorkingDirectory(self):
+    def __executePlugins(self, script_d: Path):
         """!
-        @brief Set the working directory
+        @brief Executes the plugins in `script_d` within the current process.
 
-        The working directory is where the actions performed by PyMind or the engine scripts will take place.
+        Each plugin module is imported once and its `run` entry point is called with the shared build context. Changes
+        the plugins make to the context are immediately visible to PyMind and to the following plugins.
+
+        @param script_d Path to scripts directory
         """
-        self.work_d = Path(PyMind.CACHE_PATH) / Path(self.input).parts[-1]
-        self.work_d.mkdir(parents=True, exist_ok=True)
+        import importlib
+
+        # Execute plugins
+        for file in self.__listPlugins(script_d):
+            logger.debug(f"Executing {file}")
+
+            ## Import the plugin module
+            plugin = importlib.import_module(
+                f"pymind.engine.{script_d.name}.{file.stem}"
+            )
+
+            ## Check if the plugin succeeded
+            if not plugin.run(self.var):
+                raise RuntimeError(f"ENGINE: {file} failed to execute.")
+
+            logger.debug(f"{file} executed successfully.")
         return
 
     ##==================================================================================================================
     #
-    def __refToLink(self, files: list):
+    def __listPlugins(self, script_d: Path) -> list[Path]:
         """!
-        @brief Convert file references to markdown styled links.
-
-        @param files List of files to loop through
-        """
+        @brief List the plugin scripts in `script_d` in the order they are to be executed.
 
-        # For each file to be built
-        for file in files:
-            ## Update the hyperlinks
-            with open(file, "r+") as f:
-                ## Read in the file
-                file_content = f.read()
+        @param script_d Path to scripts directory
 
-                ## Search text for file reference syntax
-                name_regex = "[^]]+"
-                url_regex = "[^)]+"
-                markup_regex = "\\[({0})\\]\\(\\s*({1})\\s*\\)".format(
-                    name_regex, url_regex
-                )
+        @return Sorted list of the python scripts in `script_d`
+        """
+        return sorted(
+            file
+            for file in script_d.iterdir()
+            if file.is_file() and file.suffix == ".py" and not file.stem.startswith("_")
+        )
 
-                ## Search for the links
-                rx_match = re.findall(markup_regex, file_content)
-
-                ## if regex matches were found
-                searchAndReplace = {}
-                if rx_match:
-                    ### For every match
-                    for x in rx_match:
-                        #### Check if the link is not for an external site
-                        if not re.search("http[s]?://", x[1]):
-                            ##### Add the URL to the search and replace list
-                            key = f"[{x[0]}]({x[1]})"
-                            value = f"[{x[0]}]({Path(x[1]).stem}.html)"
-                            searchAndReplace[key] = value
-
-                            ##### Add the files to the refs list
-                            key = str(x[1])
-                            value = str(Path(file).stem)
-                            self.refs = addOrAppend(self.refs, key, value)
-
-                    ### Replace all matches found
-                    file_content = multipleStrReplace(file_content, searchAndReplace)
-
-                ## Update the file
-                f.seek(0)
-                f.write(file_content)
-                f.truncate()
+    ##==================================================================================================================
+    #
+    def __setWorkingDirectory(self):
+        """!
+        @brief Set the working directory
 
+        The working directory is where the actions performed by PyMind or the engine scripts will take place.
+        """
+        self.work_d = Path(PyMind.CACHE_PATH) / Path(self.input).parts[-1]
+        self.work_d.mkdir(parents=True, exist_ok=True)
         return
 
     ##==================================================================================================================
@@ -630,20 +1271,29 @@ class PyMind:
         """
         logger.debug("Caching the environment variables.")
 
+        # Template slot values and transforms are provided by the engine on every run
+        self.slots = {}
+        self.transforms = []
+
         # Variables
         self.var = {
+            "input": self.work_d,
+            "overlay": self.overlay,
+            "output": self.output,
+            "name": self.project_name,
             "files": self.files_found,
             "build_files": self.working_files,
             "tags": self.tags,
             "refs": self.refs,
+            "analysis": self.analysis,
+            "stems": self.stems,
+            "graph": self.graph,
+            "store": self.store,
+            "slots": self.slots,
+            "transforms": self.transforms,
             "cache_p": self.CACHE_PATH,
         }
 
-        cache_dir = self.getCachePaths("var")
-
-        # Cache the variable
-        pickleVar(self.var, cache_dir, self.project_name)
-
         return
 
     ##==================================================================================================================
@@ -654,26 +1304,15 @@ class PyMind:
         """
         logger.debug("Loading cached variables after pre-process.")
 
-        # Retrieve cache directory
-        cache_dir = self.getCachePaths("var")
-
-        # Update working files
-        for k, v in self.var.items():
-            match k:
-                case "files":
-                    self.files_found = unPickleVar(cache_dir, self.project_name)[
-                        "files"
-                    ]
-                case "build_files":
-                    self.working_files = unPickleVar(cache_dir, self.project_name)[
-                        "build_files"
-                    ]
-                case "tags":
-                    self.tags = unPickleVar(cache_dir, self.project_name)["tags"]
-                case "refs":
-                    self.refs = unPickleVar(cache_dir, self.project_name)["refs"]
-                case _:
-                    continue
+        # The plugins update `self.var`, either directly or through the changes sent back by isolated plugins
+        self.files_found = self.var["files"]
+        self.working_files = self.var["build_files"]
+        self.tags = self.var["tags"]
+        self.refs = self.var["refs"]
+        self.graph = self.var["graph"]
+        self.store = self.var["store"]
+        self.slots = self.var["slots"]
+        self.transforms = self.var["transforms"]
         return
 
 
@@ -695,8 +1334,15 @@ def pymind(**kwargs: Any):
     @param kwargs['force'] Regenerate all files
     @param kwargs['dry_run'] Run PyMind, but don't output anything
     @param kwargs['engine'] Execute the plugin engine
+    @param kwargs['isolate'] Execute the engine plugins in isolated subprocesses
+    @param kwargs['jobs'] Number of processes used to convert files
     @param kwargs['config'] Configuration file to read from
+    @param kwargs['watch'] Rebuild the project whenever a file changes
+    @param kwargs['poll'] Watch the files by polling instead of using inotify
     """
     pm = PyMind(**kwargs)
-    pm()
+    if kwargs.get("watch"):
+        pm.watch(polling=kwargs.get("poll", False))
+    else:
+        pm()
     return
@@ -0,0 +1,403 @@
+"""!
+@file daemon.py
+
+@module The `daemon.py` module keeps PyMind running in the background. The daemon holds one `PyMind` instance per
+project, so that the configuration, converters, and file database are only loaded once, and serves requests from a
+Unix socket. Each request and response is a single line of JSON. The daemon is not available on platforms without Unix
+sockets (e.g. Windows).
+
+Requests are of the form `{"command": <command>, "args": {...}}` where the command is one of:
+- `build`: Build a project, `args` are the `PyMind` parameters (`input`, `output`, `config`, `force`, ...). The
+  build options (`force`, `dry_run`, `engine`, `isolate`, `jobs`) only apply to the request they are sent with.
+- `render`: Render the note `args["file"]` of a project to a string
+- `status`: Report the projects held by the daemon
+- `stats`: Report the build statistics of the projects
+- `stop`: Stop the daemon
+
+Responses are of the form `{"ok": true, "result": ...}` or `{"ok": false, "error": <message>}`.
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from pymind.core import PyMind
+
+logger = logging.getLogger("PYMIND")
+
+##======================================================================================================================
+# CONSTANTS
+
+SOCKET_PATH = PyMind.CACHE_PATH / Path("pymind.sock")
+PROJECT_KEYS = ("input", "output", "config")  #!< Parameters identifying a project
+BUILD_OPTIONS = {
+    "force": "force_build",
+    "dry_run": "dry_run",
+    "engine": "engine",
+    "isolate": "isolate",
+    "jobs": "jobs",
+}  #!< Per-request build parameters and the `PyMind` attribute they set
+SUPPORTED = hasattr(socket, "AF_UNIX")  #!< Unix sockets are available
+
+########################################################################################################################
+# PROJECT
+########################################################################################################################
+
+
+class Project:
+    """!
+    @brief `PyMind` instance held by the daemon along with its build statistics.
+
+    The requests of a project are executed one at a time by a dedicated worker thread rather than by the thread serving
+    the connection, so that the Markdown converters, which are kept per thread, are created once per project.
+    """
+
+    ####################################################################################################################
+    # PUBLIC
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __init__(self, **kwargs: Any):
+        """!
+        @brief Creates a new project
+
+        @param kwargs `PyMind` parameters
+        """
+        self.pm = PyMind(**kwargs)  #!< PyMind instance
+        self.worker = ThreadPoolExecutor(1)  #!< Executes the requests of the project
+        self.builds = 0  #!< Number of builds
+        self.pages = 0  #!< Number of pages built
+        self.renders = 0  #!< Number of rendered notes
+        self.last_build = None  #!< Time of the last build
+        self.last_duration = None  #!< Duration in seconds of the last build
+        return
+
+    ##==================================================================================================================
+    #
+    def build(self, options: dict = None) -> dict:
+        """!
+        @brief Build the project.
+
+        @param options Build options of the request (see `BUILD_OPTIONS`), the other options keep the project values
+
+        @return Dictionary of the pages built, the number of output files changed, and the duration of the build
+        """
+        return self.worker.submit(self.__build, options or {}).result()
+
+    ##==================================================================================================================
+    #
+    def render(self, file: str) -> str:
+        """!
+        @brief Render a note of the project to a string.
+
+        @param file Path to the Markdown note
+
+        @return HTML page
+        """
+        return self.worker.submit(self.__render, file).result()
+
+    ##==================================================================================================================
+    #
+    def close(self):
+        """!
+        @brief Stop the worker thread of the project.
+        """
+        self.worker.shutdown(wait=False)
+        return
+
+    ##==================================================================================================================
+    #
+    def status(self) -> dict:
+        """!
+        @brief Describe the project.
+
+        @return Dictionary of the project directories and last build time
+        """
+        return {
+            "name": self.pm.project_name,
+            "input": str(self.pm.input),
+            "output": str(self.pm.output),
+            "config": str(self.pm.config_file) if self.pm.config_file else None,
+            "last_build": self.last_build,
+        }
+
+    ##==================================================================================================================
+    #
+    def stats(self) -> dict:
+        """!
+        @brief Report the build statistics of the project.
+
+        @return Dictionary of statistics
+        """
+        return {
+            "input": str(self.pm.input),
+            "builds": self.builds,
+            "pages": self.pages,
+            "renders": self.renders,
+            "files": len(self.pm.files_found),
+            "tags": len(self.pm.tags),
+            "words": sum(r["words"] for r in self.pm.analysis.values()),
+            "last_duration": self.last_duration,
+        }
+
+    ####################################################################################################################
+    # PRIVATE
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __build(self, options: dict) -> dict:
+        """!
+        @brief Build the project from the worker thread.
+
+        @param options Build options of the request
+
+        @return Dictionary of the pages built, the number of output files changed, and the duration of the build
+        """
+        start = time.perf_counter()
+
+        # Apply the options of the request
+        saved = {attr: getattr(self.pm, attr) for attr in BUILD_OPTIONS.values()}
+        for k, attr in BUILD_OPTIONS.items():
+            if options.get(k) is not None:
+                setattr(self.pm, attr, options[k])
+
+        try:
+            self.pm.run()
+        finally:
+            for attr, value in saved.items():
+                setattr(self.pm, attr, value)
+
+        self.builds += 1
+        self.pages += len(self.pm.build_files)
+        self.last_build = time.time()
+        self.last_duration = time.perf_counter() - start
+
+        return {
+            "built": sorted(Path(f).stem for f in self.pm.build_files),
+            "changed": self.pm.changed,
+            "duration": self.last_duration,
+        }
+
+    ##==================================================================================================================
+    #
+    def __render(self, file: str) -> str:
+        """!
+        @brief Render a note from the worker thread.
+
+        @param file Path to the Markdown note
+
+        @return HTML page
+        """
+        self.renders += 1
+        return self.pm.render(Path(file))
+
+
+########################################################################################################################
+# DAEMON
+########################################################################################################################
+
+
+class Daemon:
+    """!
+    @brief Serve build requests from a Unix socket.
+    """
+
+    ####################################################################################################################
+    # PUBLIC
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __init__(self, socket_path: Path = SOCKET_PATH):
+        """!
+        @brief Creates a new daemon
+
+        @param socket_path Path to the Unix socket
+        """
+        self.socket_path = Path(socket_path)  #!< Path to the Unix socket
+        self.projects: dict = {}  #!< Project key to `Project`
+        self.started = time.time()  #!< Start time of the daemon
+        self.__lock = threading.Lock()  #!< Protects `projects`
+        self.__server = None  #!< Socket server
+        return
+
+    ##==================================================================================================================
+    #
+    def serve(self):
+        """!
+        @brief Serve requests until the `stop` command is received.
+        """
+        if not SUPPORTED:
+            raise RuntimeError(
+                "DAEMON: Unix sockets are not available on this platform"
+            )
+
+        if isRunning(self.socket_path):
+            raise RuntimeError(
+                f"DAEMON: A daemon is already serving {self.socket_path}"
+            )
+
+        # Remove the socket of a daemon that did not exit cleanly
+        self.socket_path.unlink(missing_ok=True)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    response = daemon.handle(line)
+                    self.wfile.write(json.dumps(response).encode() + b"\n")
+
+        self.__server = socketserver.ThreadingUnixStreamServer(
+            str(self.socket_path), Handler
+        )
+        self.__server.daemon_threads = True
+        logger.info(f"DAEMON: Serving {self.socket_path}")
+
+        try:
+            self.__server.serve_forever()
+        finally:
+            self.__server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+            for project in self.projects.values():
+                project.close()
+
+        return
+
+    ##==================================================================================================================
+    #
+    def stop(self):
+        """!
+        @brief Stop serving requests.
+        """
+        if self.__server:
+            threading.Thread(target=self.__server.shutdown).start()
+        return
+
+    ##==================================================================================================================
+    #
+    def handle(self, line: bytes) -> dict:
+        """!
+        @brief Execute a request.
+
+        @param line JSON request
+
+        @return Response
+        """
+        try:
+            request = json.loads(line)
+            command = request.get("command")
+            args = request.get("args", {})
+            logger.debug(f"DAEMON: Received {command}")
+
+            match command:
+                case "build":
+                    result = self.project(args).build(args)
+                case "render":
+                    result = self.project(args).render(args["file"])
+                case "status":
+                    result = {
+                        "pid": os.getpid(),
+                        "uptime": time.time() - self.started,
+                        "projects": [p.status() for p in self.projects.values()],
+                    }
+                case "stats":
+                    result = {"projects": [p.stats() for p in self.projects.values()]}
+                case "stop":
+                    self.stop()
+                    result = None
+                case _:
+                    raise ValueError(f"Unknown command {command}")
+
+            return {"ok": True, "result": result}
+
+        except Exception as e:
+            logger.error(f"DAEMON: {e}")
+            return {"ok": False, "error": str(e)}
+
+    ##==================================================================================================================
+    #
+    def project(self, args: dict) -> Project:
+        """!
+        @brief Retrieve the project of a request, loading it on the first request.
+
+        The project is only loaded from the parameters identifying it, the build options are applied to each request.
+
+        @param args Request arguments
+
+        @return Project
+        """
+        kwargs = {}
+        for k in PROJECT_KEYS:
+            if args.get(k):
+                kwargs[k] = str(Path(args[k]).absolute())
+        key = tuple(kwargs.get(k) for k in PROJECT_KEYS)
+
+        with self.__lock:
+            if key not in self.projects:
+                logger.info(f"DAEMON: Loading project {key}")
+                self.projects[key] = Project(**kwargs)
+
+            return self.projects[key]
+
+
+########################################################################################################################
+# CLIENT
+########################################################################################################################
+
+
+##======================================================================================================================
+#
+def isRunning(socket_path: Path = SOCKET_PATH) -> bool:
+    """!
+    @brief Check if a daemon is serving requests.
+
+    @param socket_path Path to the Unix socket
+
+    @return True if a daemon accepted the connection
+    """
+    if not hasattr(socket, "AF_UNIX") or not Path(socket_path).exists():
+        return False
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.connect(str(socket_path))
+    except OSError:
+        return False
+
+    return True
+
+
+##======================================================================================================================
+#
+def request(command: str, socket_path: Path = SOCKET_PATH, **args: Any) -> Any:
+    """!
+    @brief Send a request to the daemon.
+
+    @param command Name of the command
+    @param socket_path Path to the Unix socket
+    @param args Arguments of the command
+
+    @return Result of the command
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(str(socket_path))
+        s.sendall(json.dumps({"command": command, "args": args}).encode() + b"\n")
+
+        with s.makefile("rb") as f:
+            response = json.loads(f.readline())
+
+    if not response["ok"]:
+        raise RuntimeError(f"DAEMON: {response['error']}")
+
+    return response["result"]
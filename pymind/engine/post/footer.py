@@ -4,13 +4,11 @@
 """
 
 import logging
-import sys
 from datetime import date
 from pathlib import Path
 
 import markdown
-from pymind import utility
-from pymind.utility.modfile import replaceText
+from pymind.utility.plugin import runScript
 
 logger = logging.getLogger("PYMIND")
 
@@ -28,45 +26,36 @@ FOOTER = """<footer>
 #
 def main(**kwargs) -> int:
     """!
-    @brief Executes the tag page creation engine.
-
-    @param in_d Input directory path
+    @brief Executes the footer injection engine as a stand-alone script.
 
     @return True if creation was successful, False if creation failed
     """
-    # Success flag
-    success = True
-
-    # Parse the input arguments
-    options = utility.misc.parseInput(VERSION)
-
-    # If the input or output directory were not provided
-    if (
-        not options["input"]
-        or not options["output"]
-        or not options["name"]
-        or not options["var_p"]
-    ):
-        ## Fail the file creation
-        return False
-    # Retrieve the list of files and tags
-    var = utility.cache.unPickleVar(options["var_p"], options["name"])
+    return runScript(VERSION, run)
 
-    # Ensure the cached variables were loaded
-    bf = var["build_files"]
-    cp = var["cache_p"]
 
-    # Write the string to disk
-    success = __injectFooter(options["input"], options["output"], bf, cp)
+##======================================================================================================================
+#
+def run(ctx: dict) -> bool:
+    """!
+    @brief Executes the footer injection engine.
+
+    @param ctx Shared build context
+
+    @return True if creation was successful, False if creation failed
+    """
+    # Ensure the cached variables were loaded
+    bf = ctx["build_files"]
+    cp = ctx["cache_p"]
 
-    sys.exit(not success)
+    # Provide the footer to the template
+    return __injectFooter(ctx["input"], ctx["output"], bf, cp, ctx["slots"])
 
 
 ##======================================================================================================================
 #
-def __injectFooter(input: str, output: str, bf: list, cp: str) -> bool:
+def __injectFooter(input: str, output: str, bf: list, cp: str, slots: dict) -> bool:
     """!
-    @brief Inject custom footer into each file
+    @brief Provide the custom footer to the `footer` and `date` template slots
 
     @param input Directory with markdown files
     @param input Directory with HTML files
@@ -91,28 +80,13 @@ def __injectFooter(input: str, output: str, bf: list, cp: str) -> bool:
     today = date.today().strftime("%Y-%m-%d")
 
     # Update the footer
-    __replaceFooter(output, footer_html, bf, today)
+    logger.debug("FOOTER: Setting the footer template slots.")
+    slots["footer"] = footer_html.replace("%date%", today)
+    slots["date"] = today
 
     return True
 
 
-##======================================================================================================================
-#
-def __replaceFooter(output: str, text: str, bf: list, today: str = None) -> str:
-    logger.debug("FOOTER: Looping though each converted file.")
-    for file in bf:
-        file = Path(output).absolute() / Path(Path(file).name).with_suffix(".html")
-        logger.debug(f"FOOTER: Updating footer in: {file}.")
-        replaceText(file, "{{footer}}", text)
-
-        ## If the date text was provided
-        if today:
-            ### Update the date
-            replaceText(file, "%date%", today)
-
-    return
-
-
 ########################################################################################################################
 
 if __name__ == "__main__":  # pragma: no cover
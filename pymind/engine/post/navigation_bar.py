@@ -14,11 +14,10 @@ This module generates the file that groups and links to all of the tags found. T
 """
 
 import logging
-import sys
+import re
 from pathlib import Path
 
-from pymind import utility
-from pymind.utility.modfile import replaceText
+from pymind.utility.plugin import runScript
 
 logger = logging.getLogger("PYMIND")
 
@@ -33,52 +32,47 @@ NAV_BAR = """<div id="navigation">
 </div>
 """
 LIST_ITEM = '<li><a class="%class%" href="%item%">%name%</a></li>'
+ACTIVE_CLASS = "active"
+ACTIVE_REGEX = re.compile('class="%nav:([^%"]*)%"')
+TRANSFORM = "pymind.engine.post.navigation_bar:activeItem"
 
 
 ##======================================================================================================================
 #
 def main(**kwargs) -> int:
     """!
-    @brief Executes the tag page creation engine.
-
-    @param in_d Input directory path
+    @brief Executes the navigation bar injection engine as a stand-alone script.
 
     @return True if creation was successful, False if creation failed
     """
-    # Success flag
-    success = True
+    return runScript(VERSION, run)
 
-    # Parse the input arguments
-    options = utility.misc.parseInput(VERSION)
 
-    # If the input or output directory were not provided
-    if (
-        not options["input"]
-        or not options["output"]
-        or not options["name"]
-        or not options["var_p"]
-    ):
-        ## Fail the file creation
-        return False
+##======================================================================================================================
+#
+def run(ctx: dict) -> bool:
+    """!
+    @brief Executes the navigation bar injection engine.
 
-    # Retrieve the list of files and tags
-    var = utility.cache.unPickleVar(options["var_p"], options["name"])
+    @param ctx Shared build context
 
+    @return True if creation was successful, False if creation failed
+    """
     # Ensure the cached variables were loaded
-    tags = var["tags"]
-    files = var["files"]
-
-    # Write the string to disk
-    success = __navigationBar(options["output"], tags, files)
+    tags = ctx["tags"]
+    files = ctx["files"]
 
-    sys.exit(not success)
+    # Provide the navigation bar to the template, pages are re-wrapped by PyMind when the `nav` notes change
+    return __navigationBar(ctx["output"], tags, files, ctx["slots"], ctx["transforms"])
 
 
 ##======================================================================================================================
 #
-def __navigationBar(input: str, tags: dict, files: dict) -> bool:
+def __navigationBar(
+    input: str, tags: dict, files: dict, slots: dict, transforms: list
+) -> bool:
     """!
-    @brief Inject custom HTML navigation bar to each file
+    @brief Provide the custom HTML navigation bar to the `nav` template slot
 
     The navigation bar items are created based on the `nav` tag. When the navigation bar is being applied to a file
     with the `nav` tag, a custom `active` class is also included to highlight the currently selected tab.
@@ -105,7 +99,7 @@ def __navigationBar(input: str, tags: dict, files: dict) -> bool:
         new_item = LIST_ITEM
         new_item = new_item.replace("%item%", str(Path(i.name).with_suffix(".html")))
         new_item = new_item.replace("%name%", str(i.stem))
-        new_item = new_item.replace("%class%", "%" + str(Path(i).name) + "%")
+        new_item = new_item.replace("%class%", f"%nav:{i.stem}%")
         ul.append(new_item)
 
     # Generate navigation bar source
@@ -114,17 +108,32 @@ def __navigationBar(input: str, tags: dict, files: dict) -> bool:
     nav_bar = NAV_BAR.replace("%list%", ul)
 
     # Inject Navigation bar to each file
-    logger.debug(f"NAV: Beginning navigation bar code injection")
-
-    # For every file
-    logger.debug(f"NAV: Updating `nav` tagged files.")
-    for file in Path(input).glob("*.html"):
-        # Inject the navigation bar
-        replaceText(file, "%nav%", nav_bar)
+    logger.debug(f"NAV: Setting the navigation bar template slot")
+    slots["nav"] = nav_bar
+    transforms.append(TRANSFORM)
 
     return True
 
 
+##======================================================================================================================
+#
+def activeItem(page: str, html: str) -> str:
+    """!
+    @brief Mark the navigation bar item of `page` as active.
+
+    The navigation bar is shared by every page, each item carries a `%nav:<name>%` class placeholder which is resolved
+    for the page being written.
+
+    @param page Name of the page being written
+    @param html HTML of the page
+
+    @return HTML with the navigation bar item classes resolved
+    """
+    return ACTIVE_REGEX.sub(
+        lambda m: f'class="{ACTIVE_CLASS if m.group(1) == page else ""}"', html
+    )
+
+
 ########################################################################################################################
 
 if __name__ == "__main__":  # pragma: no cover
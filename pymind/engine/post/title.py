@@ -14,11 +14,9 @@ This module generates the file that groups and links to all of the tags found. T
 """
 
 import logging
-import sys
 from pathlib import Path
 
-from pymind import utility
-from pymind.utility.modfile import replaceText
+from pymind.utility.plugin import runScript
 
 logger = logging.getLogger("PYMIND")
 
@@ -32,50 +30,41 @@ VERSION = "0.0.1"
 #
 def main(**kwargs) -> int:
     """!
-    @brief Executes the tag page creation engine.
-
-    @param in_d Input directory path
+    @brief Executes the title injection engine as a stand-alone script.
 
     @return True if creation was successful, False if creation failed
     """
-    # Success flag
-    success = True
+    return runScript(VERSION, run)
 
-    # Parse the input arguments
-    options = utility.misc.parseInput(VERSION)
 
-    # If the input or output directory were not provided
-    if (
-        not options["input"]
-        or not options["output"]
-        or not options["name"]
-        or not options["var_p"]
-    ):
-        ## Fail the file creation
-        return False
+##======================================================================================================================
+#
+def run(ctx: dict) -> bool:
+    """!
+    @brief Executes the title injection engine.
 
-    # Write the string to disk
-    success = __title(options["output"])
+    @param ctx Shared build context
 
-    sys.exit(not success)
+    @return True if creation was successful, False if creation failed
+    """
+    # Provide the titles to the template
+    return __title(ctx["build_files"], ctx["slots"])
 
 
 ##======================================================================================================================
 #
-def __title(input: str) -> bool:
+def __title(bf: list, slots: dict) -> bool:
     """!
-    @brief Inject custom HTML title bar to each file
+    @brief Provide the title of each file to the `title` template slot
 
-    The title bar items are created based on the `nav` tag. When the title bar is being applied to a file
-    with the `nav` tag, a custom `active` class is also included to highlight the currently selected tab.
+    @param bf List of files being built
+    @param slots Dictionary of template slot values
 
     @return True if successful, false if not
     """
-    # For every file in the directory
+    # For every file being built
     logger.debug(f"TITLE: Updating `title` for each file.")
-    for file in Path(input).glob("*.html"):
-        # Inject the title bar
-        replaceText(file, "%title%", file.stem)
+    slots["title"] = {Path(file).stem: Path(file).stem for file in bf}
 
     return True
 
@@ -6,9 +6,9 @@ This module generates the default landing page for PyMind.
 """
 
 import logging
-import sys
 from pathlib import Path
-from pymind import utility
+from pymind.utility.overlay import Overlay
+from pymind.utility.plugin import runScript
 
 logger = logging.getLogger("PYMIND")
 
@@ -21,43 +21,41 @@ VERSION = "0.0.1"
 
 ##======================================================================================================================
 #
-def main(**kwargs) -> bool:
+def main(**kwargs) -> int:
     """!
-    @brief Executes the tag page creation engine.
-
-    @param in_d Input directory path
+    @brief Executes the landing page creation engine as a stand-alone script.
 
     @return True if creation was successful, False if creation failed
     """
-    # Parse the input arguments
-    options = utility.misc.parseInput(VERSION)
+    return runScript(VERSION, run)
 
-    # If the input or output directory were not provided
-    if not options["input"] or not options["output"]:
-        ## Fail the file creation
-        return False
 
-    # Retrieve the list of files and tags
-    var = utility.cache.unPickleVar(options["var_p"], options["name"])
+##======================================================================================================================
+#
+def run(ctx: dict) -> bool:
+    """!
+    @brief Executes the landing page creation engine.
 
+    @param ctx Shared build context
+
+    @return True if creation was successful, False if creation failed
+    """
     # Write the string to disk
-    success = __createLandingPage(
-        var["build_files"], options["input"], options["output"]
-    )
+    success = __createLandingPage(ctx["build_files"], ctx["overlay"])
 
-    # Update `var` cached variable with newly created file
-    var["build_files"].append(Path(options["input"]) / "index.md")
-    utility.cache.pickleVar(var, Path(options["var_p"]), options["name"])
+    # Update the build files with the newly created file
+    ctx["build_files"].append(Path(ctx["input"]) / "index.md")
 
-    sys.exit(not success)
+    return success
 
 
 ##======================================================================================================================
 #
-def __includeFile(in_f: Path, out_str: str, token: str) -> str:
+def __includeFile(overlay: Overlay, in_f: Path, out_str: str, token: str) -> str:
     """!
     @brief Include text of a file in the output string at the location of the token
 
+    @param overlay Overlay of the input directory
     @param in_f Path to the file
     @param out_str String to be updated
     @param token
@@ -67,9 +65,8 @@ def __includeFile(in_f: Path, out_str: str, token: str) -> str:
     logger.debug(f"LANDING: Including text from {in_f}")
     updates = ""
     try:
-        with open(in_f) as f:
-            updates = f.read()
-            out_str = out_str.replace(token, updates)
+        updates = overlay.read(in_f)
+        out_str = out_str.replace(token, updates)
     except:
         logger.warning(
             f"LANDING: COULD NOT FIND {in_f}.\nREMOVING SECTION FROM LANDING PAGE."
@@ -81,12 +78,12 @@ def __includeFile(in_f: Path, out_str: str, token: str) -> str:
 
 ##======================================================================================================================
 #
-def __createLandingPage(bf: list, input: str, output: str) -> bool:
+def __createLandingPage(bf: list, overlay: Overlay) -> bool:
     """!
     @brief Create the default landing page.
 
     @param bf
-    @param output
+    @param overlay Overlay of the input directory
 
     @return True if successful, false if not
     """
@@ -100,10 +97,10 @@ def __createLandingPage(bf: list, input: str, output: str) -> bool:
 %recent%
     """
     # Include the `index.md` file
-    out_str = __includeFile(Path(input) / Path("index.md"), out_str, "%index%")
+    out_str = __includeFile(overlay, Path("index.md"), out_str, "%index%")
 
     # Include the `uptades.md` file
-    out_str = __includeFile(Path(input) / Path("updates.md"), out_str, "%update%")
+    out_str = __includeFile(overlay, Path("updates.md"), out_str, "%update%")
 
     # Recently added/updated files
     logger.debug("LANDING: Recently updated")
@@ -119,10 +116,9 @@ def __createLandingPage(bf: list, input: str, output: str) -> bool:
 
     out_str = out_str.replace("%recent%", recent)
 
-    out_p = Path(input) / Path("index.md")
+    out_p = Path("index.md")
     logger.debug(f"LOGGER: Writing to disk {out_p}")
-    with open(out_p, "w") as f:
-        f.write(out_str)
+    overlay.write(out_p, out_str)
 
     return True
 
@@ -4,12 +4,11 @@
 """
 
 import logging
-import sys
 from pathlib import Path
 
-from pymind import utility
-from pymind.utility.modfile import appendFile
-from pymind.utility.search import recursiveSearch
+from pymind.utility.dependency import DependencyGraph
+from pymind.utility.overlay import Overlay
+from pymind.utility.plugin import runScript
 
 logger = logging.getLogger("PYMIND")
 
@@ -23,80 +22,87 @@ VERSION = "0.0.1"
 #
 def main(**kwargs) -> int:
     """!
-    @brief Executes the referenced in functionally.
+    @brief Executes the sub-wiki creation engine as a stand-alone script.
 
-    @param kwargs["input"] Input directory path
-    @param kwargs["var_p"] Path to cached variables
-
-    @return True if successful, False if failed
+    @return True if creation was successful, False if creation failed
     """
-    # Success flag
-    success = True
+    return runScript(VERSION, run)
 
-    # Parse the input arguments
-    options = utility.misc.parseInput(VERSION)
 
-    # If the input or output directory were not provided
-    if (
-        not options["input"]
-        or not options["output"]
-        or not options["name"]
-        or not options["var_p"]
-    ):
-        ## Fail the file creation
-        return False
+##======================================================================================================================
+#
+def run(ctx: dict) -> bool:
+    """!
+    @brief Executes the sub-wiki creation engine.
 
-    # Retrieve the list of files and tags
-    var = utility.cache.unPickleVar(options["var_p"], options["name"])
+    @param ctx Shared build context
 
+    @return True if creation was successful, False if creation failed
+    """
     # Write the string to disk
-    success = __search_for_sub_wiki(Path(options["input"]), Path(options["output"]))
-
-    sys.exit(not success)
-
-    return
+    return __search_for_sub_wiki(
+        ctx["overlay"], Path(ctx["output"]), ctx["graph"], ctx["analysis"]
+    )
 
 
 ##======================================================================================================================
 #
-def __search_for_sub_wiki(input: Path, output: Path) -> bool:
+def __search_for_sub_wiki(
+    overlay: Overlay, output: Path, graph: DependencyGraph, analysis: dict
+) -> bool:
     """!
     @brief List all the files in a directory
 
-    @param input
+    @param overlay Overlay of the input directory
     @param output
+    @param graph Dependency graph of the pages
+    @param analysis Dictionary of source file to its analysis record
 
     @return True if successful, False otherwise
     """
+    # Success flag
+    success = True
+
     # Create a list of files and directories with the same name in the
-    # cache directory
+    # input directory
+    sources = overlay.rglob("*")
     sub_wikis = [
         x.with_suffix("")
-        for x in input.rglob("*")
-        if x.is_file() and x.with_suffix("").is_dir()
+        for x in sources
+        if overlay.path(x).is_file() and overlay.path(x.with_suffix("")).is_dir()
     ]
 
     # For each sub wiki found
     for sw in sub_wikis:
         ## Create a list of files for each match
-        sw_files = [x for x in sw.glob("*") if x.is_file()]
+        sw_files = [x for x in sources if x.parent == sw and overlay.path(x).is_file()]
+
+        ## The top level file depends on the list of files of the sub-wiki and on their content
+        graph.depend(
+            sw.stem,
+            f"dir:{overlay.source(sw).resolve()}",
+            *[overlay.source(x).resolve() for x in sw_files],
+        )
 
         ## Populate the top level file with the wiki information
-        success = __populate_file(sw, sorted(sw_files), input, output)
+        success = __populate_file(sw, sorted(sw_files), overlay, output, analysis)
 
     return success
 
 
 ##======================================================================================================================
 #
-def __populate_file(sw: Path, sw_files: list, input: Path, output: Path) -> str:
+def __populate_file(
+    sw: Path, sw_files: list, overlay: Overlay, output: Path, analysis: dict
+) -> str:
     """!
     @brief Populate the top-level file with the content of the sub-wiki.
 
     @param sw Path to the top-level sub-wiki
     @param sw_files Files found in the sub-wiki
-    @param input
+    @param overlay Overlay of the input directory
     @param output
+    @param analysis Dictionary of source file to its analysis record
 
     @return
     """
@@ -108,13 +114,18 @@ def __populate_file(sw: Path, sw_files: list, input: Path, output: Path) -> str:
     success = True
     out_files = [
         Path(x.stem).with_suffix(".html")
-        for x in sorted(sw_files, key=lambda x: x.stat().st_ctime)
+        for x in sorted(sw_files, key=lambda x: overlay.path(x).stat().st_ctime)
     ]
 
-    # Get the first N lines from each file
+    # Get the first N lines from each file, only the files modified in the overlay are read
     context = []
     for sf in sw_files:
-        with open(sf) as f:
+        record = analysis.get(str(overlay.source(sf)))
+        if record and overlay.path(sf) == overlay.source(sf):
+            context.append(record["excerpt"])
+            continue
+
+        with open(overlay.path(sf)) as f:
             context.append(list(islice(f, 5)))
 
     context = [[s.replace("[TOC]", "") for s in sublist] for sublist in context]
@@ -127,7 +138,7 @@ def __populate_file(sw: Path, sw_files: list, input: Path, output: Path) -> str:
 
     try:
         ## Append the content to the top-level sub-wiki file
-        appendFile(sw.with_suffix(".md"), content)
+        overlay.append(sw.with_suffix(".md"), content)
     except Exception as e:
         logger.error(f"Exception thrown! {e}")
         success = False
@@ -4,12 +4,12 @@
 """
 
 import logging
-import sys
 from pathlib import Path
 
-from pymind import utility
-from pymind.utility.modfile import appendFile
-from pymind.utility.search import recursiveSearch
+from pymind.utility.dependency import DependencyGraph
+from pymind.utility.overlay import Overlay
+from pymind.utility.search import lookupFile
+from pymind.utility.plugin import runScript
 
 logger = logging.getLogger("PYMIND")
 
@@ -23,54 +23,56 @@ VERSION = "0.0.1"
 #
 def main(**kwargs) -> int:
     """!
-    @brief Executes the referenced in functionally.
+    @brief Executes the referenced in functionality as a stand-alone script.
 
-    @param kwargs["input"] Input directory path
-    @param kwargs["var_p"] Path to cached variables
-
-    @return True if successful, False if failed
+    @return True if creation was successful, False if creation failed
     """
-    # Success flag
-    success = True
+    return runScript(VERSION, run)
 
-    # Parse the input arguments
-    options = utility.misc.parseInput(VERSION)
 
-    # If the input or output directory were not provided
-    if (
-        not options["input"]
-        or not options["output"]
-        or not options["name"]
-        or not options["var_p"]
-    ):
-        ## Fail the file creation
-        return False
+##======================================================================================================================
+#
+def run(ctx: dict) -> bool:
+    """!
+    @brief Executes the referenced in functionality.
 
-    # Retrieve the list of files and tags
-    var = utility.cache.unPickleVar(options["var_p"], options["name"])
+    @param ctx Shared build context
 
+    @return True if creation was successful, False if creation failed
+    """
     # Write the string to disk
-    success = __referenced_in(options["input"], var["refs"])
-
-    sys.exit(not success)
+    return __referenced_in(
+        ctx["overlay"], ctx["refs"], ctx["stems"], ctx["build_files"], ctx["graph"]
+    )
 
 
 ##======================================================================================================================
 #
-def __referenced_in(input: Path, refs: dict) -> bool:
+def __referenced_in(
+    overlay: Overlay, refs: dict, stems: dict, build_files: list, graph: DependencyGraph
+) -> bool:
     """!
     @brief Create a list of file that is the currently visited file is referenced in
 
     At the end of each normal page (i.e. basically every page that is not generated) a list of files will be included
     which indicates that the currently visited file was referenced in that file.
 
+    @param overlay Overlay of the input directory
     @param refs Dictionary where the key is a file name and the value is a dictionary of files that the
     key is referenced in.
+    @param stems Dictionary of file name to the files with that name, relative to the input directory
+    @param build_files List of files to be built
+    @param graph Dependency graph of the pages
 
     @return True if successful, false if not
     """
-    # For every file in the directory
-    ref_keys = list(refs.keys())
+    # Every page lists the pages referencing it
+    pages = {Path(f).stem for f in build_files}
+    for p in pages:
+        graph.depend(p, f"refs:{p}")
+
+    # For every file that is built
+    ref_keys = [x for x in refs.keys() if Path(x).stem in pages]
     for file in ref_keys:
         logger.debug(f"REF: Appending to {file}.")
 
@@ -80,9 +82,9 @@ def __referenced_in(input: Path, refs: dict) -> bool:
 
         ## Append the list to the file
         refs_section = f"# Related Topics\n{md_refs}"
-        fp = recursiveSearch(Path(input), file, "md")
+        fp = lookupFile(stems, file)
         if fp:
-            appendFile(fp.with_suffix(".md"), refs_section)
+            overlay.append(fp, refs_section)
     return True
 
 
@@ -14,10 +14,10 @@ This module generates the file that groups and links to all of the tags found. T
 """
 
 import logging
-import sys
 from pathlib import Path
 
-import pymind.utility as utility
+from pymind.utility.overlay import Overlay
+from pymind.utility.plugin import runScript
 
 logger = logging.getLogger("PYMIND")
 
@@ -25,6 +25,7 @@ logger = logging.getLogger("PYMIND")
 # CONSTANTS
 
 NEW_LINK = "[%file%](%path%)"
+PAGE = "tags_page"  #!< Name of the tags page
 VERSION = "0.0.1"
 
 
@@ -32,47 +33,45 @@ VERSION = "0.0.1"
 #
 def main(**kwargs) -> int:
     """!
-    @brief Executes the tag page creation engine.
-
-    @param in_d Input directory path
+    @brief Executes the tag page creation engine as a stand-alone script.
 
     @return True if creation was successful, False if creation failed
     """
-    # Success flag
-    success = True
+    return runScript(VERSION, run)
 
-    # Parse the input arguments
-    options = utility.misc.parseInput(VERSION)
 
-    # If the input or output directory were not provided
-    if (
-        not options["input"]
-        or not options["output"]
-        or not options["name"]
-        or not options["var_p"]
-    ):
-        ## Fail the file creation
-        return False
+##======================================================================================================================
+#
+def run(ctx: dict) -> bool:
+    """!
+    @brief Executes the tag page creation engine.
 
-    # Retrieve the list of files and tags
-    var = utility.cache.unPickleVar(options["var_p"], options["name"])
+    @param ctx Shared build context
 
+    @return True if creation was successful, False if creation failed
+    """
     # Ensure the cached variables were loaded
-    tags = var["tags"]
+    tags = ctx["tags"]
+    graph = ctx["graph"]
+
+    # The tags page only changes when the files of a tag change
+    if not graph.isStale(PAGE):
+        logger.debug("TAGS: The tags page is up to date")
+        return True
+    graph.depend(PAGE, "tags")
 
     # Write the string to disk
-    success = __createTagsPage(options["input"], tags)
+    success = __createTagsPage(ctx["overlay"], tags)
 
-    # Update `var` cached variable with newly created file
-    var["build_files"].append(Path(options["input"]) / "tags_page.md")
-    utility.cache.pickleVar(var, Path(options["var_p"]), options["name"])
+    # Update the build files with the newly created file
+    ctx["build_files"].append(Path(ctx["input"]) / f"{PAGE}.md")
 
-    sys.exit(not success)
+    return success
 
 
 ##======================================================================================================================
 #
-def __createTagsPage(input: str, tags: dict) -> bool:
+def __createTagsPage(overlay: Overlay, tags: dict) -> bool:
     """!
     @brief Create an HTML file given a dictionary of tags provided
 
@@ -106,11 +105,10 @@ def __createTagsPage(input: str, tags: dict) -> bool:
         logger.debug("TAGS: Creating a list out of the tags")
         out_str += ", ".join(link_list)
 
-    out_p = Path(input) / Path("tags_page.md")
+    out_p = Path(f"{PAGE}.md")
 
     logger.debug(f"TAGS: Writing to disk {out_p}")
-    with open(out_p, "w") as f:
-        f.write(out_str)
+    overlay.write(out_p, out_str)
 
     return True
 
@@ -0,0 +1,131 @@
+"""!
+@file analyze.py
+
+@module The `analyze.py` module reads each source file once and extracts everything the rest of the pipeline needs to
+know about it: tags, links to other files, title, excerpt, and word count. The records are kept in the build store along
+with the digest of the file, so only the files that changed since the previous run are read.
+"""
+
+import logging
+import re
+
+from pymind.utility.links import findLinks
+from pymind.utility.store import BuildStore
+from pymind.utility.tags import findTags
+
+logger = logging.getLogger("PYMIND")
+
+##======================================================================================================================
+# CONSTANTS
+
+TITLE_REGEX = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$", flags=re.MULTILINE)  #!< Heading
+EXCERPT_LINES = 5  #!< Number of lines of the excerpt
+VERSION = 2  #!< Version of the analysis, the records of another version are discarded
+
+
+##======================================================================================================================
+#
+def analyzeText(text: str, header_only: bool = False) -> dict:
+    """!
+    @brief Analyze the content of a Markdown file.
+
+    @param text Markdown text
+    @param header_only Only search the header block for tags
+
+    @return Dictionary of the tags, links, title (first heading or None), excerpt (first lines), and word count
+    """
+    lines = text.splitlines(keepends=True)
+    title = TITLE_REGEX.search(text)
+
+    return {
+        "tags": findTags(lines, header_only),
+        "links": [url for _, url in findLinks(text)],
+        "title": title.group(1) if title else None,
+        "excerpt": lines[:EXCERPT_LINES],
+        "words": len(text.split()),
+    }
+
+
+##======================================================================================================================
+#
+def analyzeFile(file: str, header_only: bool = False) -> dict:
+    """!
+    @brief Analyze a Markdown file.
+
+    @param file Path to the file
+    @param header_only Only search the header block for tags
+
+    @return Analysis record, see `analyzeText`
+    """
+    with open(file, "rb") as f:
+        return analyzeText(f.read().decode(), header_only)
+
+
+##======================================================================================================================
+#
+def analyzeFiles(
+    files: dict, store: BuildStore, header_only: bool = False, jobs: int = 1
+) -> dict:
+    """!
+    @brief Analyze the files that changed since the previous run and retrieve the records of the others.
+
+    @param files Dictionary of file path to file data, as created by `findFiles` with the digest of each file
+    @param store Build state store of the project
+    @param header_only Only search the header block for tags
+    @param jobs Number of worker processes, 0 selects the number of CPUs
+
+    @return Dictionary of file path to analysis record, in the order of `files`
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    index = store.items("analysis")
+
+    # List the files that are new or whose content changed
+    changed = [
+        f
+        for f, mod in files.items()
+        if f not in index
+        or index[f]["digest"] != mod.get("digest")
+        or index[f]["header_only"] != header_only
+        or index[f].get("version") != VERSION
+    ]
+    logger.debug(f"ANALYZE: Analyzing {len(changed)} of {len(files)} file(s).")
+
+    # Determine the number of workers
+    if not jobs or jobs < 1:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(changed))
+
+    # Analyze the files
+    if jobs <= 1:
+        results = [analyzeFile(f, header_only) for f in changed]
+    else:
+        chunksize = max(1, len(changed) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(
+                executor.map(
+                    analyzeFile,
+                    changed,
+                    [header_only] * len(changed),
+                    chunksize=chunksize,
+                )
+            )
+
+    # Update the records
+    for f, record in zip(changed, results):
+        record.update(
+            {
+                "digest": files[f].get("digest"),
+                "header_only": header_only,
+                "version": VERSION,
+            }
+        )
+        index[f] = record
+        store.put("analysis", f, record)
+
+    # Remove the files that no longer exist
+    for f in index.keys() - files.keys():
+        store.delete("analysis", f)
+
+    return {f: index[f] for f in files}
@@ -5,6 +5,7 @@
 plugin generating scripts.
 """
 
+import hashlib
 import json
 import logging
 import pickle
@@ -64,6 +65,24 @@ def writeCacheJSON(cache_dir: Path, var: Any):
     return
 
 
+##======================================================================================================================
+#
+def fileDigest(file: Path) -> str:
+    """!
+    @brief Compute the digest of the content of a file.
+
+    @param file Path to the file
+
+    @return BLAKE2 hex digest of the file
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(file, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+
+    return h.hexdigest()
+
+
 ########################################################################################################################
 # VARIABLE CACHING
 ########################################################################################################################
@@ -0,0 +1,212 @@
+"""!
+@file context.py
+
+@module The `context.py` module shares the build context with the plugins executed in subprocesses. Each value of the
+context is pickled once into its own shared memory segment, and the plugins only receive the names of the segments.
+A plugin unpickles a value the first time it is accessed and sends back the values it changed.
+"""
+
+import json
+import logging
+import pickle
+import sys
+from collections.abc import MutableMapping
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Iterator
+
+logger = logging.getLogger("PYMIND")
+
+########################################################################################################################
+# SHARED CONTEXT
+########################################################################################################################
+
+
+class SharedContext:
+    """!
+    @brief Read-only snapshot of the build context in shared memory, held by PyMind.
+
+    The snapshot is created once per engine stage. When a plugin changed some values, only the segments of those
+    values are replaced before the next plugin is executed.
+    """
+
+    ####################################################################################################################
+    # PUBLIC
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __init__(self):
+        """!
+        @brief Creates an empty snapshot
+        """
+        self.segments: dict = {}  #!< Key to shared memory segment
+        return
+
+    ##==================================================================================================================
+    #
+    def publish(self, var: dict, keys: list = None):
+        """!
+        @brief Copy values of the build context into shared memory.
+
+        @param var Build context
+        @param keys Keys of the values to publish, None publishes every value
+        """
+        for k in var if keys is None else keys:
+            data = pickle.dumps(var[k], pickle.DEFAULT_PROTOCOL)
+
+            ## Replace the segment of the previous value
+            self.__release(k)
+            shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+            shm.buf[: len(data)] = data
+            self.segments[k] = (shm, len(data))
+
+        logger.debug(f"CONTEXT: Published {len(self.segments)} value(s)")
+        return
+
+    ##==================================================================================================================
+    #
+    def handle(self) -> str:
+        """!
+        @brief Create the handle passed to the plugins.
+
+        @return JSON object of key to segment name and size
+        """
+        return json.dumps({k: [shm.name, n] for k, (shm, n) in self.segments.items()})
+
+    ##==================================================================================================================
+    #
+    def update(self, var: dict, delta: dict):
+        """!
+        @brief Apply the values changed by a plugin to the build context and to the snapshot.
+
+        @param var Build context
+        @param delta Dictionary of the changed values
+        """
+        var.update(delta)
+        self.publish(var, list(delta))
+        return
+
+    ##==================================================================================================================
+    #
+    def close(self):
+        """!
+        @brief Release the shared memory.
+        """
+        for k in list(self.segments):
+            self.__release(k)
+        return
+
+    ####################################################################################################################
+    # PRIVATE
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __release(self, key: str):
+        """!
+        @brief Release the segment of a value.
+
+        @param key Key of the value
+        """
+        if key in self.segments:
+            shm, _ = self.segments.pop(key)
+            shm.close()
+            shm.unlink()
+        return
+
+
+########################################################################################################################
+# CONTEXT VIEW
+########################################################################################################################
+
+
+class ContextView(MutableMapping):
+    """!
+    @brief Build context of a plugin executed in a subprocess.
+
+    Values are unpickled from the shared snapshot the first time they are accessed. Values are usually modified in
+    place (e.g. `ctx["slots"]["nav"] = ...`), a value is therefore considered changed when pickling it no longer gives
+    the bytes it had when it was loaded.
+    """
+
+    ####################################################################################################################
+    # PUBLIC
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __init__(self, handle: str):
+        """!
+        @brief Attaches to a shared snapshot
+
+        @param handle Handle created by `SharedContext.handle`
+        """
+        self.index: dict = json.loads(handle)  #!< Key to segment name and size
+        self.values: dict = {}  #!< Values accessed or set by the plugin
+        self.loaded: dict = {}  #!< Key to pickled value when it was loaded
+        return
+
+    ##==================================================================================================================
+    #
+    def delta(self) -> dict:
+        """!
+        @brief Collect the values that the plugin changed.
+
+        @return Dictionary of the changed values
+        """
+        return {
+            k: v
+            for k, v in self.values.items()
+            if self.loaded.get(k) != pickle.dumps(v, pickle.DEFAULT_PROTOCOL)
+        }
+
+    ##==================================================================================================================
+    #
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.values:
+            if key not in self.index:
+                raise KeyError(key)
+            data = self.__read(*self.index[key])
+            self.values[key] = pickle.loads(data)
+            self.loaded[key] = pickle.dumps(self.values[key], pickle.DEFAULT_PROTOCOL)
+
+        return self.values[key]
+
+    def __setitem__(self, key: str, value: Any):
+        self.values[key] = value
+
+    def __delitem__(self, key: str):
+        raise TypeError("CONTEXT: Values cannot be removed from the build context")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index.keys() | self.values.keys())
+
+    def __len__(self) -> int:
+        return len(self.index.keys() | self.values.keys())
+
+    ####################################################################################################################
+    # PRIVATE
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __read(self, name: str, size: int) -> bytes:
+        """!
+        @brief Copy the content of a segment.
+
+        @param name Name of the segment
+        @param size Size of the pickled value
+
+        @return Pickled value
+        """
+        # The segment belongs to PyMind, prevent the resource tracker from removing it when the plugin exits
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            resource_tracker.unregister(shm._name, "shared_memory")
+
+        try:
+            return bytes(shm.buf[:size])
+        finally:
+            shm.close()
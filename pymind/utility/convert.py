@@ -0,0 +1,176 @@
+"""!
+@file convert.py
+
+@module The `convert.py` module exposes a pool of configured Markdown converters so that the extension setup is only
+paid once per worker instead of once per converted file.
+"""
+
+import logging
+import threading
+
+import markdown
+
+logger = logging.getLogger("PYMIND")
+
+########################################################################################################################
+# CONVERTER POOL
+########################################################################################################################
+
+
+class ConverterPool:
+    """!
+    @brief Pool of `markdown.Markdown` instances, one per worker thread.
+
+    Building a `markdown.Markdown` object loads and registers every configured extension. The pool builds one converter
+    the first time a worker requests it and calls `reset()` on it between documents.
+    """
+
+    ##==================================================================================================================
+    #
+    def __init__(self, extensions: list, extension_configs: dict = None):
+        """!
+        @brief Creates a new converter pool
+
+        @param extensions List of Markdown extensions
+        @param extension_configs Dictionary of configurations for the extensions
+        """
+        self.extensions = list(extensions)  #!< Markdown extensions list
+        self.extension_configs = extension_configs or {}  #!< Extension configurations
+        self.__local = threading.local()  #!< Per-worker converter storage
+
+        return
+
+    ##==================================================================================================================
+    #
+    def get(self) -> markdown.Markdown:
+        """!
+        @brief Retrieve the converter of the calling worker, creating it if necessary.
+
+        @return Configured `markdown.Markdown` instance
+        """
+        md = getattr(self.__local, "md", None)
+
+        # Create the converter the first time the worker requests one
+        if md is None:
+            logger.debug(f"CONVERT: Creating converter with {self.extensions}")
+            md = markdown.Markdown(
+                extensions=self.extensions, extension_configs=self.extension_configs
+            )
+            self.__local.md = md
+
+        return md
+
+    ##==================================================================================================================
+    #
+    def convert(self, text: str) -> str:
+        """!
+        @brief Convert Markdown text to HTML.
+
+        @param text Markdown source
+
+        @return HTML string
+        """
+        return self.get().reset().convert(text)
+
+
+########################################################################################################################
+# PARALLEL CONVERSION
+########################################################################################################################
+
+__worker_pool: ConverterPool = None  #!< Converter pool of a conversion worker process
+
+
+##======================================================================================================================
+#
+def convertFiles(files: list, converter: ConverterPool, jobs: int = 1):
+    """!
+    @brief Convert a list of Markdown files to HTML, optionally spreading the files across a pool of processes.
+
+    The results are yielded in the same order as `files` regardless of the number of jobs. A file that fails to
+    convert does not stop the conversion of the remaining files, instead the error is reported alongside the file.
+
+    @param files List of Markdown file paths
+    @param converter Converter pool used when converting in the current process
+    @param jobs Number of worker processes, 0 selects the number of CPUs
+
+    @return Iterator of tuples (file, html, error) where `error` is None if the conversion succeeded
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Determine the number of workers
+    if not jobs or jobs < 1:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(files))
+
+    # Convert the files in the current process
+    if jobs <= 1:
+        logger.debug("CONVERT: Converting files in the current process.")
+        for f in files:
+            yield (f, *__convertFile(f, converter))
+        return
+
+    # Spread the files across a pool of worker processes
+    logger.debug(f"CONVERT: Converting files with {jobs} worker processes.")
+    chunksize = max(1, len(files) // (jobs * 4))
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=__initWorker,
+        initargs=(converter.extensions, converter.extension_configs),
+    ) as executor:
+        for f, result in zip(
+            files, executor.map(__convertWorkerFile, files, chunksize=chunksize)
+        ):
+            yield (f, *result)
+
+    return
+
+
+##======================================================================================================================
+#
+def __initWorker(extensions: list, extension_configs: dict):
+    """!
+    @brief Create the converter pool of a conversion worker process.
+
+    @param extensions List of Markdown extensions
+    @param extension_configs Dictionary of configurations for the extensions
+    """
+    global __worker_pool
+    __worker_pool = ConverterPool(extensions, extension_configs)
+    return
+
+
+##======================================================================================================================
+#
+def __convertWorkerFile(file) -> tuple:
+    """!
+    @brief Convert a Markdown file within a conversion worker process.
+
+    @param file Path to the Markdown file
+
+    @return Tuple of (html, error)
+    """
+    return __convertFile(file, __worker_pool)
+
+
+##======================================================================================================================
+#
+def __convertFile(file, converter: ConverterPool) -> tuple:
+    """!
+    @brief Convert a Markdown file to HTML.
+
+    @param file Path to the Markdown file
+    @param converter Converter pool
+
+    @return Tuple of (html, error) where one of the two is None
+    """
+    import traceback
+
+    try:
+        with open(file, "r", encoding="utf-8") as f:
+            md = f.read()
+
+        return (converter.convert(md), None)
+
+    except Exception:
+        return (None, traceback.format_exc())
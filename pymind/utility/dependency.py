@@ -0,0 +1,253 @@
+"""!
+@file dependency.py
+
+@module The `dependency.py` module keeps track of what each page depends on across runs so that an incremental build
+rebuilds every page affected by a change, and only those pages.
+"""
+
+import copy
+import logging
+from pathlib import Path
+
+from pymind.utility.misc import addOrAppend
+from pymind.utility.store import BuildStore
+
+logger = logging.getLogger("PYMIND")
+
+########################################################################################################################
+# DEPENDENCY GRAPH
+########################################################################################################################
+
+
+class DependencyGraph:
+    """!
+    @brief Persistent graph of page name to the nodes the page depends on.
+
+    A node is either the path of a source file or one of the following keys:
+    - `dir:<path>`: The list of files in the directory `path`
+    - `refs:<page>`: The list of pages linking to `page`
+    - `tag:<tag>`: The names of the files tagged with `tag`
+    - `tags`: The list of files of every tag
+
+    Before the build PyMind marks the nodes that changed since the previous run, a page is stale if it depends on one of
+    them. The plugins record the dependencies of the pages they build with `depend`.
+    """
+
+    ####################################################################################################################
+    # PUBLIC
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __init__(self, data: dict = None):
+        """!
+        @brief Creates a new dependency graph
+
+        @param data Dictionary created by `toDict`
+        """
+        data = data or {}
+
+        self.deps: dict = data.get("deps", {})  #!< Page name to list of nodes
+        self.links: dict = data.get("links", {})  #!< Source file to linked files
+        self.tags: dict = data.get("tags", {})  #!< Tag to list of files
+        self.changed: set = set()  #!< Nodes that changed since the previous run
+        self.force = False  #!< Consider every page stale
+        self.__saved: dict = copy.deepcopy(
+            self.toDict()
+        )  #!< Persistent part as last loaded or saved
+
+        return
+
+    ##==================================================================================================================
+    #
+    @classmethod
+    def load(cls, store: BuildStore):
+        """!
+        @brief Load the dependency graph of the previous run.
+
+        @param store Build state store of the project
+
+        @return Dependency graph, empty if the project has never been built
+        """
+        return cls({k: store.items(k) for k in ("deps", "links", "tags")})
+
+    ##==================================================================================================================
+    #
+    def save(self, store: BuildStore):
+        """!
+        @brief Write the entries of the graph that changed since it was loaded to the store.
+
+        @param store Build state store of the project
+        """
+        data = self.toDict()
+        for kind, entries in data.items():
+            saved = self.__saved.get(kind, {})
+            for k, v in entries.items():
+                if saved.get(k) != v:
+                    store.put(kind, k, v)
+            for k in saved.keys() - entries.keys():
+                store.delete(kind, k)
+
+        self.__saved = copy.deepcopy(data)
+        return
+
+    ##==================================================================================================================
+    #
+    def toDict(self) -> dict:
+        """!
+        @brief Return the persistent part of the graph.
+
+        @return Dictionary of the dependencies, links, and tags
+        """
+        return {
+            "deps": {k: sorted(v) for k, v in self.deps.items()},
+            "links": self.links,
+            "tags": self.tags,
+        }
+
+    ##==================================================================================================================
+    #
+    def depend(self, page: str, *nodes: str):
+        """!
+        @brief Record that `page` depends on `nodes`.
+
+        @param page Name of the page
+        @param nodes Nodes the page depends on
+        """
+        deps = set(self.deps.get(page, []))
+        deps.update(str(n) for n in nodes)
+        self.deps[page] = sorted(deps)
+        return
+
+    ##==================================================================================================================
+    #
+    def forget(self, pages: list):
+        """!
+        @brief Remove the dependencies of pages that are about to be rebuilt.
+
+        @param pages List of page names
+        """
+        for p in pages:
+            self.deps.pop(p, None)
+        return
+
+    ##==================================================================================================================
+    #
+    def move(self, old: str, new: str):
+        """!
+        @brief Carry the links of a source file that has been moved over to its new path.
+
+        Moving a file changes the listing of both directories. A renamed file is listed under its new name by the pages
+        it links to, their references are therefore marked as changed.
+
+        @param old Previous path of the source file
+        @param new New path of the source file
+        """
+        if old in self.links:
+            self.links[new] = self.links.pop(old)
+            if Path(old).stem != Path(new).stem:
+                for target in self.links[new]:
+                    self.changed.add(f"refs:{Path(target).stem}")
+
+        for f in (old, new):
+            self.changed.add(f)
+            self.changed.add(f"dir:{Path(f).parent}")
+        return
+
+    ##==================================================================================================================
+    #
+    def isStale(self, page: str) -> bool:
+        """!
+        @brief Check if a page needs to be rebuilt.
+
+        @param page Name of the page
+
+        @return True if the page is unknown or depends on a node that changed
+        """
+        if self.force or page not in self.deps:
+            return True
+
+        return not self.changed.isdisjoint(self.deps[page])
+
+    ##==================================================================================================================
+    #
+    def stale(self) -> set:
+        """!
+        @brief List the known pages that depend on a node that changed.
+
+        @return Set of page names
+        """
+        return {p for p in self.deps if self.isStale(p)}
+
+    ##==================================================================================================================
+    #
+    def setFiles(self, files: dict, modified: list):
+        """!
+        @brief Mark the source files that were added, removed, or modified.
+
+        @param files Dictionary of every source file found
+        @param modified List of the source files whose content changed
+        """
+        known = set(self.links)
+        found = set(files)
+
+        # Adding or removing a file changes the listing of its directory
+        for f in (found - known) | (known - found):
+            self.changed.add(f)
+            self.changed.add(f"dir:{Path(f).parent}")
+
+        self.changed.update(str(f) for f in modified)
+        return
+
+    ##==================================================================================================================
+    #
+    def setLinks(self, links: dict):
+        """!
+        @brief Update the links of the source files and mark the pages whose list of references changed.
+
+        @param links Dictionary of every source file to the list of files it links to
+        """
+        old = self.refs()
+        self.links = links
+        new = self.refs()
+
+        for k in set(old) | set(new):
+            if old.get(k) != new.get(k):
+                self.changed.add(f"refs:{Path(k).stem}")
+
+        return
+
+    ##==================================================================================================================
+    #
+    def setTags(self, tags: dict):
+        """!
+        @brief Update the tags and mark the tags whose list of files changed.
+
+        The pages only show the names of the files, moving a tagged file to another directory does not change the tag.
+
+        @param tags Dictionary of tag to list of files
+        """
+        tags = {k: sorted(Path(f).name for f in v) for k, v in tags.items()}
+
+        for k in set(self.tags) | set(tags):
+            if self.tags.get(k) != tags.get(k):
+                self.changed.add(f"tag:{k}")
+                self.changed.add("tags")
+
+        self.tags = tags
+        return
+
+    ##==================================================================================================================
+    #
+    def refs(self) -> dict:
+        """!
+        @brief Create the dictionary of references from the links between the source files.
+
+        @return Dictionary where the key is a link target and the value is the list of files linking to it
+        """
+        refs = {}
+        for f in sorted(self.links):
+            for target in self.links[f]:
+                refs = addOrAppend(refs, target, Path(f).stem)
+
+        return refs
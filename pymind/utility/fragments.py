@@ -0,0 +1,133 @@
+"""!
+@file fragments.py
+
+@module The `fragments.py` module caches the HTML produced by the Markdown conversion. The HTML of a page is stored
+under a digest of its Markdown source and of everything else the conversion depends on, so a page whose source has not
+changed is never converted twice, even if its page is rebuilt because of a forced build or a template change.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+import markdown
+
+from pymind.__meta__ import __version__
+from pymind.utility.modfile import writeFile
+
+logger = logging.getLogger("PYMIND")
+
+########################################################################################################################
+# FRAGMENT CACHE
+########################################################################################################################
+
+
+class FragmentCache:
+    """!
+    @brief Content-addressed cache of converted HTML fragments.
+
+    A fragment is identified by the digest of the Markdown source, the Markdown extensions and their configuration, and
+    the Markdown and PyMind versions. Fragments are stored as files under `path`, in sub-directories named after the
+    first two characters of the digest.
+    """
+
+    ####################################################################################################################
+    # PUBLIC
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __init__(self, path: Path, extensions: list, extension_configs: dict = None):
+        """!
+        @brief Creates a new fragment cache
+
+        @param path Directory of the cached fragments
+        @param extensions List of Markdown extensions
+        @param extension_configs Dictionary of configurations for the extensions
+        """
+        self.path = Path(path)  #!< Directory of the cached fragments
+
+        # Everything the conversion depends on besides the source
+        config = {
+            "extensions": [str(e) for e in extensions],
+            "extension_configs": extension_configs or {},
+            "markdown": markdown.__version__,
+            "pymind": __version__,
+        }
+        config = json.dumps(config, sort_keys=True, default=str)
+        self.salt = config.encode()  #!< Conversion configuration
+
+        return
+
+    ##==================================================================================================================
+    #
+    def key(self, text: str) -> str:
+        """!
+        @brief Compute the key of a Markdown source.
+
+        @param text Markdown source
+
+        @return BLAKE2 hex digest of the source and of the conversion configuration
+        """
+        h = hashlib.blake2b(self.salt, digest_size=16)
+        h.update(b"\0")
+        h.update(text.encode())
+        return h.hexdigest()
+
+    ##==================================================================================================================
+    #
+    def get(self, key: str) -> str:
+        """!
+        @brief Retrieve a fragment.
+
+        @param key Key of the Markdown source
+
+        @return HTML fragment, None if the source has not been converted before
+        """
+        try:
+            with open(self.__file(key), "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    ##==================================================================================================================
+    #
+    def put(self, key: str, html: str):
+        """!
+        @brief Store a fragment.
+
+        @param key Key of the Markdown source
+        @param html HTML fragment
+        """
+        file = self.__file(key)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        writeFile(file, html)
+        return
+
+    ##==================================================================================================================
+    #
+    def delete(self, key: str):
+        """!
+        @brief Remove a fragment.
+
+        @param key Key of the Markdown source
+        """
+        self.__file(key).unlink(missing_ok=True)
+        return
+
+    ####################################################################################################################
+    # PRIVATE
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __file(self, key: str) -> Path:
+        """!
+        @brief Return the path of a fragment.
+
+        @param key Key of the Markdown source
+
+        @return Path to the fragment file
+        """
+        return self.path / key[:2] / f"{key}.html"
@@ -0,0 +1,128 @@
+"""!
+@file links.py
+
+@module This module is used to expose the functionality for finding the links between files, and the Markdown extension
+pointing those links to the HTML pages when the files are converted.
+"""
+
+import logging
+import re
+from pathlib import Path
+from xml.etree.ElementTree import Element
+
+from markdown import Markdown
+from markdown.extensions import Extension
+from markdown.treeprocessors import Treeprocessor
+
+logger = logging.getLogger("PYMIND")
+
+##======================================================================================================================
+# CONSTANTS
+
+NAME_REGEX = "[^]]+"
+URL_REGEX = "[^)]+"
+LINK_REGEX = re.compile("\\[({0})\\]\\(\\s*({1})\\s*\\)".format(NAME_REGEX, URL_REGEX))
+IMAGE_REGEX = re.compile(r"!\[[^]]*\]\([^)]*\)")  #!< Image, e.g. `![name](img.png)`
+FENCE_REGEX = re.compile(
+    r"^ {0,3}((`|~)\2{2,}).*?(?:^ {0,3}\1\2*[ \t]*$|\Z)", flags=re.MULTILINE | re.DOTALL
+)  #!< Fenced code block, up to its closing fence or the end of the text
+CODE_REGEX = re.compile(r"(`+)(?!`).*?(?<!`)\1(?!`)")  #!< Code span within a line
+EXTERNAL_REGEX = re.compile("http[s]?://")
+SCHEME_REGEX = re.compile("^[a-zA-Z][a-zA-Z0-9+.-]*:")  #!< URL scheme, e.g. `mailto:`
+LINK_EXTENSION = "pymind.utility.links:LinkExtension"  #!< Markdown extension
+
+
+##======================================================================================================================
+#
+def isInternal(url: str) -> bool:
+    """!
+    @brief Check if a link points to another file
+
+    Links to external sites, links with a scheme (e.g. `mailto:`), and links to a section of the same page are not
+    internal.
+
+    @param url Target of the link
+
+    @return True if the link points to another file
+    """
+    return not (
+        EXTERNAL_REGEX.search(url) or SCHEME_REGEX.match(url) or url.startswith("#")
+    )
+
+
+##======================================================================================================================
+#
+def findLinks(text: str) -> list[tuple]:
+    """!
+    @brief Find the Markdown links to other files in `text`
+
+    Links that are not internal (see `isInternal`) are ignored, as well as images and the text of fenced code blocks and
+    code spans, which are not turned into links when the file is converted.
+
+    @param text Markdown text to search
+
+    @return List of (name, url) tuples in the order they appear in `text`
+    """
+    for regex in (FENCE_REGEX, CODE_REGEX, IMAGE_REGEX):
+        text = regex.sub(" ", text)
+
+    return [x for x in LINK_REGEX.findall(text) if isInternal(x[1])]
+
+
+##======================================================================================================================
+#
+def pageLink(url: str) -> str:
+    """!
+    @brief Point an internal link to the HTML page of the file
+
+    Every page is written to the `output` directory, only the name of the file is therefore kept.
+
+    @param url Target of the link, e.g. `subdir/file.md#section`
+
+    @return Link to the HTML page, e.g. `file.html#section`
+    """
+    url, sep, fragment = url.strip().partition("#")
+    return f"{Path(url).stem}.html{sep}{fragment}"
+
+
+########################################################################################################################
+# MARKDOWN EXTENSION
+########################################################################################################################
+
+
+class LinkProcessor(Treeprocessor):
+    """!
+    @brief Point the internal links of a converted document to their HTML page.
+    """
+
+    ##==================================================================================================================
+    #
+    def run(self, root: Element):
+        """!
+        @brief Rewrite the `href` of the internal links.
+
+        @param root Root element of the document
+        """
+        for a in root.iter("a"):
+            href = a.get("href")
+            if href and isInternal(href):
+                a.set("href", pageLink(href))
+
+        return
+
+
+class LinkExtension(Extension):
+    """!
+    @brief Markdown extension registering `LinkProcessor`.
+    """
+
+    ##==================================================================================================================
+    #
+    def extendMarkdown(self, md: Markdown):
+        """!
+        @brief Register the tree processor once the inline links have been parsed.
+
+        @param md Markdown instance
+        """
+        md.treeprocessors.register(LinkProcessor(md), "pymind_links", 15)
+        return
@@ -78,6 +78,14 @@ def parseInput(version, args=None) -> dict:
         metavar="VARIABLE_PATH",
         help="Path to the cached variable directory, default is an empty string.",
     )
+    parser.add_option(
+        "-c",
+        "--context",
+        dest="context",
+        default="",
+        metavar="CONTEXT",
+        help="Handle to the shared build context, default is an empty string.",
+    )
 
     # Parse the input arguments
     (options, args) = parser.parse_args(args)
@@ -87,6 +95,7 @@ def parseInput(version, args=None) -> dict:
         "output": options.output,
         "name": options.name,
         "var_p": options.var_p,
+        "context": options.context,
     }
 
     return opts
@@ -4,28 +4,87 @@
 @module This module exposes various utility functions to make modifying files easier.
 """
 
+import functools
+import itertools
 import logging
+import os
+import re
+import shutil
+import tempfile
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
 
 logger = logging.getLogger("PYMIND")
 
+##======================================================================================================================
+# CONSTANTS
+
+# The umask can only be read by setting it, a restrictive one is set in the meantime
+__UMASK = os.umask(0o077)
+os.umask(__UMASK)
+NEW_FILE_MODE = 0o666 & ~__UMASK  #!< Permissions of a new file, as restricted by the umask of the process
+
+
+##======================================================================================================================
+#
+def writeFile(file: Path, text: str):
+    """!@brief Replace the content of a file.
+
+    The text is written to a temporary file which then replaces `file`. The file is therefore never modified in place,
+    which keeps files hard linked to `file` untouched.
+
+    @param file Path to the file
+    @param text New content of the file
+    """
+    logger.debug(f"FILE: Writing {file}")
+    os.replace(writeTemporary(file, [text]), file)
+
+    return
+
+
+##======================================================================================================================
+#
+def writeChanged(file: Path, text: str) -> bool:
+    """!@brief Replace the content of a file unless it already is `text`.
+
+    A file whose content is unchanged keeps its modification time, so that the tools synchronizing the file (e.g. rsync)
+    skip it. The file is only read when its size matches the size of `text`. The text is compared and written as UTF-8
+    without translating the newlines, so the comparison does not depend on the platform or the locale.
+
+    @param file Path to the file
+    @param text New content of the file
+
+    @return True if the file was written
+    """
+    data = text.encode()
+    try:
+        if os.stat(file).st_size == len(data):
+            with open(file, "rb") as f:
+                if f.read() == data:
+                    logger.debug(f"FILE: {file} is unchanged")
+                    return False
+    except FileNotFoundError:
+        pass
+
+    writeFile(file, text)
+    return True
+
 
 ##======================================================================================================================
 #
 def appendFile(file: Path, text: str):
     """!@brief Write text to the end of a file.
 
+    As with `writeFile`, the file is replaced instead of being modified in place. Its content is copied to the
+    temporary file line by line.
+
     @param file Path to the file
     @param text Text to append to the file
     """
     logger.debug(f"FILE: Appending {file} with text")
-    with open(file, "r+") as f:
-        # Retrieve the current content of the file
-        file_content = f.read()
-
-    with open(file, "a") as f:
-        # Append text to the file
-        f.write(text)
+    with open(file, "r", encoding="utf-8", newline="") as f:
+        tmp = writeTemporary(file, itertools.chain(f, [text]))
+    os.replace(tmp, file)
 
     return
 
@@ -39,13 +98,8 @@ def prependFile(file: Path, text: str):
     @param text Text to prepend to the file
     """
     logger.debug(f"FILE: Prepending {file} with text")
-    with open(file, "r+") as f:
-        # Retrieve the current content of the file
-        file_content = f.read()
-
-        # Prepend text to the file
-        f.seek(0)
-        f.write(text + file_content)
+    with EditSession(streaming=True) as session:
+        session.prepend(file, text)
 
 
 ##======================================================================================================================
@@ -58,17 +112,8 @@ def replaceText(file: Path, key: str, text: str):
     @param text Text to replace `key` in the file
     """
     logger.debug(f"FILE: Replacing {key} with {text}")
-    with open(file, "r+") as f:
-        # Retrieve the current content of the file
-        file_content = f.read()
-
-        # Replace the text
-        file_content = file_content.replace(key, text)
-
-        # Write the text back into the file
-        f.seek(0)
-        f.write(file_content)
-        f.truncate()
+    with EditSession() as session:
+        session.replace(file, key, text)
 
     return
 
@@ -78,34 +123,320 @@ def multipleStrReplace(s: str, replacements: dict):
     """!
     @brief Perform multiple text replacements in a string.
 
+    The string is scanned once and every sub-string is replaced at the same time, the new sub-strings are therefore
+    never searched again. When several sub-strings match at the same position, the longest one is replaced. The
+    pattern matching the sub-strings is compiled once per set of sub-strings and cached.
+
     @param s Original text string
     @param replacements Dictionary of current and new sub-strings
 
     @return
     Updated string where the current sub-strings have been replaced with the new sub-strings
     """
-    for old, new in replacements.items():
-        s = s.replace(old, new)
+    keys = tuple(sorted((k for k in replacements if k), key=lambda k: (-len(k), k)))
+    if not keys:
+        return s
 
-    return s
+    return __compileKeys(keys).sub(lambda m: replacements[m.group(0)], s)
+
+##======================================================================================================================
+#
+@functools.lru_cache(maxsize=256)
+def __compileKeys(keys: tuple) -> re.Pattern:
+    """!
+    @brief Compile the alternation of the sub-strings to replace.
+
+    @param keys Sub-strings sorted from the longest to the shortest, so that the longest match is selected
+
+    @return Compiled pattern
+    """
+    return re.compile("|".join(re.escape(k) for k in keys))
 
 ##======================================================================================================================
 #
 def removeLinesMatchingRegex(filename: Path, pattern: str):
-    import re
+    with EditSession() as session:
+        session.removeLines(filename, pattern)
+
+    return
 
-    # Compile the regex pattern
-    compiled_pattern = re.compile(pattern)
+########################################################################################################################
+# EDIT SESSION
+########################################################################################################################
 
-    # Open the file for reading and a new file for writing
-    with open(filename, 'r') as file:
-        lines = file.readlines()
+class EditSession:
+    """!
+    @brief Queue edits to files and apply them with a single read and a single write per file.
 
-    # Filter out lines that match the regex pattern
-    filtered_lines = [line for line in lines if not compiled_pattern.search(line)]
+    The edits of a file are applied in the order they were queued. On `commit` the new content of every file is first
+    written to a temporary file, the temporary files then replace the edited files. An error while applying the edits
+    therefore leaves every file untouched. Files edited in place whose content is unchanged are not written, unless
+    streaming. Used as a context manager, the session is committed when the block exits without an exception and
+    discarded otherwise.
 
-    # Write the filtered lines back to the file
-    with open(filename, 'w') as file:
-        file.writelines(filtered_lines)
+    In streaming mode the files are processed line by line instead of being loaded in memory, in which case the
+    sub-strings to replace cannot span several lines and every edited file is written.
+    """
 
-    return
+    ####################################################################################################################
+    # PUBLIC
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __init__(
+        self,
+        streaming: bool = False,
+        source: Callable[[Path], Path] = None,
+        target: Callable[[Path], Path] = None,
+    ):
+        """!
+        @brief Creates a new edit session
+
+        @param streaming Process the files line by line
+        @param source Function returning the path a file is read from, the file itself by default
+        @param target Function returning the path a file is written to, the file itself by default
+        """
+        self.streaming = streaming  #!< Process the files line by line
+        self.source = source or Path  #!< Path a file is read from
+        self.target = target or Path  #!< Path a file is written to
+        self.edits: dict = {}  #!< Written path to the file and its list of edits
+
+        return
+
+    ##==================================================================================================================
+    #
+    def replace(self, file: Path, old: str, new: str):
+        """!
+        @brief Queue the replacement of a sub-string.
+
+        @param file Path to the file
+        @param old Sub-string to replace
+        @param new Sub-string replacing `old`
+        """
+        self.replaceAll(file, {old: new})
+        return
+
+    ##==================================================================================================================
+    #
+    def replaceAll(self, file: Path, replacements: dict):
+        """!
+        @brief Queue the replacement of several sub-strings in a single pass (see `multipleStrReplace`).
+
+        @param file Path to the file
+        @param replacements Dictionary of current and new sub-strings
+        """
+        self.__queue(file, ("replace", dict(replacements)))
+        return
+
+    ##==================================================================================================================
+    #
+    def append(self, file: Path, text: str):
+        """!
+        @brief Queue text to write at the end of a file.
+
+        @param file Path to the file
+        @param text Text to append
+        """
+        self.__queue(file, ("append", text))
+        return
+
+    ##==================================================================================================================
+    #
+    def prepend(self, file: Path, text: str):
+        """!
+        @brief Queue text to write at the beginning of a file.
+
+        @param file Path to the file
+        @param text Text to prepend
+        """
+        self.__queue(file, ("prepend", text))
+        return
+
+    ##==================================================================================================================
+    #
+    def removeLines(self, file: Path, pattern: str):
+        """!
+        @brief Queue the removal of the lines matching a regular expression.
+
+        @param file Path to the file
+        @param pattern Regular expression
+        """
+        self.__queue(file, ("filter", re.compile(pattern)))
+        return
+
+    ##==================================================================================================================
+    #
+    def commit(self) -> list[Path]:
+        """!
+        @brief Apply the queued edits.
+
+        @return List of the files written
+        """
+        # Write the new content of every file
+        written = []
+        try:
+            for out, (file, edits) in self.edits.items():
+                logger.debug(f"FILE: Applying {len(edits)} edit(s) to {out}")
+                out.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.__apply(self.source(file), out, edits)
+                if tmp is not None:
+                    written.append((tmp, out))
+        except Exception:
+            for tmp, _ in written:
+                tmp.unlink(missing_ok=True)
+            raise
+
+        # Replace the files
+        for tmp, out in written:
+            os.replace(tmp, out)
+
+        self.discard()
+        return [out for _, out in written]
+
+    ##==================================================================================================================
+    #
+    def discard(self):
+        """!
+        @brief Discard the queued edits.
+        """
+        self.edits = {}
+        return
+
+    ##==================================================================================================================
+    #
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+        return False
+
+    ####################################################################################################################
+    # PRIVATE
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __queue(self, file: Path, edit: tuple):
+        """!
+        @brief Queue an edit.
+
+        @param file Path to the file
+        @param edit Tuple of the type of edit and its argument
+        """
+        out = self.target(file)
+        self.edits.setdefault(out, (file, []))[1].append(edit)
+        return
+
+    ##==================================================================================================================
+    #
+    def __apply(self, src: Path, out: Path, edits: list) -> Path:
+        """!
+        @brief Write the edited content of a file to a temporary file.
+
+        @param src Path to the file to read
+        @param out Path to the file to write
+        @param edits List of edits
+
+        @return Path to the temporary file, None if the file is edited in place and its content is unchanged
+        """
+        with open(src, "r", encoding="utf-8") as f:
+            # Load the entire file
+            if not self.streaming:
+                text = original = f.read()
+                for kind, arg in edits:
+                    text = self.__editText(text, kind, arg)
+                if text == original and Path(src) == Path(out):
+                    return None
+                return writeTemporary(out, [text], src)
+
+            # Chain the edits of each line
+            lines = iter(f)
+            for kind, arg in edits:
+                lines = self.__editLines(lines, kind, arg)
+            return writeTemporary(out, lines, src)
+
+    ##==================================================================================================================
+    #
+    def __editText(self, text: str, kind: str, arg) -> str:
+        """!
+        @brief Apply an edit to the content of a file.
+
+        @param text Content of the file
+        @param kind Type of edit
+        @param arg Argument of the edit
+
+        @return Edited content
+        """
+        match kind:
+            case "replace":
+                return multipleStrReplace(text, arg)
+            case "append":
+                return text + arg
+            case "prepend":
+                return arg + text
+            case "filter":
+                return "".join(
+                    l for l in text.splitlines(keepends=True) if not arg.search(l)
+                )
+
+        raise ValueError(f"FILE: Unknown edit {kind}")
+
+    ##==================================================================================================================
+    #
+    def __editLines(self, lines: Iterator[str], kind: str, arg) -> Iterator[str]:
+        """!
+        @brief Apply an edit to the lines of a file as they are read.
+
+        @param lines Iterator of the lines of the file
+        @param kind Type of edit
+        @param arg Argument of the edit
+
+        @return Iterator of the edited lines
+        """
+        match kind:
+            case "replace":
+                return (multipleStrReplace(l, arg) for l in lines)
+            case "append":
+                return itertools.chain(lines, arg.splitlines(keepends=True))
+            case "prepend":
+                return itertools.chain(arg.splitlines(keepends=True), lines)
+            case "filter":
+                return (l for l in lines if not arg.search(l))
+
+        raise ValueError(f"FILE: Unknown edit {kind}")
+
+##======================================================================================================================
+#
+def writeTemporary(file: Path, chunks: Iterable[str], like: Path = None) -> Path:
+    """!
+    @brief Write text to a temporary file next to `file`.
+
+    The temporary file has a unique name and the permissions of `like`, or of a new file if `like` does not exist.
+
+    @param file Path to the file the temporary file is to replace
+    @param chunks Iterable of the text to write
+    @param like Path to the file whose permissions are copied, `file` by default
+
+    @return Path to the temporary file
+    """
+    file = Path(file)
+    fd, tmp = tempfile.mkstemp(dir=file.parent, prefix=f".{file.name}.", suffix=".tmp")
+    tmp = Path(tmp)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.writelines(chunks)
+
+        try:
+            shutil.copymode(like or file, tmp)
+        except FileNotFoundError:
+            os.chmod(tmp, NEW_FILE_MODE)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    return tmp
@@ -0,0 +1,210 @@
+"""!
+@file overlay.py
+
+@module The `overlay.py` module exposes a copy-on-write view of the input directory. Reads fall through to the input
+directory unless the file has been written to, in which case the modified copy stored in the (sparse) overlay directory
+is used. This allows PyMind and the plugins to modify the sources without copying the input directory.
+"""
+
+import logging
+import shutil
+from pathlib import Path
+
+from pymind.utility.modfile import EditSession, writeFile
+from pymind.utility.search import excludePatterns, walkDir
+
+logger = logging.getLogger("PYMIND")
+
+########################################################################################################################
+# OVERLAY
+########################################################################################################################
+
+
+class Overlay:
+    """!
+    @brief Copy-on-write view of a directory.
+
+    Paths passed to the overlay may be relative, or located in either the `lower` or the `upper` directory. The
+    "virtual" path of a file is its location in the `upper` directory, whether or not the file has been modified.
+    Files and directories excluded from the search of `lower` (see `search.findFiles`) are not listed.
+    """
+
+    ####################################################################################################################
+    # PUBLIC
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __init__(self, lower: Path, upper: Path, exclude: list = None):
+        """!
+        @brief Creates a new overlay
+
+        @param lower Read-only directory the reads fall through to
+        @param upper Directory in which modified files are stored. May be the same as `lower`
+        @param exclude List of patterns to exclude
+        """
+        self.lower = Path(lower)  #!< Read-only directory
+        self.upper = Path(upper)  #!< Directory of the modified files
+        self.patterns = excludePatterns(self.lower, exclude)  #!< Patterns to exclude
+        return
+
+    ##==================================================================================================================
+    #
+    def relative(self, p: Path) -> Path:
+        """!
+        @brief Return the path relative to the root of the overlay.
+
+        @param p Path to a file
+
+        @return Relative path
+        """
+        p = Path(p)
+        if not p.is_absolute():
+            return p
+
+        for root in (self.upper, self.lower):
+            if p.is_relative_to(root):
+                return p.relative_to(root)
+
+        raise ValueError(f"OVERLAY: {p} is not located in the overlay")
+
+    ##==================================================================================================================
+    #
+    def virtual(self, p: Path) -> Path:
+        """!
+        @brief Return the virtual path of a file.
+
+        @param p Path to a file
+
+        @return Path of the file in the `upper` directory
+        """
+        return self.upper / self.relative(p)
+
+    ##==================================================================================================================
+    #
+    def source(self, p: Path) -> Path:
+        """!
+        @brief Return the path of the original file.
+
+        @param p Path to a file
+
+        @return Path of the file in the `lower` directory
+        """
+        return self.lower / self.relative(p)
+
+    ##==================================================================================================================
+    #
+    def path(self, p: Path) -> Path:
+        """!
+        @brief Return the path a file should be read from.
+
+        @param p Path to a file
+
+        @return Path to the modified copy of the file if it exists, otherwise the path to the original file
+        """
+        rel = self.relative(p)
+        if (self.upper / rel).exists():
+            return self.upper / rel
+
+        return self.lower / rel
+
+    ##==================================================================================================================
+    #
+    def exists(self, p: Path) -> bool:
+        """!
+        @brief Check if a file exists in the overlay.
+
+        @param p Path to a file
+
+        @return True if the file exists
+        """
+        return self.path(p).exists()
+
+    ##==================================================================================================================
+    #
+    def read(self, p: Path) -> str:
+        """!
+        @brief Read the text of a file.
+
+        @param p Path to a file
+
+        @return Content of the file
+        """
+        with open(self.path(p), "r", encoding="utf-8") as f:
+            return f.read()
+
+    ##==================================================================================================================
+    #
+    def write(self, p: Path, text: str):
+        """!
+        @brief Write the text of a file to the `upper` directory.
+
+        @param p Path to a file
+        @param text Content of the file
+        """
+        out = self.virtual(p)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        writeFile(out, text)
+        return
+
+    ##==================================================================================================================
+    #
+    def append(self, p: Path, text: str):
+        """!
+        @brief Append text to a file.
+
+        @param p Path to a file
+        @param text Text to append to the file
+        """
+        with self.edit(streaming=True) as session:
+            session.append(p, text)
+        return
+
+    ##==================================================================================================================
+    #
+    def edit(self, streaming: bool = False) -> EditSession:
+        """!
+        @brief Create a session to edit several files at once (see `modfile.EditSession`).
+
+        The files are read through the overlay and written to the `upper` directory when the session is committed.
+
+        @param streaming Process the files line by line
+
+        @return Edit session
+        """
+        return EditSession(streaming, source=self.path, target=self.virtual)
+
+    ##==================================================================================================================
+    #
+    def rglob(self, pattern: str) -> list[Path]:
+        """!
+        @brief Recursively search the overlay for files matching `pattern`.
+
+        @param pattern Glob pattern
+
+        @return Sorted list of the virtual paths of the files found
+        """
+        found = set()
+        for root in {self.lower, self.upper}:
+            for d, dirs, files in walkDir(root, self.patterns):
+                for name in dirs + files:
+                    p = Path(d) / name
+                    if p.relative_to(root).match(pattern):
+                        found.add(self.virtual(p))
+
+        return sorted(found)
+
+    ##==================================================================================================================
+    #
+    def clear(self):
+        """!
+        @brief Discard the modified files.
+        """
+        # The modified files are the working copy when `upper` and `lower` are the same directory
+        if self.upper == self.lower:
+            return
+
+        logger.debug(f"OVERLAY: Clearing {self.upper}")
+        shutil.rmtree(self.upper, ignore_errors=True)
+        self.upper.mkdir(parents=True, exist_ok=True)
+        return
@@ -0,0 +1,59 @@
+"""!
+@file plugin.py
+
+@module The `plugin.py` module contains the glue that allows an engine plugin to be executed either in-process by the
+PyMind engine or as a stand-alone script in a subprocess.
+
+Every plugin exposes a `run(ctx)` entry point which receives the shared build context. When PyMind executes the
+plugins in-process the context is the dictionary held by the `PyMind` instance, otherwise `runScript` attaches to the
+snapshot of the context shared by PyMind (see `context.py`).
+"""
+
+import logging
+import sys
+from pathlib import Path
+from typing import Callable
+
+from pymind.utility.cache import pickleVar
+from pymind.utility.context import ContextView
+from pymind.utility.misc import parseInput
+
+logger = logging.getLogger("PYMIND")
+
+
+##======================================================================================================================
+#
+def runScript(version: str, run: Callable[[dict], bool]):
+    """!
+    @brief Execute a plugin `run` function as a stand-alone script.
+
+    The command line arguments are parsed, `run` is executed with a view of the shared build context, and the values
+    it changed are cached so that PyMind can apply them.
+
+    @param version Version of the plugin
+    @param run Plugin entry point that accepts the build context
+    """
+    # Parse the input arguments
+    options = parseInput(version)
+
+    # If the input or output directory were not provided
+    if (
+        not options["input"]
+        or not options["output"]
+        or not options["name"]
+        or not options["var_p"]
+        or not options["context"]
+    ):
+        ## Fail the plugin execution
+        return False
+
+    # Attach to the build context, values are only loaded when the plugin accesses them
+    ctx = ContextView(options["context"])
+
+    # Execute the plugin
+    success = run(ctx)
+
+    # Cache the changed values
+    pickleVar(ctx.delta(), Path(options["var_p"]), f"{options['name']}-delta")
+
+    sys.exit(not success)
@@ -4,34 +4,191 @@
 @module The search module exposes the search functions from PyMind for plug-ins to reuse.
 """
 
+import fnmatch
 import logging
+import os
 from pathlib import Path
 
 logger = logging.getLogger("PYMIND")
 
+##======================================================================================================================
+# CONSTANTS
+
+IGNORE_FILE = ".pymindignore"  #!< File listing the patterns to exclude, relative to the input directory
+DEFAULT_EXCLUDE = [".git/", ".hg/", ".svn/", "node_modules/"]  #!< Patterns always excluded
+
 ##======================================================================================================================
 #
-def findFiles(dir: Path) -> dict[Path]:
+def findFiles(dir: Path, exclude: list = None, threads: int = 0) -> dict[str, dict]:
     """!
     @brief Create a database of all the files in the `input` directory
 
+    The directory is walked with `os.scandir`, without following symbolic links to directories. The stat data of a
+    symbolic link to a file is the stat data of its target, so editing the target is detected. Files and directories
+    matching a pattern of `exclude`, of the `.pymindignore` file of `dir`, or of `DEFAULT_EXCLUDE` are skipped. A
+    pattern is a glob matched against the name of each file and directory, or against the path relative to `dir` if it
+    contains a `/`, in which case `*` does not match a `/` and `**` matches any number of directories. A pattern ending
+    with `/` only matches directories. Empty lines and lines starting with `#` of the
+    `.pymindignore` file are ignored.
+
     @param dir Base path to start searching for markdown files.
+    @param exclude List of patterns to exclude
+    @param threads Number of threads retrieving the stat data of the files (e.g. on network file systems), 0 retrieves
+    them while walking the directory
 
-    @return Dictionary of files and their modified times from within the `input` directory
+    @return Dictionary of files and their stat data (`mtime` and `size`) from within the `input` directory
     """
-    # Create a list `Path`s for each `*.md` file in the `input` directory
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Collect the patterns to exclude
+    root = Path(dir).resolve()
+    patterns = excludePatterns(root, exclude)
+
+    # Walk the `input` directory
     logger.debug(f"SEARCH: Searching for files in {dir}")
-    files = [f.resolve() for f in Path(dir).rglob("*.md")]
+    files = []
+    stats = []
+    stack = [(str(root), "")]
+    while stack:
+        path, rel = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for e in entries:
+                    e_rel = f"{rel}{e.name}"
+                    is_dir = e.is_dir(follow_symlinks=False)
+
+                    ## Skip the excluded files and directories
+                    if __isExcluded(e.name, e_rel, is_dir, patterns):
+                        continue
+
+                    if is_dir:
+                        stack.append((e.path, f"{e_rel}/"))
+                    elif e.name.endswith(".md"):
+                        files.append(e.path)
+                        if threads < 1:
+                            stats.append(__statFile(e))
+        except OSError as err:
+            logger.warning(f"SEARCH: Could not list {path}: {err}")
+
+    # Retrieve the stat data in parallel
+    if threads >= 1:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            stats = list(executor.map(__statFile, files))
 
     # Create file database
-    logger.debug("SEARCH: Creating database of file and modification date.")
+    logger.debug("SEARCH: Creating database of file, modification date, and size.")
     file_database = {}
-    for f in files:
-        mod_time = f.lstat().st_mtime
-        file_database[str(f)] = mod_time
+    for f, st in sorted(zip(files, stats)):
+        if st is not None:
+            file_database[f] = {"mtime": st.st_mtime, "size": st.st_size}
 
     return file_database
 
+##======================================================================================================================
+#
+def excludePatterns(dir: Path, exclude: list = None) -> list:
+    """!
+    @brief Collect the patterns excluding files and directories from a search of `dir` (see `findFiles`)
+
+    @param dir Searched directory
+    @param exclude List of patterns to exclude
+
+    @return List of patterns of `DEFAULT_EXCLUDE`, `exclude`, and the `.pymindignore` file of `dir`
+    """
+    return DEFAULT_EXCLUDE + list(exclude or []) + __readIgnoreFile(Path(dir) / IGNORE_FILE)
+
+##======================================================================================================================
+#
+def isExcluded(rel: str, is_dir: bool, patterns: list) -> bool:
+    """!
+    @brief Check if a file or directory is excluded from a search (see `findFiles`)
+
+    @param rel Path relative to the searched directory, using `/` as separator
+    @param is_dir True if the entry is a directory
+    @param patterns List of patterns returned by `excludePatterns`
+
+    @return True if the entry is excluded
+    """
+    return __isExcluded(rel.rsplit("/", 1)[-1], rel, is_dir, patterns)
+
+##======================================================================================================================
+#
+def walkDir(dir: Path, patterns: list, root: Path = None):
+    """!
+    @brief Walk a directory like `os.walk`, skipping the excluded files and directories
+
+    @param dir Directory to walk
+    @param patterns List of patterns returned by `excludePatterns`
+    @param root Directory the patterns are relative to, `dir` by default
+
+    @return Generator of (directory, sub-directories, files) tuples
+    """
+    root = Path(root or dir)
+    for d, dirs, files in os.walk(dir):
+        rel = Path(d).relative_to(root).as_posix()
+        rel = "" if rel == "." else f"{rel}/"
+        dirs[:] = [x for x in dirs if not isExcluded(f"{rel}{x}", True, patterns)]
+        files[:] = [x for x in files if not isExcluded(f"{rel}{x}", False, patterns)]
+        yield d, dirs, files
+
+##======================================================================================================================
+#
+def indexFiles(files: dict, dir: Path) -> dict[str, list[Path]]:
+    """!
+    @brief Create an index of file name to the files with that name
+
+    @param files Dictionary of files as created by `findFiles`
+    @param dir Directory the indexed paths are relative to
+
+    @return Dictionary of file name (without the `.md` extension) to the sorted list of paths relative to `dir`
+    """
+    logger.debug("SEARCH: Indexing the files by name.")
+    dir = Path(dir).resolve()
+    index = {}
+    for f in files:
+        index.setdefault(Path(f).stem, []).append(Path(f).relative_to(dir))
+
+    for paths in index.values():
+        paths.sort()
+
+    return index
+
+##======================================================================================================================
+#
+def lookupFile(index: dict, name: str) -> Path:
+    """!
+    @brief Find a file in an index created by `indexFiles`
+
+    A name may include directories (e.g. `subdir/file`), which selects among the files with the same name. If several
+    files still match, the ambiguity is reported and the first path in sorted order is returned.
+
+    @param index Index of file name to paths
+    @param name Name of the file to search for, with or without the `.md` extension
+
+    @return Path relative to the indexed directory, None if no file matches
+    """
+    # Remove the extension
+    name = Path(name)
+    if name.suffix == ".md":
+        name = name.with_suffix("")
+
+    # Select the files in the directories of `name`
+    matches = index.get(name.name, [])
+    if len(matches) > 1 and len(name.parts) > 1:
+        matches = [
+            p for p in matches if p.with_suffix("").parts[-len(name.parts):] == name.parts
+        ]
+
+    if not matches:
+        return None
+
+    if len(matches) > 1:
+        logger.warning(
+            f"SEARCH: {name} is ambiguous, matching {[str(p) for p in matches]}. Using {matches[0]}."
+        )
+
+    return matches[0]
+
 ##======================================================================================================================
 #
 def recursiveSearch(dir: Path, fn: str, extension: str = None) -> Path:
@@ -65,3 +222,91 @@ def recursiveSearch(dir: Path, fn: str, extension: str = None) -> Path:
             return path
 
     return None
+
+##======================================================================================================================
+#
+def __statFile(file) -> os.stat_result:
+    """!
+    @brief Retrieve the stat data of a file, following symbolic links
+
+    @param file Path to the file, or `os.DirEntry` of the file
+
+    @return Stat data of the file, None if it cannot be read (e.g. a broken symbolic link)
+    """
+    try:
+        return file.stat() if isinstance(file, os.DirEntry) else os.stat(file)
+    except OSError as err:
+        logger.warning(f"SEARCH: Could not read {file}: {err}")
+        return None
+
+##======================================================================================================================
+#
+def __readIgnoreFile(path: Path) -> list:
+    """!
+    @brief Read the patterns of an ignore file
+
+    @param path Path to the ignore file
+
+    @return List of patterns, empty if the file does not exist
+    """
+    try:
+        with open(path, "r") as f:
+            lines = [l.strip() for l in f]
+    except FileNotFoundError:
+        return []
+
+    return [l for l in lines if l and not l.startswith("#")]
+
+##======================================================================================================================
+#
+def __isExcluded(name: str, rel: str, is_dir: bool, patterns: list) -> bool:
+    """!
+    @brief Check if a file or directory matches one of the patterns to exclude
+
+    @param name Name of the file or directory
+    @param rel Path relative to the searched directory, using `/` as separator
+    @param is_dir True if the entry is a directory
+    @param patterns List of patterns to exclude
+
+    @return True if the entry is excluded
+    """
+    for p in patterns:
+        ## Patterns ending with `/` only match directories
+        if p.endswith("/"):
+            if not is_dir:
+                continue
+            p = p.rstrip("/")
+
+        ## Patterns with a `/` match the relative path
+        if "/" in p:
+            if __matchPath(rel.split("/"), p.lstrip("/").split("/")):
+                return True
+        elif fnmatch.fnmatchcase(name, p):
+            return True
+
+    return False
+
+##======================================================================================================================
+#
+def __matchPath(parts: list, pattern: list) -> bool:
+    """!
+    @brief Match a path against a pattern, component by component
+
+    A `*` does not match the `/` separator, while a `**` component matches any number of directories.
+
+    @param parts Components of the path
+    @param pattern Components of the pattern
+
+    @return True if the path matches the pattern
+    """
+    if not pattern:
+        return not parts
+
+    if pattern[0] == "**":
+        return any(__matchPath(parts[i:], pattern[1:]) for i in range(len(parts) + 1))
+
+    return (
+        bool(parts)
+        and fnmatch.fnmatchcase(parts[0], pattern[0])
+        and __matchPath(parts[1:], pattern[1:])
+    )
@@ -0,0 +1,226 @@
+"""!
+@file store.py
+
+@module The `store.py` module persists the build state of a project (files, dependency graph, outputs, and plugin
+results) in a SQLite database. Entries are read and written by key, and the changes made during a build are committed
+in a single transaction once the build succeeded.
+"""
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("PYMIND")
+
+##======================================================================================================================
+# CONSTANTS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (kind, key)
+) WITHOUT ROWID;
+"""
+
+########################################################################################################################
+# BUILD STORE
+########################################################################################################################
+
+
+class BuildStore:
+    """!
+    @brief Key-value store of the build state of a project.
+
+    Each entry is identified by a `kind` (e.g. `files`, `deps`, or the name of a plugin) and a `key`, its value is
+    stored as JSON. Writes are kept in memory until `commit` is called, so a build that fails leaves the state of the
+    previous build untouched.
+
+    The store can be pickled to be handed over to an isolated plugin, the pending writes are pickled along with the
+    path of the database.
+    """
+
+    ####################################################################################################################
+    # PUBLIC
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __init__(self, path: Path):
+        """!
+        @brief Opens the store, creating the database if necessary
+
+        @param path Path to the SQLite database
+        """
+        self.path = Path(path)  #!< Path to the SQLite database
+        self.pending: dict = {}  #!< Pending writes, (kind, key) to value
+        self.deleted: set = set()  #!< Pending deletions, (kind, key)
+        self.__db = None  #!< Database connection, opened on first use
+        return
+
+    ##==================================================================================================================
+    #
+    def get(self, kind: str, key: str, default: Any = None) -> Any:
+        """!
+        @brief Retrieve an entry.
+
+        @param kind Kind of the entry
+        @param key Key of the entry
+        @param default Value returned if the entry does not exist
+
+        @return Value of the entry
+        """
+        if (kind, key) in self.pending:
+            return self.pending[(kind, key)]
+        elif (kind, key) in self.deleted:
+            return default
+
+        row = (
+            self.__connect()
+            .execute("SELECT value FROM state WHERE kind = ? AND key = ?", (kind, key))
+            .fetchone()
+        )
+
+        return json.loads(row[0]) if row else default
+
+    ##==================================================================================================================
+    #
+    def items(self, kind: str) -> dict:
+        """!
+        @brief Retrieve every entry of a kind.
+
+        @param kind Kind of the entries
+
+        @return Dictionary of key to value
+        """
+        rows = self.__connect().execute(
+            "SELECT key, value FROM state WHERE kind = ?", (kind,)
+        )
+        items = {k: json.loads(v) for k, v in rows}
+
+        # Apply the pending changes
+        for k, key in self.deleted:
+            if k == kind:
+                items.pop(key, None)
+
+        for (k, key), value in self.pending.items():
+            if k == kind:
+                items[key] = value
+
+        return items
+
+    ##==================================================================================================================
+    #
+    def put(self, kind: str, key: str, value: Any):
+        """!
+        @brief Create or update an entry.
+
+        @param kind Kind of the entry
+        @param key Key of the entry
+        @param value JSON serializable value
+        """
+        self.deleted.discard((kind, str(key)))
+        self.pending[(kind, str(key))] = value
+        return
+
+    ##==================================================================================================================
+    #
+    def delete(self, kind: str, key: str):
+        """!
+        @brief Delete an entry.
+
+        @param kind Kind of the entry
+        @param key Key of the entry
+        """
+        self.pending.pop((kind, str(key)), None)
+        self.deleted.add((kind, str(key)))
+        return
+
+    ##==================================================================================================================
+    #
+    def commit(self):
+        """!
+        @brief Write the pending changes in a single transaction.
+        """
+        puts = [(kind, key, json.dumps(v)) for (kind, key), v in self.pending.items()]
+        deletes = list(self.deleted)
+
+        logger.debug(f"STORE: Writing {len(puts)} and deleting {len(deletes)} entries")
+
+        db = self.__connect()
+        with db:
+            db.executemany(
+                "INSERT OR REPLACE INTO state (kind, key, value) VALUES (?, ?, ?)",
+                puts,
+            )
+            db.executemany("DELETE FROM state WHERE kind = ? AND key = ?", deletes)
+
+        self.rollback()
+        return
+
+    ##==================================================================================================================
+    #
+    def rollback(self):
+        """!
+        @brief Discard the pending changes.
+        """
+        self.pending = {}
+        self.deleted = set()
+        return
+
+    ##==================================================================================================================
+    #
+    def close(self):
+        """!
+        @brief Close the database connection, the pending changes are kept.
+        """
+        if self.__db is not None:
+            self.__db.close()
+            self.__db = None
+        return
+
+    ##==================================================================================================================
+    #
+    def __getstate__(self) -> dict:
+        """!
+        @brief Pickle the path and the pending changes, but not the database connection.
+        """
+        return {"path": self.path, "pending": self.pending, "deleted": self.deleted}
+
+    ##==================================================================================================================
+    #
+    def __setstate__(self, state: dict):
+        """!
+        @brief Restore a pickled store.
+        """
+        self.path = state["path"]
+        self.pending = state["pending"]
+        self.deleted = state["deleted"]
+        self.__db = None
+        return
+
+    ####################################################################################################################
+    # PRIVATE
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __connect(self) -> sqlite3.Connection:
+        """!
+        @brief Open the database connection if it is not already open.
+
+        @return Database connection
+        """
+        if self.__db is None:
+            logger.debug(f"STORE: Opening {self.path}")
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Requests of a project may be served by different threads (see `daemon.py`), one at a time
+            self.__db = sqlite3.connect(self.path, check_same_thread=False)
+            self.__db.execute("PRAGMA journal_mode=WAL")
+            self.__db.executescript(SCHEMA)
+
+        return self.__db
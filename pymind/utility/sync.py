@@ -0,0 +1,185 @@
+"""!
+@file sync.py
+
+@module The `sync.py` module keeps a directory tree synchronized with another one while only copying the files that
+are new or have changed.
+"""
+
+import logging
+import os
+import shutil
+from pathlib import Path
+
+from pymind.utility.search import excludePatterns, isExcluded
+
+logger = logging.getLogger("PYMIND")
+
+##======================================================================================================================
+# CONSTANTS
+
+SYNC_MODES = ("copy", "hardlink", "reflink")
+FICLONE = 0x40049409  #!< Linux `ioctl` request to clone (reflink) a file
+
+
+##======================================================================================================================
+#
+def syncTree(
+    src: Path, dst: Path, files: dict = None, mode: str = "copy", exclude: list = None
+) -> tuple:
+    """!
+    @brief Synchronize the `dst` directory with the `src` directory.
+
+    A file is copied only if it does not exist in `dst` or if its size or modification time differ from the file in
+    `src`. Files and directories that no longer exist in `src` are removed from `dst`. As with `search.findFiles`,
+    symbolic links to directories are not followed, and the excluded files and directories are not copied.
+
+    In `hardlink` mode the files are hard linked instead of copied and in `reflink` mode they are cloned, both fall back
+    to a regular copy when the file system does not support the operation. Files in `dst` must then be replaced instead
+    of being modified in place (see `modfile.writeFile`) to leave the files in `src` untouched.
+
+    @param src Source directory
+    @param dst Destination directory
+    @param files Dictionary of file path to stat data (`mtime` and `size`) as created by `findFiles`
+    @param mode Synchronization mode, one of `SYNC_MODES`
+    @param exclude List of patterns to exclude
+
+    @return Tuple with the number of files (copied, removed)
+    """
+    logger.debug(f"SYNC: Synchronizing {src} to {dst} ({mode})")
+
+    if mode not in SYNC_MODES:
+        raise ValueError(f"SYNC: Unknown synchronization mode {mode}")
+
+    files = files or {}
+    src = Path(src)
+    dst = Path(dst)
+    dst.mkdir(parents=True, exist_ok=True)
+    patterns = excludePatterns(src, exclude)
+
+    copied = 0
+    seen = set()
+
+    # Copy the new and updated files
+    stack = [""]
+    while stack:
+        rel_d = stack.pop()
+        with os.scandir(src / rel_d) as it:
+            for entry in it:
+                rel = os.path.join(rel_d, entry.name)
+                is_dir = entry.is_dir(follow_symlinks=False)
+
+                ## Skip the excluded files and directories, and the links to directories
+                if isExcluded(Path(rel).as_posix(), is_dir, patterns) or (
+                    not is_dir and entry.is_dir()
+                ):
+                    continue
+                seen.add(rel)
+
+                ## Descend into directories
+                if is_dir:
+                    (dst / rel).mkdir(exist_ok=True)
+                    stack.append(rel)
+                    continue
+
+                ## Retrieve the stat data of the source file
+                stat = files.get(entry.path)
+                if stat is None:
+                    try:
+                        st = entry.stat()
+                    except OSError as e:
+                        logger.warning(f"SYNC: Could not read {entry.path}: {e}")
+                        seen.discard(rel)
+                        continue
+                    stat = {"mtime": st.st_mtime, "size": st.st_size}
+
+                ## Skip the file if it is unchanged
+                if __isSynced(dst / rel, stat):
+                    continue
+
+                __syncFile(Path(entry.path), dst / rel, mode)
+                copied += 1
+
+    # Remove the files that no longer exist in the source directory
+    removed = 0
+    for root, dirs, fns in os.walk(dst, topdown=False):
+        rel_d = os.path.relpath(root, dst)
+        rel_d = "" if rel_d == "." else rel_d
+        for fn in fns:
+            if os.path.join(rel_d, fn) not in seen:
+                os.unlink(os.path.join(root, fn))
+                removed += 1
+        for d in dirs:
+            if os.path.join(rel_d, d) not in seen:
+                shutil.rmtree(os.path.join(root, d), ignore_errors=True)
+
+    logger.debug(f"SYNC: Copied {copied} file(s), removed {removed} file(s)")
+
+    return (copied, removed)
+
+
+##======================================================================================================================
+#
+def __isSynced(dst: Path, stat: dict) -> bool:
+    """!
+    @brief Check if the destination file matches the stat data of the source file.
+
+    @param dst Destination file
+    @param stat Dictionary with the `mtime` and `size` of the source file
+
+    @return True if the destination file is up to date
+    """
+    try:
+        st = os.stat(dst, follow_symlinks=False)
+    except FileNotFoundError:
+        return False
+
+    return st.st_size == stat["size"] and st.st_mtime == stat["mtime"]
+
+
+##======================================================================================================================
+#
+def __syncFile(src: Path, dst: Path, mode: str):
+    """!
+    @brief Copy, hard link, or clone `src` to `dst`.
+
+    @param src Source file
+    @param dst Destination file
+    @param mode Synchronization mode, one of `SYNC_MODES`
+    """
+    # Remove the outdated file, it may be a link to the source file
+    if dst.is_dir() and not dst.is_symlink():
+        shutil.rmtree(dst)
+    else:
+        dst.unlink(missing_ok=True)
+
+    try:
+        if mode == "hardlink":
+            os.link(src, dst)
+            return
+        elif mode == "reflink":
+            __reflink(src, dst)
+            return
+    except (OSError, ImportError) as e:
+        logger.debug(f"SYNC: Falling back to copying {src}: {e}")
+        dst.unlink(missing_ok=True)
+
+    shutil.copy2(src, dst)
+    return
+
+
+##======================================================================================================================
+#
+def __reflink(src: Path, dst: Path):
+    """!
+    @brief Clone `src` to `dst` so that both files share their data blocks until one of them is modified.
+
+    @param src Source file
+    @param dst Destination file
+    """
+    import fcntl
+
+    with open(src, "rb") as fs, open(dst, "wb") as fd:
+        fcntl.ioctl(fd.fileno(), FICLONE, fs.fileno())
+
+    shutil.copystat(src, dst)
+    return
@@ -6,17 +6,25 @@
 
 import re
 import logging
+from typing import Iterable
 
 logger = logging.getLogger("PYMIND")
 
+##======================================================================================================================
+# CONSTANTS
+
+TAG_REGEX = re.compile(r"^<!--\s*:?(.*?):\s*-->")  #!< Line of tags `<!-- :a:b: -->`
+COMMENT_REGEX = re.compile(r"^\s*(<!--.*-->)?\s*$")  #!< Line of the header block
+
 
 ##======================================================================================================================
 #
-def getTags(files: list[str]) -> dict:
+def getTags(files: list[str], header_only: bool = False) -> dict:
     """!
     @brief Retrieve tags from the files
 
     @param bf List of files to search
+    @param header_only Only search the header block of the files
 
     @return A dictionary where the key is the tag found and the item is a list of files where the tag was found.
     """
@@ -25,24 +33,69 @@ def getTags(files: list[str]) -> dict:
     # For each file in the 'build files' list
     logger.debug("TAGS: Searching for tags in files list.")
     for f in files:
-        ## Open the build file
-        with open(f, "r") as txt:
-            ### For each row in the build file
-            for l in txt:
-                #### Search for tags in the file
-                regex = r"^<!--\s*:?(.*?):\s*-->"
-                matches = re.findall(regex, l)
+        tags = __updateTags(f, tags, getFileTags(f, header_only))
+
+    return tags
 
-                #### If tags were found
-                if matches:
-                    #### Create a list of the tags
-                    matches = matches[0].split(":")
 
-                    ##### Add the tag to the table of tags
-                    tags = __updateTags(f, tags, matches)
+##======================================================================================================================
+#
+def getFileTags(file: str, header_only: bool = False) -> list:
+    """!
+    @brief Retrieve the tags of a file
+
+    @param file Path to the file
+    @param header_only Only search the header block of the file
+
+    @return List of the tags found in the file
+    """
+    ## Open the file
+    with open(file, "r") as txt:
+        return findTags(txt, header_only)
+
+
+##======================================================================================================================
+#
+def findTags(lines: Iterable[str], header_only: bool = False) -> list:
+    """!
+    @brief Retrieve the tags from the lines of a file
+
+    The header block of a file is made of the blank and HTML comment lines at the top of the file.
 
-                    ##### Continue looking for tags in other files
-                    continue
+    @param lines Lines of the file
+    @param header_only Only search the header block of the file
+
+    @return List of the tags found in the lines
+    """
+    tags = []
+
+    # For each row in the file
+    for l in lines:
+        ## Stop at the end of the header block
+        if header_only and not COMMENT_REGEX.match(l):
+            break
+
+        ## Search for tags in the line
+        match = TAG_REGEX.match(l)
+        if match:
+            tags.extend(match.group(1).split(":"))
+
+    return tags
+
+
+##======================================================================================================================
+#
+def collectTags(records: dict) -> dict:
+    """!
+    @brief Merge the tags of the analyzed files
+
+    @param records Dictionary of file path to analysis record (see `analyze.py`)
+
+    @return A dictionary where the key is the tag found and the item is a list of files where the tag was found.
+    """
+    tags = {}
+    for f, record in records.items():
+        tags = __updateTags(f, tags, record["tags"])
 
     return tags
 
@@ -60,7 +113,6 @@ def __updateTags(fn: str, tags: dict, matches: list) -> dict:
     @return Update dictionary of tag => [list of files with tag]
     """
     # Loop through each matched tag found in `fn`
-    logger.debug("TAGS: Updating dictionary of tags")
     for m in matches:
         ## If the tag already exists
         if tags.get(m):
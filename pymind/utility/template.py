@@ -0,0 +1,116 @@
+"""!
+@file template.py
+
+@module The `template.py` module compiles the HTML page template into literal segments and named slots so that a page
+can be rendered in a single pass.
+"""
+
+import logging
+import re
+
+logger = logging.getLogger("PYMIND")
+
+########################################################################################################################
+# TEMPLATE
+########################################################################################################################
+
+
+class Template:
+    """!
+    @brief HTML page template compiled into a list of literal segments and named slots.
+
+    The template variables understood by PyMind, and the placeholder used for each of them in `template.html`, are
+    defined in `SLOTS`. Any other text in the template is treated as a literal.
+    """
+
+    ####################################################################################################################
+    # CONSTANTS
+    ####################################################################################################################
+    SLOTS = {
+        "content": "%content%",
+        "css": "%css%",
+        "date": "%date%",
+        "footer": "{{footer}}",
+        "nav": "%nav%",
+        "title": "%title%",
+    }
+
+    SLOT_REGEX = re.compile("|".join(re.escape(p) for p in SLOTS.values()))
+    PLACEHOLDERS = {p: name for name, p in SLOTS.items()}
+
+    # Slots shared by every page, which can be written once and included by the pages
+    CHROME_SLOTS = ["footer", "nav"]
+
+    # Markup including a shared fragment (`%file%`) for each chrome mode
+    INCLUDES = {
+        "js": """<script>
+((s) => fetch("%file%").then((r) => r.text()).then((html) => {
+    const t = document.createElement("template");
+    t.innerHTML = html;
+    const page = location.pathname.split("/").pop() || "index.html";
+    t.content.querySelectorAll(`a[href="${page}"]`).forEach((a) => a.classList.add("active"));
+    s.replaceWith(t.content);
+}))(document.currentScript);
+</script>""",
+        "ssi": '<!--#include virtual="%file%" -->',
+    }
+
+    ####################################################################################################################
+    # PUBLIC
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __init__(self, text: str):
+        """!
+        @brief Compile the template text
+
+        @param text Template text
+        """
+        self.segments: list = []  #!< List of (is_slot, literal text or slot name)
+
+        # Split the template into literals and slots
+        pos = 0
+        for m in Template.SLOT_REGEX.finditer(text):
+            if m.start() > pos:
+                self.segments.append((False, text[pos : m.start()]))
+            self.segments.append((True, Template.PLACEHOLDERS[m.group(0)]))
+            pos = m.end()
+
+        if pos < len(text):
+            self.segments.append((False, text[pos:]))
+
+        return
+
+    ##==================================================================================================================
+    #
+    def slots(self) -> set:
+        """!
+        @brief Return the names of the slots used in the template.
+
+        @return Set of slot names
+        """
+        return {v for is_slot, v in self.segments if is_slot}
+
+    ##==================================================================================================================
+    #
+    def render(self, values: dict) -> str:
+        """!
+        @brief Render the template in a single pass.
+
+        Slots without a value are rendered as their placeholder.
+
+        @param values Dictionary of slot name to value
+
+        @return Rendered text
+        """
+        out = []
+        for is_slot, v in self.segments:
+            if not is_slot:
+                out.append(v)
+            elif values.get(v) is not None:
+                out.append(str(values[v]))
+            else:
+                out.append(Template.SLOTS[v])
+
+        return "".join(out)
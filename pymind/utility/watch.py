@@ -0,0 +1,332 @@
+"""!
+@file watch.py
+
+@module The `watch.py` module waits for changes to the Markdown files of a directory. Changes are reported by inotify
+on Linux, other platforms fall back to periodically comparing the stat data of the files.
+"""
+
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+from pymind.utility.search import excludePatterns, isExcluded, walkDir
+
+logger = logging.getLogger("PYMIND")
+
+##======================================================================================================================
+# CONSTANTS
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0x00000800
+IN_CLOEXEC = 0x00080000
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+)
+EVENT_HEADER = struct.Struct("iIII")  #!< inotify_event: wd, mask, cookie, len
+
+########################################################################################################################
+# WATCHER
+########################################################################################################################
+
+
+class Watcher:
+    """!
+    @brief Wait for the Markdown files of a directory to be created, modified, moved, or deleted.
+
+    Saving a file often produces a burst of events (e.g. an editor writing a temporary file and renaming it). The
+    events are coalesced until no new event has been received for `debounce` seconds. Files and directories excluded
+    from the search of the directory (see `search.findFiles`) are not watched.
+    """
+
+    ####################################################################################################################
+    # PUBLIC
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __init__(
+        self,
+        dir: Path,
+        debounce: float = 0.1,
+        interval: float = 0.5,
+        polling: bool = False,
+        exclude: list = None,
+    ):
+        """!
+        @brief Creates a new watcher
+
+        @param dir Directory to watch recursively
+        @param debounce Time in seconds without any event after which a burst of events is reported
+        @param interval Time in seconds between two scans of the directory when polling
+        @param polling Compare the stat data of the files instead of using inotify
+        @param exclude List of patterns to exclude
+        """
+        self.dir = Path(dir).absolute()  #!< Watched directory
+        self.debounce = debounce  #!< Quiet time ending a burst of events
+        self.interval = interval  #!< Polling interval
+        self.patterns = excludePatterns(self.dir, exclude)  #!< Patterns to exclude
+        self.__fd = None  #!< inotify file descriptor
+        self.__wds = {}  #!< inotify watch descriptor to directory
+        self.__snapshot = {}  #!< File path to stat data when polling
+
+        # Use inotify when available
+        if not polling:
+            try:
+                self.__initInotify()
+            except (OSError, AttributeError, TypeError) as e:
+                logger.debug(f"WATCH: inotify is not available, polling instead: {e}")
+                self.close()
+
+        if self.__fd is None:
+            self.__snapshot = self.__scan()
+
+        return
+
+    ##==================================================================================================================
+    #
+    @property
+    def polling(self) -> bool:
+        """!
+        @brief Check if the watcher polls the directory.
+
+        @return True if the watcher compares the stat data of the files
+        """
+        return self.__fd is None
+
+    ##==================================================================================================================
+    #
+    def wait(self, timeout: float = None) -> set:
+        """!
+        @brief Wait for files to change.
+
+        @param timeout Maximum time in seconds to wait for the first change, None waits forever
+
+        @return Set of the paths that changed, empty if the timeout expired
+        """
+        changes = self.__poll(timeout)
+
+        # Coalesce the burst of events
+        while changes:
+            more = self.__poll(self.debounce)
+            if not more:
+                break
+            changes |= more
+
+        return changes
+
+    ##==================================================================================================================
+    #
+    def close(self):
+        """!
+        @brief Stop watching the directory.
+        """
+        if self.__fd is not None:
+            os.close(self.__fd)
+            self.__fd = None
+        return
+
+    ####################################################################################################################
+    # PRIVATE
+    ####################################################################################################################
+
+    ##==================================================================================================================
+    #
+    def __poll(self, timeout: float) -> set:
+        """!
+        @brief Collect the changes received within `timeout` seconds.
+
+        @param timeout Maximum time in seconds to wait, None waits forever
+
+        @return Set of the paths that changed
+        """
+        if self.__fd is not None:
+            return self.__readEvents(timeout)
+
+        # Compare the stat data of the files until something changed
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self.__scan()
+            changes = {
+                Path(f)
+                for f in set(snapshot) | set(self.__snapshot)
+                if snapshot.get(f) != self.__snapshot.get(f)
+            }
+            self.__snapshot = snapshot
+
+            if changes:
+                return changes
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+
+            delay = self.interval
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+
+    ##==================================================================================================================
+    #
+    def __scan(self) -> dict:
+        """!
+        @brief Record the stat data of the Markdown files of the directory.
+
+        @return Dictionary of file path to (mtime, size)
+        """
+        snapshot = {}
+        for root, dirs, files in walkDir(self.dir, self.patterns):
+            for fn in files:
+                if fn.endswith(".md"):
+                    f = os.path.join(root, fn)
+                    try:
+                        st = os.stat(f)
+                    except FileNotFoundError:
+                        continue
+                    snapshot[f] = (st.st_mtime_ns, st.st_size)
+
+        return snapshot
+
+    ##==================================================================================================================
+    #
+    def __isExcluded(self, path: Path, is_dir: bool) -> bool:
+        """!
+        @brief Check if a path of the watched directory is excluded.
+
+        @param path Path within the watched directory
+        @param is_dir True if the path is a directory
+
+        @return True if the path is excluded
+        """
+        return isExcluded(path.relative_to(self.dir).as_posix(), is_dir, self.patterns)
+
+    ##==================================================================================================================
+    #
+    def __initInotify(self):
+        """!
+        @brief Create the inotify instance and watch every directory.
+        """
+        import ctypes
+        import ctypes.util
+
+        # inotify is specific to Linux
+        if not sys.platform.startswith("linux"):
+            raise OSError(f"inotify is not supported on {sys.platform}")
+
+        name = ctypes.util.find_library("c")
+        if name is None:
+            raise OSError("the C library could not be found")
+
+        libc = ctypes.CDLL(name, use_errno=True)
+        self.__libc = libc  #!< C library providing inotify
+
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.__fd = fd
+
+        self.__addWatch(self.dir)
+        for root, dirs, files in walkDir(self.dir, self.patterns):
+            for d in dirs:
+                self.__addWatch(Path(root) / d)
+
+        return
+
+    ##==================================================================================================================
+    #
+    def __addWatch(self, dir: Path):
+        """!
+        @brief Watch a directory.
+
+        @param dir Path to the directory
+        """
+        import ctypes
+
+        wd = self.__libc.inotify_add_watch(self.__fd, bytes(dir), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {dir}")
+
+        self.__wds[wd] = dir
+        return
+
+    ##==================================================================================================================
+    #
+    def __readEvents(self, timeout: float) -> set:
+        """!
+        @brief Read the inotify events received within `timeout` seconds.
+
+        @param timeout Maximum time in seconds to wait, None waits forever
+
+        @return Set of the paths that changed
+        """
+        ready, _, _ = select.select([self.__fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        try:
+            data = os.read(self.__fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changes = set()
+        pos = 0
+        while pos < len(data):
+            wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, pos)
+            pos += EVENT_HEADER.size
+            name = data[pos : pos + length].rstrip(b"\0").decode()
+            pos += length
+
+            ## Events were dropped, report the whole directory
+            if mask & IN_Q_OVERFLOW:
+                changes.add(self.dir)
+                continue
+
+            ## The directory is no longer watched
+            if mask & IN_IGNORED:
+                self.__wds.pop(wd, None)
+                continue
+
+            d = self.__wds.get(wd)
+            if d is None:
+                continue
+            path = d / name if name else d
+
+            ## Skip the excluded files and directories
+            if name and self.__isExcluded(path, bool(mask & IN_ISDIR)):
+                continue
+
+            ## Watch the new directories and report the files they already contain
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    try:
+                        self.__addWatch(path)
+                        for root, dirs, files in walkDir(path, self.patterns, self.dir):
+                            for sub in dirs:
+                                self.__addWatch(Path(root) / sub)
+                    except OSError as e:
+                        logger.debug(f"WATCH: Could not watch {path}: {e}")
+                    for root, dirs, files in walkDir(path, self.patterns, self.dir):
+                        changes.update(
+                            Path(root) / f for f in files if f.endswith(".md")
+                        )
+                changes.add(path)
+            elif path.suffix == ".md":
+                changes.add(path)
+
+        return changes
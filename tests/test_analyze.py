@@ -0,0 +1,87 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from pymind.utility.analyze import analyzeFiles, analyzeText
+from pymind.utility.store import BuildStore
+
+########################################################################################################################
+
+
+class TestAnalyze(unittest.TestCase):
+    ##==================================================================================================================
+    #
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.store = BuildStore(self.dir / "project.db")
+
+        self.a = str(self.dir / "a.md")
+        self.b = str(self.dir / "b.md")
+        Path(self.a).write_text("<!-- :nav: -->\n# A\nSee [b](b).\n")
+        Path(self.b).write_text("# B\n")
+        self.files = {self.a: {"digest": "a1"}, self.b: {"digest": "b1"}}
+        return
+
+    ##==================================================================================================================
+    #
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+        return
+
+    ##==================================================================================================================
+    #
+    def test_analyze_text(self):
+        text = "<!-- :nav:x: -->\n\n## Title ##\n[b](b) [site](https://a.b)\n1\n2\n3\n"
+        record = analyzeText(text)
+
+        self.assertEqual(record["tags"], ["nav", "x"])
+        self.assertEqual(record["links"], ["b"])
+        self.assertEqual(record["title"], "Title")
+        self.assertEqual(len(record["excerpt"]), 5)
+        self.assertEqual(record["words"], 11)
+        self.assertIsNone(analyzeText("No heading")["title"])
+        return
+
+    ##==================================================================================================================
+    #
+    def test_analyze_code_and_images(self):
+        # Only the links converted to HTML links are references
+        text = (
+            "![image](img.png) [![badge](badge.png)](b)\n"
+            "`[code](c)` ``[a `span`](d)`` [e](e)\n"
+            "```python\n[fenced](f)\n```\n"
+            "~~~~\n[tilde](g)\n~~~\n~~~~\n"
+            "[h](h)\n"
+            "```\n[unclosed](i)\n"
+        )
+        self.assertEqual(analyzeText(text)["links"], ["b", "e", "h"])
+        return
+
+    ##==================================================================================================================
+    #
+    def test_analyze_files(self):
+        records = analyzeFiles(self.files, self.store)
+        self.assertEqual(records[self.a]["links"], ["b"])
+        self.assertEqual(records[self.b]["tags"], [])
+
+        # Files with the same digest are not read again
+        Path(self.b).write_text("<!-- :nav: -->\n")
+        self.assertEqual(analyzeFiles(self.files, self.store), records)
+
+        # Records of another version are read again
+        self.store.put("analysis", self.b, {**records[self.b], "version": 0})
+        self.store.commit()
+        self.assertEqual(analyzeFiles(self.files, self.store)[self.b]["tags"], ["nav"])
+
+        # Files whose digest changed are read again, in parallel
+        self.files[self.b]["digest"] = "b2"
+        records = analyzeFiles(self.files, self.store, jobs=2)
+        self.assertEqual(records[self.b]["tags"], ["nav"])
+
+        # Deleted files are removed from the store
+        del self.files[self.a]
+        self.assertEqual(list(analyzeFiles(self.files, self.store)), [self.b])
+        self.assertEqual(list(self.store.items("analysis")), [self.b])
+        return
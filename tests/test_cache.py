@@ -2,6 +2,7 @@ import glob
 import os
 import platform
 import unittest
+from unittest import mock
 from pathlib import Path
 
 from pymind import PyMind, utility
@@ -32,12 +33,13 @@ class TestCacheModule(unittest.TestCase):
 
     ##==================================================================================================================
     #
-    def getPM(self, force: bool = False, dry_run: bool = False):
+    def getPM(self, force: bool = False, dry_run: bool = False, isolate: bool = False):
         pm = PyMind(
             **{
                 "input": TestCacheModule.INPUT,
                 "output": TestCacheModule.OUTPUT,
                 "force": force,
+                "isolate": isolate,
                 "dry_run ": dry_run,
             }
         )
@@ -67,23 +69,31 @@ class TestCacheModule(unittest.TestCase):
     ##==================================================================================================================
     #
     def test_cache_variable_creation(self):
-        pm = self.getPM(force=True)
-        pm.run()
-
-        # Get the cache path
-        cache_d = self.createCachePaths()
-        cache_var = cache_d / Path("variables") / Path("example.pkl")
-
-        # Ensure the tags file is created
-        self.assertTrue(
-            cache_var.exists(),
-            f"The cached variable was not created: {cache_var}",
-        )
-
-        # Deconstruct the PyMind Object
-        del pm
-
-        # Delete the tags file page
+        pm = self.getPM(force=True, isolate=True)
+
+        # Record the variables cached by each isolated plugin when they are read back
+        cached = []
+
+        def unPickleVar(path, name):
+            cache_var = Path(path) / Path(f"{name}.pkl")
+            self.assertTrue(
+                cache_var.exists(),
+                f"The cached variable was not created: {cache_var}",
+            )
+            cached.append(utility.cache.unPickleVar(path, name))
+            return cached[-1]
+
+        with mock.patch("pymind.core.unPickleVar", side_effect=unPickleVar):
+            pm.run()
+
+        # Ensure the cached changes have been applied to the build context
+        self.assertTrue(len(cached) > 0)
+        nav = [c["slots"]["nav"] for c in cached if "nav" in c.get("slots", {})]
+        self.assertTrue(len(nav) > 0)
+        self.assertEqual(pm.slots["nav"], nav[-1])
+
+        # Ensure the cached variable is deleted once applied
+        cache_var = pm.getCachePaths("var") / Path(f"{pm.project_name}-delta.pkl")
         self.assertFalse(
             cache_var.exists(),
             f"The cached variable was not deleted: {cache_var}",
@@ -97,12 +107,8 @@ class TestCacheModule(unittest.TestCase):
         pm = self.getPM(force=True)
         pm.run()
 
-        # Get the cache path
-        cache_d = self.createCachePaths()
-        cache_d = cache_d / Path("variables")
-
         # Extract the cached variable
-        var = utility.cache.unPickleVar(cache_d, "example")
+        var = pm.var
 
         # Ensure the tags variable is created
         self.assertTrue(
@@ -120,3 +126,34 @@ class TestCacheModule(unittest.TestCase):
             f"The build files variable does not exist!\n{var['files']}",
         )
         return
+
+    ##==================================================================================================================
+    #
+    def test_isolated_context(self):
+        pm = self.getPM(force=True, isolate=True)
+        pm.run()
+
+        # Get the cache path
+        cache_d = self.createCachePaths() / Path("variables")
+
+        # The isolated plugins share the build context in memory and their changes have been applied
+        self.assertFalse((cache_d / Path("example.pkl")).exists())
+        self.assertFalse((cache_d / Path("example-delta.pkl")).exists())
+        self.assertTrue(len(pm.slots["nav"]) > 0)
+        self.assertTrue(len(pm.var["tags"]) > 0)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_pickle_variable(self):
+        # Get the cache path
+        cache_d = self.createCachePaths() / Path("variables")
+
+        # Cache a variable
+        var = {"tags": {"tag": ["file.md"]}, "files": {"file.md": {}}}
+        utility.cache.pickleVar(var, cache_d, "example-test")
+        self.addCleanup(utility.cache.deleteCacheVar, cache_d, "example-test")
+
+        # Extract the cached variable
+        self.assertEqual(utility.cache.unPickleVar(cache_d, "example-test"), var)
+        return
@@ -0,0 +1,56 @@
+import unittest
+
+from pymind.utility.context import ContextView, SharedContext
+
+########################################################################################################################
+
+
+class TestContext(unittest.TestCase):
+    ##==================================================================================================================
+    #
+    def setUp(self):
+        self.var = {
+            "files": {"a.md": {"size": 1}, "b.md": {"size": 2}},
+            "tags": {"tag": ["a.md"]},
+            "slots": {},
+        }
+        self.context = SharedContext()
+        self.context.publish(self.var)
+        self.addCleanup(self.context.close)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_lazy_view(self):
+        ctx = ContextView(self.context.handle())
+
+        # Values are only loaded when accessed
+        self.assertEqual(set(ctx), {"files", "tags", "slots"})
+        self.assertEqual(ctx["tags"], {"tag": ["a.md"]})
+        self.assertEqual(set(ctx.values), {"tags"})
+        self.assertIsNone(ctx.get("missing"))
+
+        # Reading a value does not change it
+        ctx["files"]
+        self.assertEqual(ctx.delta(), {})
+        return
+
+    ##==================================================================================================================
+    #
+    def test_delta(self):
+        ctx = ContextView(self.context.handle())
+        ctx["slots"]["nav"] = "<nav></nav>"
+        ctx["tags"]
+        ctx["new"] = 1
+
+        # Only the changed values are sent back
+        delta = ctx.delta()
+        self.assertEqual(delta, {"slots": {"nav": "<nav></nav>"}, "new": 1})
+
+        # The next view sees the changes
+        self.context.update(self.var, delta)
+        ctx = ContextView(self.context.handle())
+        self.assertEqual(ctx["slots"], {"nav": "<nav></nav>"})
+        self.assertEqual(ctx["new"], 1)
+        self.assertEqual(self.var["new"], 1)
+        return
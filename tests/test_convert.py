@@ -0,0 +1,98 @@
+import unittest
+from pathlib import Path
+
+import markdown
+
+from pymind.utility.convert import ConverterPool, convertFiles
+from pymind.utility.links import LINK_EXTENSION
+
+########################################################################################################################
+
+
+class TestConverterPool(unittest.TestCase):
+    ####################################################################################################################
+    # CONSTANTS
+    ####################################################################################################################
+    INPUT = "./tests/example"
+    EXTENSIONS = ["toc"]
+
+    ##==================================================================================================================
+    #
+    def test_converter_reuse(self):
+        pool = ConverterPool(TestConverterPool.EXTENSIONS)
+
+        # The same converter should be handed out for every document
+        self.assertIs(pool.get(), pool.get())
+        return
+
+    ##==================================================================================================================
+    #
+    def test_converter_output(self):
+        pool = ConverterPool(TestConverterPool.EXTENSIONS)
+        docs = ["[TOC]\n\n# First\n\nText", "[TOC]\n\n# Second\n\n## Sub"]
+
+        # The pooled converter must not leak state between documents
+        for md in docs + docs:
+            self.assertEqual(
+                pool.convert(md),
+                markdown.markdown(md, extensions=TestConverterPool.EXTENSIONS),
+            )
+
+        return
+
+    ##==================================================================================================================
+    #
+    def test_parallel_conversion(self):
+        pool = ConverterPool(TestConverterPool.EXTENSIONS)
+        files = sorted(Path(TestConverterPool.INPUT).rglob("*.md"))
+
+        serial = list(convertFiles(files, pool, jobs=1))
+        parallel = list(convertFiles(files, pool, jobs=2))
+
+        # The parallel conversion should produce the same output in the same order
+        self.assertEqual(serial, parallel)
+        self.assertEqual([x[0] for x in parallel], files)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_parallel_conversion_error(self):
+        pool = ConverterPool(TestConverterPool.EXTENSIONS)
+        files = sorted(Path(TestConverterPool.INPUT).glob("*.md"))
+        files.insert(1, Path(TestConverterPool.INPUT) / "missing.md")
+
+        results = list(convertFiles(files, pool, jobs=2))
+
+        # Only the missing file should fail
+        errors = [f for f, html, error in results if error]
+        self.assertEqual(errors, [files[1]])
+        self.assertEqual(len(results), len(files))
+        return
+
+    ##==================================================================================================================
+    #
+    def test_link_extension(self):
+        pool = ConverterPool([*TestConverterPool.EXTENSIONS, LINK_EXTENSION])
+        md = (
+            "[TOC]\n\n# Title\n\n[a](file2) [b](subdir/file4.md#part) [c](#title) "
+            "[d](https://example.com/x) [e](mailto:a@b.c) ![f](image.png)\n\n"
+            "`[g](code)`"
+        )
+        html = pool.convert(md)
+
+        # Only the links to other files are pointed to their page
+        self.assertIn('href="file2.html"', html)
+        self.assertIn('href="file4.html#part"', html)
+        self.assertIn('href="#title"', html)
+        self.assertIn('href="https://example.com/x"', html)
+        self.assertIn('href="mailto:a@b.c"', html)
+        self.assertIn('src="image.png"', html)
+        self.assertIn("[g](code)", html)
+
+        # The extension can be loaded by the conversion workers
+        files = sorted(Path(TestConverterPool.INPUT).glob("*.md"))
+        self.assertEqual(
+            list(convertFiles(files, pool, jobs=1)),
+            list(convertFiles(files, pool, jobs=2)),
+        )
+        return
@@ -0,0 +1,150 @@
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from pymind import daemon
+from pymind.__main__ import forward
+
+########################################################################################################################
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not available")
+class TestDaemon(unittest.TestCase):
+    ####################################################################################################################
+    # CONSTANTS
+    ####################################################################################################################
+    INPUT = "./tests/example"
+    OUTPUT = "./tests/example-output"
+
+    ##==================================================================================================================
+    #
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.socket_p = Path(self.tmp.name) / "pymind.sock"
+
+        # Serve the requests from another thread
+        self.daemon = daemon.Daemon(self.socket_p)
+        self.thread = threading.Thread(target=self.daemon.serve)
+        self.thread.start()
+
+        deadline = time.monotonic() + 10
+        while not daemon.isRunning(self.socket_p):
+            self.assertTrue(self.thread.is_alive(), "The daemon failed to start")
+            self.assertLess(time.monotonic(), deadline, "The daemon did not start")
+            self.thread.join(timeout=0.01)
+        return
+
+    ##==================================================================================================================
+    #
+    def tearDown(self):
+        daemon.request("stop", self.socket_p)
+        self.thread.join(timeout=5)
+        self.tmp.cleanup()
+        return
+
+    ##==================================================================================================================
+    #
+    def request(self, command: str, **args):
+        return daemon.request(command, self.socket_p, **args)
+
+    ##==================================================================================================================
+    #
+    def test_build(self):
+        project = {
+            "input": str(Path(TestDaemon.INPUT).absolute()),
+            "output": str(Path(TestDaemon.OUTPUT).absolute()),
+        }
+
+        # The first build is forced, the second one only rebuilds the landing page
+        result = self.request("build", force=True, **project)
+        self.assertIn("file1", result["built"])
+        result = self.request("build", **project)
+        self.assertEqual(result["built"], ["index"])
+
+        # The project is held by the daemon
+        status = self.request("status")
+        self.assertEqual(len(status["projects"]), 1)
+        self.assertEqual(status["projects"][0]["name"], "example")
+
+        stats = self.request("stats")["projects"][0]
+        self.assertEqual(stats["builds"], 2)
+        self.assertGreater(stats["files"], 0)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_render(self):
+        html = self.request(
+            "render",
+            input=TestDaemon.INPUT,
+            output=TestDaemon.OUTPUT,
+            file=str(Path(TestDaemon.INPUT).absolute() / "file1.md"),
+        )
+        self.assertIn("<title>file1</title>", html)
+        self.assertIn('href="file2.html"', html)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_error(self):
+        with self.assertRaises(RuntimeError):
+            self.request("unknown")
+        return
+
+    ##==================================================================================================================
+    #
+    def test_already_running(self):
+        with self.assertRaises(RuntimeError):
+            daemon.Daemon(self.socket_p).serve()
+        return
+
+    ##==================================================================================================================
+    #
+    def test_build_options(self):
+        project = {
+            "input": str(Path(TestDaemon.INPUT).absolute()),
+            "output": str(Path(TestDaemon.OUTPUT).absolute()),
+        }
+        self.request("build", force=True, **project)
+
+        # A dry run does not write the pages
+        page = Path(TestDaemon.OUTPUT) / "file2.html"
+        page.unlink()
+        self.request("build", force=True, dry_run=True, **project)
+        self.assertFalse(page.exists())
+
+        # The options of a request do not apply to the following requests
+        self.request("build", force=True, **project)
+        self.assertTrue(page.exists())
+        pm = list(self.daemon.projects.values())[0].pm
+        self.assertFalse(pm.dry_run)
+        self.assertFalse(pm.force_build)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_warm_converter(self):
+        args = {
+            "input": TestDaemon.INPUT,
+            "output": TestDaemon.OUTPUT,
+            "file": str(Path(TestDaemon.INPUT).absolute() / "file1.md"),
+        }
+
+        # The converter of the project is created once, whichever connection sent the request
+        with self.assertLogs("PYMIND", level="DEBUG") as logs:
+            self.request("render", **args)
+            self.request("render", **args)
+        created = [l for l in logs.output if "Creating converter" in l]
+        self.assertEqual(len(created), 1)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_render_usage(self):
+        with self.assertRaises(SystemExit) as e:
+            forward({"command": "render", "note": None})
+        self.assertEqual(e.exception.code, 2)
+        return
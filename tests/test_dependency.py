@@ -0,0 +1,283 @@
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pymind
+from pymind.utility.dependency import DependencyGraph
+from pymind.utility.template import Template
+
+########################################################################################################################
+
+
+class TestDependency(unittest.TestCase):
+    ####################################################################################################################
+    # CONSTANTS
+    ####################################################################################################################
+    INPUT = "./tests/example"
+    OUTPUT = "./tests/example-output"
+
+    ##==================================================================================================================
+    #
+    def getPM(self, force: bool = False):
+        pm = pymind.PyMind(
+            **{
+                "input": TestDependency.INPUT,
+                "output": TestDependency.OUTPUT,
+                "force": force,
+            }
+        )
+        return pm
+
+    ##==================================================================================================================
+    #
+    def modify(self, file: str, old: str, new: str):
+        # Edit the file and restore its content once the test is done
+        p = Path(file)
+        content = p.read_text()
+        self.addCleanup(p.write_text, content)
+        p.write_text(content.replace(old, new, 1))
+        return
+
+    ##==================================================================================================================
+    #
+    def test_stale_pages(self):
+        graph = DependencyGraph()
+        graph.setLinks({"/a.md": ["b"], "/b.md": []})
+        graph.setTags({"nav": ["/a.md"]})
+        graph.depend("a", "/a.md", "tag:nav")
+        graph.depend("b", "/b.md", "refs:b")
+
+        # Reload the graph as the next run would
+        graph = DependencyGraph(graph.toDict())
+        self.assertEqual(graph.stale(), set())
+
+        # Removing the link from `a` changes the references of `b`
+        graph.setLinks({"/a.md": [], "/b.md": []})
+        graph.setTags({"nav": ["/a.md"]})
+        self.assertEqual(graph.stale(), {"b"})
+
+        # Unknown pages are always stale
+        self.assertTrue(graph.isStale("c"))
+        return
+
+    ##==================================================================================================================
+    #
+    def test_rebuild_referenced_page(self):
+        pm = self.getPM(force=True)
+        pm.run()
+
+        # Nothing changed
+        pm = self.getPM()
+        pm.run()
+        self.assertEqual([f.stem for f in pm.build_files], ["index"])
+
+        # Removing the link to `file3` changes its list of references
+        self.modify("./tests/example/file1.md", "[file](file3)", "file")
+        pm = self.getPM()
+        pm.run()
+        self.assertEqual(
+            sorted(Path(f).stem for f in pm.build_files), ["file1", "file3", "index"]
+        )
+        self.assertNotIn("file3", pm.refs)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_rebuild_sub_wiki(self):
+        pm = self.getPM(force=True)
+        pm.run()
+
+        # The sub-wiki page lists the beginning of each file of the sub-wiki
+        self.modify("./tests/example/subwiki/s1.md", "", "Updated\n")
+        pm = self.getPM()
+        pm.run()
+        self.assertEqual(
+            sorted(Path(f).stem for f in pm.build_files), ["index", "s1", "subwiki"]
+        )
+        return
+
+    ##==================================================================================================================
+    #
+    def test_deleted_file(self):
+        new_f = Path(TestDependency.INPUT) / "deleted.md"
+        self.addCleanup(new_f.unlink, missing_ok=True)
+        new_f.write_text("<!-- :nav: -->\nLink to [file2](file2)\n")
+
+        pm = self.getPM()
+        pm.run()
+        page = Path(TestDependency.OUTPUT) / "deleted.html"
+        self.assertTrue(page.exists())
+
+        # The page is removed along with its references and tags
+        new_f.unlink()
+        pm = self.getPM()
+        with patch("pymind.core.writeChanged", return_value=False):
+            pm.run()
+        self.assertEqual(pm.changed, 1)
+        self.assertFalse(page.exists())
+        self.assertNotIn("deleted", pm.refs.get("file2", []))
+        self.assertNotIn(str(new_f.resolve()), pm.tags["nav"])
+        self.assertIn("file2", [Path(f).stem for f in pm.build_files])
+        return
+
+    ##==================================================================================================================
+    #
+    def test_moved_file(self):
+        new_f = Path(TestDependency.INPUT) / "moved.md"
+        moved_f = Path(TestDependency.INPUT) / "subdir" / "moved.md"
+        self.addCleanup(new_f.unlink, missing_ok=True)
+        self.addCleanup(moved_f.unlink, missing_ok=True)
+        new_f.write_text("Link to [file2](file2)\n")
+
+        pm = self.getPM()
+        pm.run()
+        page = Path(TestDependency.OUTPUT) / "moved.html"
+        mtime = page.stat().st_mtime_ns
+
+        # Moving the file keeps its page
+        new_f.rename(moved_f)
+        pm = self.getPM()
+        pm.run()
+        self.assertEqual([f.stem for f in pm.build_files], ["index"])
+        self.assertEqual(page.stat().st_mtime_ns, mtime)
+        self.assertEqual(pm.refs["file2"], ["file1", "moved"])
+        return
+
+    ##==================================================================================================================
+    #
+    def test_rewrap_chrome(self):
+        pm = self.getPM(force=True)
+        pm.run()
+
+        # Changing the template re-wraps the stored pages without running the pre-processing engine
+        pm = self.getPM()
+        pm.template = pm.template.replace("<body>", "<body>\n<!-- theme -->")
+        pm.page_template = Template(pm.template)
+        with patch("pymind.core.convertFiles") as convert:
+            convert.return_value = []
+            pm.run()
+
+        self.assertEqual(pm.build_files, [])
+        self.assertEqual(convert.call_args.args[0], [])
+
+        page = (Path(TestDependency.OUTPUT) / "file2.html").read_text()
+        self.assertIn("<!-- theme -->", page)
+        self.assertIn("<title>file2</title>", page)
+
+        # The pages generated by the engine are re-wrapped as well
+        page = (Path(TestDependency.OUTPUT) / "tags_page.html").read_text()
+        self.assertIn("<!-- theme -->", page)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_rewrap_missing_fragment(self):
+        pm = self.getPM(force=True)
+        pm.run()
+
+        # Remove the fragments of a note and of a generated page
+        for page in ["file2", "tags_page"]:
+            pm.fragments.delete(pm.store.get("fragments", page))
+
+        # The pages without a fragment are rebuilt instead of being re-wrapped
+        pm = self.getPM()
+        pm.template = pm.template.replace("<body>", "<body>\n<!-- theme -->")
+        pm.page_template = Template(pm.template)
+        pm.run()
+
+        self.assertIn("file2", [Path(f).stem for f in pm.build_files])
+        for page in ["file2", "tags_page"]:
+            html = (Path(TestDependency.OUTPUT) / f"{page}.html").read_text()
+            self.assertIn("<!-- theme -->", html)
+            self.assertNotIn("%content%", html)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_shared_chrome(self):
+        pm = self.getPM(force=True)
+        pm.chrome = "ssi"
+        pm.run()
+
+        # The navigation bar is written once and included by the pages
+        nav = Path(TestDependency.OUTPUT) / "_nav.html"
+        page = (Path(TestDependency.OUTPUT) / "file2.html").read_text()
+        self.assertIn('<!--#include virtual="_nav.html" -->', page)
+        self.assertNotIn('id="navigation"', page)
+        self.assertNotIn("%nav:", nav.read_text())
+
+        # Adding a `nav` note only updates the shared navigation bar
+        new_f = Path(TestDependency.INPUT) / "shared.md"
+        self.addCleanup(new_f.unlink, missing_ok=True)
+        new_f.write_text("<!-- :nav: -->\n# Shared\n")
+
+        pm = self.getPM()
+        pm.chrome = "ssi"
+        pm.run()
+        self.assertEqual(pm.rewrap, {})
+        self.assertNotIn("file2", [Path(f).stem for f in pm.build_files])
+        self.assertIn("shared.html", nav.read_text())
+        return
+
+    ##==================================================================================================================
+    #
+    def test_unchanged_outputs(self):
+        pm = self.getPM(force=True)
+        pm.run()
+        page = Path(TestDependency.OUTPUT) / "file2.html"
+        mtime = page.stat().st_mtime_ns
+
+        # Rebuilding the same pages does not write them again
+        pm = self.getPM(force=True)
+        pm.run()
+        self.assertEqual(pm.changed, 0)
+        self.assertEqual(page.stat().st_mtime_ns, mtime)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_shared_fragment(self):
+        a = Path(TestDependency.INPUT) / "same_a.md"
+        b = Path(TestDependency.INPUT) / "same_b.md"
+        for f in [a, b]:
+            self.addCleanup(f.unlink, missing_ok=True)
+            f.write_text("Same content\n")
+
+        pm = self.getPM()
+        pm.run()
+        key = pm.store.get("fragments", "same_b")
+        self.assertEqual(pm.store.get("fragments", "same_a"), key)
+
+        # Rebuilding one of the pages keeps the fragment the other one uses
+        a.write_text("Other content\n")
+        pm = self.getPM()
+        pm.run()
+        self.assertIsNotNone(pm.fragments.get(key))
+
+        # The fragment is removed once no page uses it
+        b.unlink()
+        pm = self.getPM()
+        pm.run()
+        self.assertIsNone(pm.fragments.get(key))
+        return
+
+    ##==================================================================================================================
+    #
+    def test_renamed_file(self):
+        graph = DependencyGraph()
+        graph.setLinks({"/a.md": ["b"], "/b.md": []})
+        graph.depend("b", "/b.md", "refs:b")
+        graph = DependencyGraph(graph.toDict())
+
+        # The page linked to by a renamed file lists its new name
+        graph.move("/a.md", "/c.md")
+        graph.setLinks({"/c.md": ["b"], "/b.md": []})
+        self.assertEqual(graph.refs()["b"], ["c"])
+        self.assertIn("b", graph.stale())
+
+        # Moving a file without renaming it keeps the references
+        graph = DependencyGraph(graph.toDict())
+        graph.move("/c.md", "/sub/c.md")
+        graph.setLinks({"/sub/c.md": ["b"], "/b.md": []})
+        self.assertNotIn("b", graph.stale())
+        return
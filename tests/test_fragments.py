@@ -0,0 +1,53 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from pymind.utility.fragments import FragmentCache
+
+########################################################################################################################
+
+
+class TestFragments(unittest.TestCase):
+    ##==================================================================================================================
+    #
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.cache = FragmentCache(self.dir, ["toc"], {"toc": {"permalink": True}})
+        return
+
+    ##==================================================================================================================
+    #
+    def tearDown(self):
+        self.tmp.cleanup()
+        return
+
+    ##==================================================================================================================
+    #
+    def test_key(self):
+        key = self.cache.key("# Title\n")
+        self.assertEqual(key, self.cache.key("# Title\n"))
+        self.assertNotEqual(key, self.cache.key("# Other\n"))
+
+        # The key depends on the extensions and their configuration
+        other = FragmentCache(self.dir, ["toc"], {"toc": {"permalink": False}})
+        self.assertNotEqual(key, other.key("# Title\n"))
+        self.assertNotEqual(
+            key, FragmentCache(self.dir, ["toc", "tables"]).key("# Title\n")
+        )
+        return
+
+    ##==================================================================================================================
+    #
+    def test_put_get(self):
+        key = self.cache.key("# Title\n")
+        self.assertIsNone(self.cache.get(key))
+
+        self.cache.put(key, "<h1>Title é</h1>")
+        self.assertEqual(self.cache.get(key), "<h1>Title é</h1>")
+        self.assertTrue((self.dir / key[:2] / f"{key}.html").is_file())
+
+        self.cache.delete(key)
+        self.assertIsNone(self.cache.get(key))
+        self.cache.delete(key)
+        return
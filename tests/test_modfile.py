@@ -0,0 +1,167 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from pymind.utility.modfile import (
+    EditSession,
+    appendFile,
+    multipleStrReplace,
+    writeChanged,
+    writeFile,
+    writeTemporary,
+)
+
+########################################################################################################################
+
+
+class TestModFile(unittest.TestCase):
+    ##==================================================================================================================
+    #
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.a = Path(self.tmp.name) / "a.md"
+        self.b = Path(self.tmp.name) / "b.md"
+        self.a.write_text("title\n<!-- remove -->\n{{x}} and {{y}}\n")
+        self.b.write_text("b\n")
+        return
+
+    ##==================================================================================================================
+    #
+    def tearDown(self):
+        self.tmp.cleanup()
+        return
+
+    ##==================================================================================================================
+    #
+    def test_multiple_replace(self):
+        # The longest sub-string matching at a position is replaced
+        replacements = {"a": "1", "abc": "3", "ab": "2"}
+        self.assertEqual(multipleStrReplace("a ab abc abcd", replacements), "1 2 3 3d")
+
+        # The new sub-strings are not replaced again
+        self.assertEqual(multipleStrReplace("ab", {"a": "b", "b": "c"}), "bc")
+
+        # Special characters are matched literally
+        self.assertEqual(multipleStrReplace("[a](b) a.b", {"[a](b)": "x"}), "x a.b")
+        self.assertEqual(multipleStrReplace("text", {}), "text")
+        self.assertEqual(multipleStrReplace("text", {"": "x"}), "text")
+        return
+
+    ##==================================================================================================================
+    #
+    def checkSession(self, streaming: bool):
+        with EditSession(streaming=streaming) as session:
+            session.replaceAll(self.a, {"{{x}}": "1", "{{y}}": "2"})
+            session.removeLines(self.a, "remove")
+            session.prepend(self.a, "<!-- :tag: -->\n")
+            session.append(self.a, "end {{x}}\n")
+            session.replace(self.a, "{{x}}", "3")
+            session.append(self.b, "c\n")
+
+            # Nothing is written before the session is committed
+            self.assertEqual(self.b.read_text(), "b\n")
+
+        # The edits are applied in order
+        self.assertEqual(self.a.read_text(), "<!-- :tag: -->\ntitle\n1 and 2\nend 3\n")
+        self.assertEqual(self.b.read_text(), "b\nc\n")
+        self.assertEqual(sorted(Path(self.tmp.name).iterdir()), [self.a, self.b])
+        return
+
+    ##==================================================================================================================
+    #
+    def test_session(self):
+        self.checkSession(streaming=False)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_streaming_session(self):
+        self.checkSession(streaming=True)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_session_failure(self):
+        # A file that cannot be read leaves every file untouched
+        with self.assertRaises(FileNotFoundError):
+            with EditSession() as session:
+                session.append(self.b, "c\n")
+                session.append(Path(self.tmp.name) / "missing.md", "text")
+
+        self.assertEqual(self.b.read_text(), "b\n")
+        self.assertEqual(len(list(Path(self.tmp.name).iterdir())), 2)
+
+        # Edits of a discarded session are never applied
+        with self.assertRaises(RuntimeError):
+            with EditSession() as session:
+                session.append(self.b, "c\n")
+                raise RuntimeError()
+
+        self.assertEqual(self.b.read_text(), "b\n")
+        return
+
+    ##==================================================================================================================
+    #
+    def test_write_changed(self):
+        mtime = self.b.stat().st_mtime_ns
+
+        # Identical content is not written
+        self.assertFalse(writeChanged(self.b, "b\n"))
+        with EditSession() as session:
+            session.replace(self.b, "x", "y")
+        self.assertEqual(self.b.stat().st_mtime_ns, mtime)
+
+        # New content is written
+        self.assertTrue(writeChanged(self.b, "c\n"))
+        self.assertTrue(writeChanged(Path(self.tmp.name) / "c.md", "c\n"))
+        self.assertEqual(self.b.read_text(), "c\n")
+
+        # The text is written as UTF-8 without translating the newlines
+        self.assertTrue(writeChanged(self.b, "é\n"))
+        self.assertEqual(self.b.read_bytes(), "é\n".encode())
+        self.assertFalse(writeChanged(self.b, "é\n"))
+        return
+
+    ##==================================================================================================================
+    #
+    def test_append(self):
+        link = Path(self.tmp.name) / "link.md"
+        link.hardlink_to(self.b)
+        self.b.chmod(0o640)
+
+        # The file is replaced, leaving the files hard linked to it untouched
+        appendFile(self.b, "c\n")
+        self.assertEqual(self.b.read_text(), "b\nc\n")
+        self.assertEqual(link.read_text(), "b\n")
+        self.assertEqual(self.b.stat().st_mode & 0o777, 0o640)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_permissions(self):
+        # The permissions of a replaced file are kept
+        self.b.chmod(0o640)
+        writeFile(self.b, "c\n")
+        self.assertEqual(self.b.stat().st_mode & 0o777, 0o640)
+        with EditSession(streaming=True) as session:
+            session.append(self.b, "d\n")
+        self.assertEqual(self.b.stat().st_mode & 0o777, 0o640)
+
+        # A new file gets the permissions of the umask
+        c = Path(self.tmp.name) / "c.md"
+        writeFile(c, "c\n")
+        d = Path(self.tmp.name) / "d.md"
+        d.touch()
+        self.assertEqual(c.stat().st_mode & 0o777, d.stat().st_mode & 0o777)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_temporary(self):
+        # Each temporary file has a unique name
+        first = writeTemporary(self.b, ["first"])
+        second = writeTemporary(self.b, ["second"])
+        self.assertNotEqual(first, second)
+        self.assertEqual(first.read_text(), "first")
+        self.assertEqual(second.read_text(), "second")
+        return
@@ -75,3 +75,17 @@ class TestLandingPage(unittest.TestCase):
                 self.assertNotEqual(match, None)
 
         return
+
+    ##==================================================================================================================
+    #
+    def test_nav_bar_active_item(self):
+        pm = self.getPM(force=True)
+        pm.run()
+
+        # The current page should be highlighted in the navigation bar
+        with open(Path(pm.output) / "index.html", "r") as f:
+            t = f.read()
+            self.assertTrue(t.find('<a class="active" href="index.html">') > 0)
+            self.assertEqual(t.find("%nav:"), -1)
+
+        return
@@ -0,0 +1,84 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from pymind.utility.overlay import Overlay
+
+########################################################################################################################
+
+
+class TestOverlay(unittest.TestCase):
+    ##==================================================================================================================
+    #
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.lower = Path(self.tmp.name) / "lower"
+        self.upper = Path(self.tmp.name) / "upper"
+
+        (self.lower / "sub").mkdir(parents=True)
+        (self.lower / "a.md").write_text("a")
+        (self.lower / "sub" / "b.md").write_text("b")
+
+        self.overlay = Overlay(self.lower, self.upper)
+        self.overlay.clear()
+        return
+
+    ##==================================================================================================================
+    #
+    def tearDown(self):
+        self.tmp.cleanup()
+        return
+
+    ##==================================================================================================================
+    #
+    def test_read_falls_through(self):
+        self.assertEqual(self.overlay.read("a.md"), "a")
+        self.assertEqual(self.overlay.read(self.upper / "sub" / "b.md"), "b")
+        self.assertEqual(self.overlay.path("a.md"), self.lower / "a.md")
+        self.assertEqual(list(self.upper.iterdir()), [])
+        return
+
+    ##==================================================================================================================
+    #
+    def test_write_copy_on_write(self):
+        self.overlay.append(self.lower / "sub" / "b.md", " appended")
+
+        # The modified copy is read back while the original is untouched
+        self.assertEqual(self.overlay.read("sub/b.md"), "b appended")
+        self.assertEqual(self.overlay.path("sub/b.md"), self.upper / "sub" / "b.md")
+        self.assertEqual((self.lower / "sub" / "b.md").read_text(), "b")
+
+        # Listing the overlay merges both directories
+        self.overlay.write("new.md", "new")
+        self.assertEqual(
+            self.overlay.rglob("*.md"),
+            [self.upper / "a.md", self.upper / "new.md", self.upper / "sub" / "b.md"],
+        )
+
+        # Clearing the overlay discards the modifications
+        self.overlay.clear()
+        self.assertEqual(self.overlay.read("sub/b.md"), "b")
+        self.assertFalse(self.overlay.exists("new.md"))
+        return
+
+    ##==================================================================================================================
+    #
+    def test_rglob_exclude(self):
+        for f in [".git/c.md", "node_modules/d.md", "drafts/e.md", "skip.md"]:
+            (self.lower / f).parent.mkdir(parents=True, exist_ok=True)
+            (self.lower / f).write_text(f)
+        (self.lower / ".pymindignore").write_text("skip.md\n")
+
+        # The excluded files and directories are not listed
+        overlay = Overlay(self.lower, self.upper, exclude=["drafts/"])
+        self.assertEqual(
+            overlay.rglob("*"),
+            [
+                self.upper / ".pymindignore",
+                self.upper / "a.md",
+                self.upper / "sub",
+                self.upper / "sub" / "b.md",
+            ],
+        )
+        self.assertEqual(overlay.rglob("sub/*.md"), [self.upper / "sub" / "b.md"])
+        return
@@ -3,6 +3,9 @@ import pymind
 from pathlib import Path
 import os, glob
 import platform
+from unittest.mock import patch
+
+from pymind.utility.convert import convertFiles
 
 ########################################################################################################################
 
@@ -77,6 +80,16 @@ class TestPyMindCore(unittest.TestCase):
 
         return
 
+    ##==================================================================================================================
+    #
+    def modify(self, file: str):
+        # Append to the file and restore its content once the test is done
+        p = Path(file)
+        content = p.read_text()
+        self.addCleanup(p.write_text, content)
+        p.write_text(content + "\n")
+        return
+
     ##==================================================================================================================
     #
     def test_cache_directory_creation(self):
@@ -85,7 +98,7 @@ class TestPyMindCore(unittest.TestCase):
 
         cache_d = self.createCachePaths()
 
-        path = cache_d / Path("example_cache.json")
+        path = cache_d / Path("example.db")
 
         self.assertIsFile(path)
 
@@ -129,9 +142,14 @@ class TestPyMindCore(unittest.TestCase):
         # Unmodified project
         self.assertEqual(len(pm.build_files), 1)
 
-        # Modify a file
+        # Touch a file without modifying its content
         Path("./tests/example/file1.md").touch()
         pm.run()
+        self.assertEqual(len(pm.build_files), 1)
+
+        # Modify a file
+        self.modify("./tests/example/file1.md")
+        pm.run()
         self.assertEqual(len(pm.build_files), 2)
         self.assertEqual(pm.build_files[0].name, "file1.md")
 
@@ -160,7 +178,7 @@ class TestPyMindCore(unittest.TestCase):
 
         # Run PyMind with `force = false` to generate all the files
         pm = self.getPM()
-        Path("./tests/example/file2.md").touch()
+        self.modify("./tests/example/file2.md")
         pm.run()
 
         # Count the number of files output
@@ -190,6 +208,24 @@ class TestPyMindCore(unittest.TestCase):
 
         return
 
+    ##==================================================================================================================
+    #
+    def test_fragment_cache(self):
+        self.recursive_delete(Path(TestPyMindCore.OUTPUT))
+        self.getPM(force=True).run()
+        pages = {
+            f: Path(f).read_text() for f in glob.glob(f"{TestPyMindCore.OUTPUT}/*.html")
+        }
+
+        # A forced rebuild reuses the converted HTML and writes the same pages
+        with patch("pymind.core.convertFiles", wraps=convertFiles) as convert:
+            self.getPM(force=True).run()
+        self.assertEqual(convert.call_args.args[0], [])
+        for f, content in pages.items():
+            self.assertEqual(Path(f).read_text(), content)
+
+        return
+
     ##==================================================================================================================
     #
     def test_tag_search(self):
@@ -306,3 +342,68 @@ class TestPyMindCore(unittest.TestCase):
         self.assertTrue(len(pm.refs["file2"]), 1)
         self.assertTrue(len(pm.refs["file3"]), 1)
         return
+
+    ##==================================================================================================================
+    #
+    def test_isolated_engine(self):
+        # Run the engine plugins in-process
+        pm = pymind.PyMind(
+            **{
+                "input": TestPyMindCore.INPUT,
+                "output": TestPyMindCore.OUTPUT,
+                "force": True,
+            }
+        )
+        pm.run()
+        in_process = {
+            f.name: f.read_text() for f in Path(TestPyMindCore.OUTPUT).glob("*.html")
+        }
+
+        # Run the engine plugins in isolated subprocesses
+        pm = pymind.PyMind(
+            **{
+                "input": TestPyMindCore.INPUT,
+                "output": TestPyMindCore.OUTPUT,
+                "force": True,
+                "isolate": True,
+            }
+        )
+        pm.run()
+        isolated = {
+            f.name: f.read_text() for f in Path(TestPyMindCore.OUTPUT).glob("*.html")
+        }
+
+        # Both modes should generate the same website
+        self.assertEqual(in_process, isolated)
+        self.assertEqual(len(pm.refs["file2"]), 1)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_unmodified_pages_untouched(self):
+        pm = self.getPM(force=True, engine=True)
+        pm.run()
+
+        # Record the modification time of a page that will not be rebuilt
+        page = Path(TestPyMindCore.OUTPUT) / Path("file3.html")
+        mtime = page.stat().st_mtime_ns
+
+        # Rebuild after modifying a different file
+        self.modify("./tests/example/file2.md")
+        pm = self.getPM(engine=True)
+        pm.run()
+
+        self.assertEqual(page.stat().st_mtime_ns, mtime)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_unknown_command(self):
+        from pymind.__main__ import parse_options
+
+        # A mistyped command is rejected instead of building the project
+        with self.assertRaises(SystemExit) as e:
+            parse_options(["-i", TestPyMindCore.INPUT, "statu"])
+        self.assertEqual(e.exception.code, 2)
+        self.assertEqual(parse_options(["status"])[0]["command"], "status")
+        return
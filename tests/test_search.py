@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from pymind.utility.search import findFiles, indexFiles, lookupFile
+
+########################################################################################################################
+
+
+class TestSearch(unittest.TestCase):
+    ####################################################################################################################
+    # CONSTANTS
+    ####################################################################################################################
+    INPUT = Path("./tests/example").resolve()
+
+    ##==================================================================================================================
+    #
+    def test_lookup(self):
+        index = indexFiles(findFiles(TestSearch.INPUT), TestSearch.INPUT)
+
+        self.assertEqual(lookupFile(index, "file2"), Path("file2.md"))
+        self.assertEqual(lookupFile(index, "file4.md"), Path("subdir/file4.md"))
+        self.assertEqual(lookupFile(index, "subwiki/s1"), Path("subwiki/s1.md"))
+        self.assertIsNone(lookupFile(index, "missing"))
+        return
+
+    ##==================================================================================================================
+    #
+    def test_ambiguous(self):
+        index = {"a": [Path("a.md"), Path("x/a.md"), Path("y/a.md")]}
+
+        # The directories of the name select the file
+        self.assertEqual(lookupFile(index, "y/a"), Path("y/a.md"))
+
+        # Otherwise the ambiguity is reported
+        with self.assertLogs("PYMIND", level="WARNING") as logs:
+            self.assertEqual(lookupFile(index, "a"), Path("a.md"))
+        self.assertIn("ambiguous", logs.output[0])
+        return
+
+    ##==================================================================================================================
+    #
+    def test_exclude(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        dir = Path(tmp.name).resolve()
+
+        for f in [
+            "a.md",
+            "b.txt",
+            ".git/c.md",
+            "node_modules/d.md",
+            "attachments/e.md",
+            "drafts/f.md",
+            "drafts/keep/g.md",
+        ]:
+            (dir / f).parent.mkdir(parents=True, exist_ok=True)
+            (dir / f).write_text(f)
+        (dir / ".pymindignore").write_text("# Comment\n\nattachments/\n")
+
+        # The ignored directories are skipped
+        files = findFiles(dir, exclude=["drafts/*.md"])
+        self.assertEqual(
+            list(files), [str(dir / "a.md"), str(dir / "drafts/keep/g.md")]
+        )
+        self.assertEqual(files[str(dir / "a.md")]["size"], 4)
+
+        # The stat data is the same when retrieved by a thread pool
+        self.assertEqual(findFiles(dir, exclude=["drafts/*.md"], threads=2), files)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_symlink(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        dir = Path(tmp.name).resolve()
+
+        target = dir / "target.txt"
+        target.write_text("a")
+        (dir / "link.md").symlink_to(target)
+        (dir / "broken.md").symlink_to(dir / "missing.txt")
+
+        # The stat data is the data of the target
+        files = findFiles(dir)
+        self.assertEqual(list(files), [str(dir / "link.md")])
+        self.assertEqual(files[str(dir / "link.md")]["size"], 1)
+
+        # Editing the target changes the stat data of the link
+        os.utime(target, ns=(0, 0))
+        mtime = findFiles(dir)[str(dir / "link.md")]["mtime"]
+        target.write_text("ab")
+        for threads in (0, 2):
+            data = findFiles(dir, threads=threads)[str(dir / "link.md")]
+            self.assertEqual(data["size"], 2)
+            self.assertNotEqual(data["mtime"], mtime)
+        return
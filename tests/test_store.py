@@ -0,0 +1,82 @@
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from pymind.utility.dependency import DependencyGraph
+from pymind.utility.store import BuildStore
+
+########################################################################################################################
+
+
+class TestStore(unittest.TestCase):
+    ##==================================================================================================================
+    #
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = BuildStore(Path(self.tmp.name) / "project.db")
+        return
+
+    ##==================================================================================================================
+    #
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+        return
+
+    ##==================================================================================================================
+    #
+    def test_commit_and_rollback(self):
+        self.store.put("files", "a.md", {"mtime": 1, "size": 2})
+        self.store.put("files", "b.md", {"mtime": 3, "size": 4})
+
+        # Pending writes are visible before they are committed
+        self.assertEqual(self.store.get("files", "a.md"), {"mtime": 1, "size": 2})
+        self.store.commit()
+
+        # A fresh connection reads the committed entries
+        store = BuildStore(self.store.path)
+        self.addCleanup(store.close)
+        self.assertEqual(set(store.items("files")), {"a.md", "b.md"})
+
+        # Discarded changes never reach the database
+        self.store.delete("files", "a.md")
+        self.store.put("files", "c.md", {})
+        self.assertEqual(set(self.store.items("files")), {"b.md", "c.md"})
+        self.store.rollback()
+        self.assertEqual(set(self.store.items("files")), {"a.md", "b.md"})
+        self.assertIsNone(self.store.get("files", "c.md"))
+        return
+
+    ##==================================================================================================================
+    #
+    def test_pickle(self):
+        self.store.put("plugin", "key", [1, 2])
+        self.store.commit()
+        self.store.delete("plugin", "key")
+        self.store.put("plugin", "other", "value")
+
+        # The pending changes are handed over with the store
+        store = pickle.loads(pickle.dumps(self.store))
+        self.addCleanup(store.close)
+        self.assertEqual(store.items("plugin"), {"other": "value"})
+        self.assertEqual(store.get("plugin", "key", "deleted"), "deleted")
+        return
+
+    ##==================================================================================================================
+    #
+    def test_graph(self):
+        graph = DependencyGraph.load(self.store)
+        graph.depend("a", "a.md", "tags")
+        graph.links = {"a.md": ["b.md"]}
+        graph.save(self.store)
+        self.store.commit()
+
+        # Only the entries that changed are written
+        graph = DependencyGraph.load(self.store)
+        self.assertEqual(graph.deps, {"a": ["a.md", "tags"]})
+        graph.links = {}
+        graph.save(self.store)
+        self.assertEqual(self.store.pending, {})
+        self.assertEqual(self.store.deleted, {("links", "a.md")})
+        return
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from pymind.utility.modfile import writeFile
+from pymind.utility.sync import syncTree
+
+########################################################################################################################
+
+
+class TestSync(unittest.TestCase):
+    ##==================================================================================================================
+    #
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.src = Path(self.tmp.name) / "src"
+        self.dst = Path(self.tmp.name) / "dst"
+
+        (self.src / "sub").mkdir(parents=True)
+        (self.src / "a.md").write_text("a")
+        (self.src / "sub" / "b.md").write_text("b")
+        (self.src / "sub" / "image.png").write_bytes(b"png")
+        return
+
+    ##==================================================================================================================
+    #
+    def tearDown(self):
+        self.tmp.cleanup()
+        return
+
+    ##==================================================================================================================
+    #
+    def test_incremental_sync(self):
+        # The first synchronization copies every file
+        self.assertEqual(syncTree(self.src, self.dst), (3, 0))
+        self.assertEqual((self.dst / "sub" / "image.png").read_bytes(), b"png")
+
+        # Nothing changed
+        self.assertEqual(syncTree(self.src, self.dst), (0, 0))
+
+        # Update one file and delete another
+        (self.src / "a.md").write_text("updated")
+        (self.src / "sub" / "b.md").unlink()
+        self.assertEqual(syncTree(self.src, self.dst), (1, 1))
+        self.assertEqual((self.dst / "a.md").read_text(), "updated")
+        self.assertFalse((self.dst / "sub" / "b.md").exists())
+
+        # Files modified in the working directory are restored
+        (self.dst / "a.md").write_text("modified in the working directory")
+        self.assertEqual(syncTree(self.src, self.dst), (1, 0))
+        self.assertEqual((self.dst / "a.md").read_text(), "updated")
+        return
+
+    ##==================================================================================================================
+    #
+    def test_hardlink_sync(self):
+        syncTree(self.src, self.dst, mode="hardlink")
+        self.assertTrue(os.path.samefile(self.src / "a.md", self.dst / "a.md"))
+
+        # Writing to the working directory must not modify the source file
+        writeFile(self.dst / "a.md", "modified in the working directory")
+        self.assertEqual((self.src / "a.md").read_text(), "a")
+
+        # The working directory file is linked again
+        self.assertEqual(syncTree(self.src, self.dst, mode="hardlink"), (1, 0))
+        self.assertTrue(os.path.samefile(self.src / "a.md", self.dst / "a.md"))
+        return
+
+    ##==================================================================================================================
+    #
+    def test_exclude_sync(self):
+        for f in [".git/c.md", "node_modules/d.md", "drafts/e.md", "skip.md"]:
+            (self.src / f).parent.mkdir(parents=True, exist_ok=True)
+            (self.src / f).write_text(f)
+        (self.src / ".pymindignore").write_text("skip.md\n")
+
+        # Links to directories, even forming a loop, are not followed
+        (self.src / "sub" / "loop").symlink_to(self.src, target_is_directory=True)
+
+        # The excluded files and directories are not copied
+        self.assertEqual(syncTree(self.src, self.dst, exclude=["drafts/"]), (4, 0))
+        self.assertEqual(
+            sorted(p.relative_to(self.dst).as_posix() for p in self.dst.rglob("*")),
+            [".pymindignore", "a.md", "sub", "sub/b.md", "sub/image.png"],
+        )
+
+        # Files that become excluded are removed
+        self.assertEqual(
+            syncTree(self.src, self.dst, exclude=["drafts/", "sub/"]), (0, 2)
+        )
+        self.assertFalse((self.dst / "sub").exists())
+        return
@@ -0,0 +1,42 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from pymind.utility.tags import collectTags, getFileTags
+
+########################################################################################################################
+
+
+class TestTags(unittest.TestCase):
+    ##==================================================================================================================
+    #
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+        self.a = str(self.dir / "a.md")
+        self.b = str(self.dir / "b.md")
+        Path(self.a).write_text("<!-- :nav:x: -->\n\n# A\n<!-- :body: -->\n")
+        Path(self.b).write_text("# B\n")
+        return
+
+    ##==================================================================================================================
+    #
+    def tearDown(self):
+        self.tmp.cleanup()
+        return
+
+    ##==================================================================================================================
+    #
+    def test_file_tags(self):
+        self.assertEqual(getFileTags(self.a), ["nav", "x", "body"])
+        self.assertEqual(getFileTags(self.a, header_only=True), ["nav", "x"])
+        self.assertEqual(getFileTags(self.b), [])
+        return
+
+    ##==================================================================================================================
+    #
+    def test_collect_tags(self):
+        records = {self.a: {"tags": ["nav", "x"]}, self.b: {"tags": ["nav"]}}
+        self.assertEqual(collectTags(records), {"nav": [self.a, self.b], "x": [self.a]})
+        return
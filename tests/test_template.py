@@ -0,0 +1,38 @@
+import unittest
+
+from pymind.utility.template import Template
+
+########################################################################################################################
+
+
+class TestTemplate(unittest.TestCase):
+    ####################################################################################################################
+    # CONSTANTS
+    ####################################################################################################################
+    TEMPLATE = (
+        "<title>%title%</title>%nav%<div>%content%</div>{{footer}} 100%; %unknown%"
+    )
+
+    ##==================================================================================================================
+    #
+    def test_template_slots(self):
+        t = Template(TestTemplate.TEMPLATE)
+
+        # Only the known placeholders should become slots
+        self.assertEqual(t.slots(), {"title", "nav", "content", "footer"})
+        return
+
+    ##==================================================================================================================
+    #
+    def test_template_render(self):
+        t = Template(TestTemplate.TEMPLATE)
+        html = t.render(
+            {"title": "t", "nav": "%content%", "content": "c", "footer": "f"}
+        )
+
+        # Slot values are not searched for placeholders
+        self.assertEqual(html, "<title>t</title>%content%<div>c</div>f 100%; %unknown%")
+
+        # Slots without a value keep their placeholder
+        self.assertEqual(t.render({}), TestTemplate.TEMPLATE)
+        return
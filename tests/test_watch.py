@@ -0,0 +1,152 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pymind
+from pymind.utility.watch import Watcher
+
+########################################################################################################################
+
+
+class TestWatch(unittest.TestCase):
+    ####################################################################################################################
+    # CONSTANTS
+    ####################################################################################################################
+    INPUT = "./tests/example"
+    OUTPUT = "./tests/example-output"
+
+    ##==================================================================================================================
+    #
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        (self.dir / "sub").mkdir()
+        (self.dir / "a.md").write_text("a")
+        return
+
+    ##==================================================================================================================
+    #
+    def tearDown(self):
+        self.tmp.cleanup()
+        return
+
+    ##==================================================================================================================
+    #
+    def checkWatcher(self, watcher: Watcher):
+        # Nothing changed
+        self.assertEqual(watcher.wait(timeout=0.2), set())
+
+        # A burst of changes is reported at once
+        (self.dir / "a.md").write_text("updated")
+        (self.dir / "sub" / "b.md").write_text("b")
+        (self.dir / "image.png").write_bytes(b"png")
+        changes = watcher.wait(timeout=5)
+        self.assertIn(self.dir / "a.md", changes)
+        self.assertIn(self.dir / "sub" / "b.md", changes)
+        self.assertNotIn(self.dir / "image.png", changes)
+
+        # Deleting a file
+        (self.dir / "a.md").unlink()
+        self.assertIn(self.dir / "a.md", watcher.wait(timeout=5))
+        return
+
+    ##==================================================================================================================
+    #
+    def test_watcher(self):
+        watcher = Watcher(self.dir)
+        self.addCleanup(watcher.close)
+        self.checkWatcher(watcher)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_polling_watcher(self):
+        watcher = Watcher(self.dir, interval=0.05, polling=True)
+        self.addCleanup(watcher.close)
+        self.assertTrue(watcher.polling)
+        self.checkWatcher(watcher)
+        return
+
+    ##==================================================================================================================
+    #
+    def checkExcluded(self, watcher: Watcher):
+        # Changes to excluded files and directories are not reported
+        (self.dir / "node_modules" / "pkg.md").write_text("pkg")
+        (self.dir / "drafts" / "d.md").write_text("draft")
+        (self.dir / "skip.md").write_text("skip")
+        (self.dir / "sub" / "b.md").write_text("b")
+        changes = watcher.wait(timeout=5)
+        self.assertEqual(changes, {self.dir / "sub" / "b.md"})
+        return
+
+    ##==================================================================================================================
+    #
+    def test_excluded(self):
+        (self.dir / "node_modules").mkdir()
+        (self.dir / "drafts").mkdir()
+        (self.dir / ".pymindignore").write_text("skip.md\n")
+        for polling in (False, True):
+            with self.subTest(polling=polling):
+                watcher = Watcher(
+                    self.dir, interval=0.05, polling=polling, exclude=["drafts/"]
+                )
+                self.addCleanup(watcher.close)
+                self.checkExcluded(watcher)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_no_inotify(self):
+        # Without the C library (e.g. on Windows), the watcher falls back to polling
+        with mock.patch("ctypes.util.find_library", return_value=None):
+            watcher = Watcher(self.dir, interval=0.05)
+        self.addCleanup(watcher.close)
+        self.assertTrue(watcher.polling)
+
+        with mock.patch("sys.platform", "win32"):
+            watcher = Watcher(self.dir, interval=0.05)
+        self.addCleanup(watcher.close)
+        self.assertTrue(watcher.polling)
+        self.checkWatcher(watcher)
+        return
+
+    ##==================================================================================================================
+    #
+    def test_watch_rebuild(self):
+        pm = pymind.PyMind(
+            **{
+                "input": TestWatch.INPUT,
+                "output": TestWatch.OUTPUT,
+                "force": True,
+            }
+        )
+        # Signal the end of each build
+        built = threading.Event()
+        run = pm.run
+
+        def runAndSignal():
+            run()
+            built.set()
+
+        pm.run = runAndSignal
+
+        thread = threading.Thread(target=pm.watch, kwargs={"count": 1})
+        thread.start()
+
+        # Wait for the first build to complete
+        self.assertTrue(built.wait(timeout=10))
+
+        # Modify a file and restore its content once the test is done
+        p = Path(TestWatch.INPUT) / "file3.md"
+        content = p.read_text()
+        self.addCleanup(p.write_text, content)
+        p.write_text(content + "\nWatched\n")
+
+        thread.join(timeout=10)
+        self.assertFalse(thread.is_alive())
+        self.assertIn("file3", [f.stem for f in pm.build_files])
+        self.assertFalse(pm.force_build)
+        self.assertIn("Watched", (Path(TestWatch.OUTPUT) / "file3.html").read_text())
+        return